@@ -0,0 +1,96 @@
+"""Comparison of render queue ordering strategies on a scene.
+
+Renders the queue of the rig once per strategy into a temporary directory and reports the render time,
+next to the camera travel and frame changes between consecutive jobs:
+    blender -b scene.blend -P benchmarks/queue_order_benchmark.py -- --frames 1-10 --frame-by-frame
+With --dry-run only the queues are built and measured, nothing is rendered.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bpy  # noqa: E402
+
+from multicam_render import cli, ordering  # noqa: E402
+
+
+def camera_positions(scene, addon):
+    # world space camera position by queue item camera name
+    base_camera = scene.camera
+    if base_camera.virtual_rig:
+        rig = addon.VirtualRig.table(base_camera)[1]
+        matrix = np.array(base_camera.matrix_world)
+        locations = rig.locations @ matrix[:3, :3].T + matrix[:3, 3]
+        return dict(zip(addon.VirtualRig.view_names(base_camera), locations))
+    return {obj.name: np.array(obj.matrix_world.translation) for obj in base_camera.children}
+
+
+def queue_metrics(renderQueue, positions):
+    travel = 0.0
+    frame_changes = 0
+    for previous, queueItem in zip(renderQueue, renderQueue[1:]):
+        if previous['camera'] in positions and queueItem['camera'] in positions:
+            travel += float(np.linalg.norm(positions[queueItem['camera']] - positions[previous['camera']]))
+        if (previous['frameStart'], previous['frameEnd']) != (queueItem['frameStart'], queueItem['frameEnd']):
+            frame_changes += 1
+    return {'jobs': len(renderQueue), 'camera_travel': travel, 'frame_changes': frame_changes}
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Compare render queue ordering strategies on a scene.")
+    parser.add_argument("--strategies", nargs="+", choices=ordering.STRATEGIES, default=list(ordering.STRATEGIES))
+    parser.add_argument("--frame-blocks", nargs="+", type=int, default=[0],
+                        help="frame block sizes to compare, used without frame by frame rendering")
+    parser.add_argument("--frames", type=cli.parse_frames, help="frame range, defaults to the scene range")
+    parser.add_argument("--frame-by-frame", dest="frame_by_frame", action="store_true", default=None)
+    parser.add_argument("--camera-by-camera", dest="frame_by_frame", action="store_false")
+    parser.add_argument("--rig", help="base camera of the rig, defaults to the scene camera")
+    parser.add_argument("--dry-run", action="store_true", help="only compare the queues, do not render")
+    parser.add_argument("--output", help="write the report as json to this file")
+    args = parser.parse_args(argv)
+
+    addon = cli.ensure_registered()
+    scene = cli.configure_scene(cli.build_parser().parse_args(
+        (["--rig", args.rig] if args.rig else [])
+        + (["--frames", "%d-%d" % args.frames] if args.frames else [])
+        + (["--frame-by-frame" if args.frame_by_frame else "--camera-by-camera"]
+           if args.frame_by_frame is not None else [])))
+    scene.telemetryFormat = 'NONE'
+    scene.resumeRender = False
+    positions = camera_positions(scene, addon)
+    output_dir = tempfile.mkdtemp(prefix="multicam_order_")
+
+    results = []
+    for strategy in args.strategies:
+        for frame_block in ([0] if scene.frameByFrame else args.frame_blocks):
+            scene.queueOrder = strategy
+            scene.queueFrameBlock = frame_block
+            renderQueue = addon.OutputOTRenderMultiCameras.build_queue(scene)
+            result = dict(queue_metrics(renderQueue, positions), strategy=strategy, frame_block=frame_block)
+
+            if not args.dry_run:
+                scene.render.filepath = os.path.join(output_dir, strategy + "_" + str(frame_block), "")
+                started = time.perf_counter()
+                status = cli.render_queue(scene, renderQueue)
+                result['seconds'] = time.perf_counter() - started
+                result['failed'] = status != cli.EXIT_OK
+            results.append(result)
+            print("%-10s block %-5d %s" % (strategy, frame_block, json.dumps(
+                {key: value for key, value in result.items() if key not in ('strategy', 'frame_block')})))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({'blender': bpy.app.version_string, 'scene': scene.name, 'results': results}, file, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
@@ -0,0 +1,231 @@
+"""Benchmark of rig generation and render queue handling at growing scale.
+
+Runs headless, either with the bpy module or inside Blender:
+    python benchmarks/rig_benchmark.py --output report.json
+    blender -b -P benchmarks/rig_benchmark.py -- --output report.json --baseline previous.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bpy  # noqa: E402
+
+from multicam_render import addon, cli, layout, pool  # noqa: E402
+
+CAMERA_COUNTS = (2, 16, 100, 225, 1000, 4096)
+VIRTUAL_CAMERA_COUNTS = CAMERA_COUNTS + (16384, 65536)
+FRAME_COUNTS = (1, 10, 100, 1000)
+
+
+def current_memory():
+    # resident memory in bytes where /proc is available, peak memory otherwise
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return pool.peak_memory()
+
+
+def datablocks():
+    return len(bpy.data.objects) + len(bpy.data.cameras) + len(bpy.data.collections)
+
+
+def setup_scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    cli.ensure_registered()
+    scene = bpy.context.scene
+
+    base_camera = bpy.data.objects.new("Base", bpy.data.cameras.new("Base"))
+    scene.collection.objects.link(base_camera)
+    target = bpy.data.objects.new("Target", bpy.data.meshes.new("Target"))
+    scene.collection.objects.link(target)
+    scene.camera = base_camera
+    bpy.context.view_layer.objects.active = base_camera
+    base_camera.target_object = target.name
+    return scene, base_camera
+
+
+def measure(name, run, repeats, **params):
+    # median time of repeated runs, datablock and memory growth over all of them
+    blocks_before = datablocks()
+    memory_before = current_memory()
+    times = []
+    error = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        try:
+            run()
+        except RuntimeError as exc:
+            error = str(exc).strip().splitlines()[-1]
+            break
+        times.append(time.perf_counter() - started)
+    result = dict(params, name=name, repeats=len(times),
+                  seconds=statistics.median(times) if times else None,
+                  datablock_growth=datablocks() - blocks_before,
+                  memory_growth=current_memory() - memory_before)
+    if error:
+        result['error'] = error
+    print("%-28s %s %s" % (name, json.dumps(params),
+                           "error: " + error if error else "%.4fs" % result['seconds']))
+    return result
+
+
+def rig_benchmarks(scene, base_camera, repeats):
+    context = bpy.context
+    results = []
+
+    def build(camera_type, **properties):
+        # properties are set upfront (their update callbacks build the rig once),
+        # each run times building the rig from scratch
+        for key, value in properties.items():
+            setattr(base_camera, key, value)
+        base_camera.camera_type = camera_type
+
+        def run():
+            addon.CameraUtils.reset_multicamera(context)
+            addon.OBJECT_PT_multicam_panel.update_camera_type(base_camera, context)
+        return run
+
+    results.append(measure("stereo", build('STEREO'), repeats, cameras=2))
+    for amount in (2, 4, 10, 15):
+        results.append(measure("matrix", build('MATRIX', matrix_horizontal_amount=amount,
+                                               matrix_vertical_amount=amount), repeats, cameras=amount * amount))
+    for amount in (2, 10, 50, 100):
+        results.append(measure("mesh_orbit", build('MESH', pattern_type='ORBIT', mesh_orbit_cameras_amount=amount),
+                               repeats, cameras=amount))
+        results.append(measure("mesh_sphere", build('MESH', pattern_type='SPHERE',
+                                                    mesh_sphere_cameras_amount=amount), repeats, cameras=amount))
+    results.append(measure("mesh_optimal", build('MESH', pattern_type='OPTIMAL'), repeats, cameras=6))
+
+    # evaluation of a sphere rig following its moving target, with a constraint per camera or baked rotations
+    target = bpy.data.objects[base_camera.target_object]
+    for baked in (False, True):
+        for amount in (100, 1000, 4096):
+            run = build('MESH', pattern_type='SPHERE', mesh_baked_orientation=baked)
+            # written past the update, which limits rigs of child cameras to 100 cameras
+            base_camera["mesh_sphere_cameras_amount"] = amount
+            run()
+
+            def follow_target():
+                target.location.x += 0.01
+                context.view_layer.update()
+
+            results.append(measure("follow_target_baked" if baked else "follow_target_track_to", follow_target,
+                                   repeats, cameras=amount))
+    target.location = (0.0, 0.0, 0.0)
+    base_camera.mesh_baked_orientation = False
+
+    # counts above the property limits go through the rig materializer directly
+    for count in CAMERA_COUNTS:
+        side = max(int(count ** 0.5), 1)
+        rig = layout.matrix(side, max(count // side, 1), 10, 10)
+
+        def materialize(rig=rig):
+            addon.CameraUtils.reset_multicamera(context)
+            addon.CameraUtils.apply_layout(context, rig)
+
+        def update(rig=rig):
+            addon.CameraUtils.apply_layout(context, rig._replace(locations=rig.locations * 1.01))
+
+        results.append(measure("materialize", materialize, repeats, cameras=len(rig)))
+        results.append(measure("update_in_place", update, repeats, cameras=len(rig)))
+        results.append(measure("reset_multicamera", lambda: addon.CameraUtils.reset_multicamera(context), 1,
+                               cameras=len(rig)))
+
+    # virtual rigs only store a table of views
+    base_camera.virtual_rig = True
+    for count in VIRTUAL_CAMERA_COUNTS:
+        side = max(int(count ** 0.5), 1)
+        rig = layout.matrix(side, max(count // side, 1), 10, 10)
+        results.append(measure("materialize_virtual", lambda rig=rig: addon.CameraUtils.apply_layout(context, rig),
+                               repeats, cameras=len(rig)))
+    base_camera.virtual_rig = False
+    addon.CameraUtils.reset_multicamera(context)
+    return results
+
+
+def queue_benchmarks(scene, base_camera, repeats):
+    context = bpy.context
+    results = []
+    scene.render.filepath = os.path.join(bpy.app.tempdir, "multicam_benchmark", "")
+    scene.telemetryFormat = 'NONE'
+    for count in (2, 100, 1000):
+        side = max(int(count ** 0.5), 1)
+        addon.CameraUtils.reset_multicamera(context)
+        addon.CameraUtils.apply_layout(context, layout.matrix(side, max(count // side, 1), 10, 10))
+        cameras = len(base_camera.children)
+
+        for frames in FRAME_COUNTS:
+            if cameras * frames > 200000:
+                continue
+            scene.frame_start, scene.frame_end = 1, frames
+            for frame_by_frame in (False, True):
+                scene.frameByFrame = frame_by_frame
+                params = dict(cameras=cameras, frames=frames, frame_by_frame=frame_by_frame)
+                results.append(measure("queue_build", lambda: addon.OutputOTRenderMultiCameras.build_queue(scene),
+                                       repeats, **params))
+
+                def drain():
+                    # job setup and clean up of every queue item, without the render itself
+                    renderQueue = addon.OutputOTRenderMultiCameras.build_queue(scene)
+                    addon.OutputOTRenderMultiCameras.setup_queue(scene, len(renderQueue))
+                    try:
+                        for queueItem in renderQueue:
+                            addon.OutputOTRenderMultiCameras.setup_job(scene, queueItem)
+                            addon.OutputOTRenderMultiCameras.finish_job(scene, queueItem)
+                    finally:
+                        addon.OutputOTRenderMultiCameras.restore_scene(scene)
+
+                if cameras * frames <= 20000:
+                    results.append(measure("queue_drain", drain, 1, **params))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    # results slower than the baseline by more than tolerance, matched by name and parameters
+    def key(result):
+        return json.dumps({k: v for k, v in result.items()
+                           if k not in ('seconds', 'repeats', 'datablock_growth', 'memory_growth', 'error')},
+                          sort_keys=True)
+
+    previous = {key(result): result for result in baseline['results']}
+    regressions = []
+    for result in results:
+        old = previous.get(key(result))
+        if old and old['seconds'] and result['seconds'] and result['seconds'] > old['seconds'] * (1 + tolerance):
+            regressions.append((result, old))
+            print("REGRESSION %s: %.4fs -> %.4fs" % (key(result), old['seconds'], result['seconds']))
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark multicam rig generation and render queue handling.")
+    parser.add_argument("--output", help="write the report as json to this file")
+    parser.add_argument("--baseline", help="report to compare against, exits with 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    scene, base_camera = setup_scene()
+    results = rig_benchmarks(scene, base_camera, args.repeats)
+    results += queue_benchmarks(scene, base_camera, args.repeats)
+    report = {'blender': bpy.app.version_string, 'python': sys.version.split()[0], 'results': results}
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=1)
+    if args.baseline:
+        with open(args.baseline) as file:
+            if compare(results, json.load(file), args.tolerance):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]))
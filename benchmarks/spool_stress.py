@@ -0,0 +1,80 @@
+"""Local stress test of the spooled render queue, without Blender.
+
+Starts several worker processes on one spool directory, rendering is simulated by sleeping.
+Some workers are killed while rendering, their jobs have to come back once the lease expires:
+    python benchmarks/spool_stress.py --jobs 200 --workers 8 --kill 2
+Reports throughput and checks that every job ended up done exactly once.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from multicam_render import spool  # noqa: E402
+
+
+def render(directory, duration, queueItem):
+    time.sleep(random.uniform(0.5, 1.5) * duration)
+    # every render of a job is logged, jobs of lost leases may render twice
+    with open(os.path.join(directory, "renders.log"), "a") as log:
+        log.write(json.dumps(queueItem) + "\n")
+    return True
+
+
+def work(directory, lease, duration):
+    work_spool = spool.Spool(directory, lease=lease)
+    spool.run_worker(work_spool, lambda queueItem: render(directory, duration, queueItem),
+                     poll_interval=lease / 4, log=lambda message: None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--kill", type=int, default=1, help="workers killed while rendering")
+    parser.add_argument("--duration", type=float, default=0.05, help="mean render time of a job in seconds")
+    parser.add_argument("--lease", type=float, default=1.0, help="lease time in seconds")
+    parser.add_argument("--directory", help="spool directory, defaults to a temporary one")
+    args = parser.parse_args()
+
+    directory = args.directory or tempfile.mkdtemp(prefix="multicam_spool_")
+    submitted = spool.Spool(directory, lease=args.lease).submit(
+        [{'camera': "Camera_" + str(i % 10), 'frameStart': i // 10 + 1, 'frameEnd': i // 10 + 1}
+         for i in range(args.jobs)])
+
+    started = time.perf_counter()
+    processes = [multiprocessing.Process(target=work, args=(directory, args.lease, args.duration))
+                 for _ in range(args.workers)]
+    for process in processes:
+        process.start()
+    time.sleep(args.duration * 3)
+    for process in processes[:args.kill]:
+        process.kill()
+    for process in processes:
+        process.join()
+    # killed workers leave claims behind when all others are done
+    if args.kill:
+        work(directory, args.lease, args.duration)
+    elapsed = time.perf_counter() - started
+
+    status = spool.Spool(directory, lease=args.lease).status()
+    with open(os.path.join(directory, "renders.log")) as log:
+        renders = len(log.readlines())
+    done = {name[:-len(".json")] for name in os.listdir(os.path.join(directory, spool.DONE))}
+    print("%d jobs, %d workers (%d killed): %.1f s, %.1f jobs/s, %d renders"
+          % (args.jobs, args.workers, args.kill, elapsed, args.jobs / elapsed, renders))
+    print("spool: " + json.dumps(status))
+    ok = done == set(submitted) and status[spool.PENDING] == status[spool.CLAIMED] == 0
+    print("OK" if ok else "FAILED: jobs missing from done")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
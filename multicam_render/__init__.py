@@ -0,0 +1,23 @@
+bl_info = {
+    "category": "Camera",
+    "name": "Multi camera Rendering Plugin",
+    "author": "TRAK",
+    "version": (0, 0, 1),
+    "blender": (3, 0, 0),
+    "location": "Camera > Properties Panel > Multi camera",
+    "description": "Utils for setting up multiple camera matrices.",
+}
+
+
+# bpy dependent code is imported on registration only,
+# so pure modules (e.g. layout) can be used and tested without Blender
+
+
+def register():
+    from . import addon
+    addon.register()
+
+
+def unregister():
+    from . import addon
+    addon.unregister()
@@ -0,0 +1,3396 @@
+import bpy
+import functools
+import itertools
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import deque
+from bpy.app.handlers import persistent
+import gpu
+import numpy as np
+from gpu_extras.batch import batch_for_shader
+from mathutils.bvhtree import BVHTree
+
+from . import budget
+from . import camera_export
+from . import contact_sheet
+from . import coverage
+from . import dedup
+from . import layout
+from . import manifest
+from . import ordering
+from . import pool
+from . import postprocess
+from . import spool
+from . import telemetry
+
+DEFAULT_CAMERA_NAME = "Camera"
+RIG_COLLECTION_SUFFIX = " rig"
+# tolerance below which a transform is considered unchanged during rig sync
+SYNC_EPSILON = 1e-6
+# camera data kept equal to the base camera, also the intrinsics of virtual rig views
+CAMERA_DATA_PROPERTIES = ("angle", "clip_start", "clip_end", "shift_x", "shift_y")
+
+
+class CameraUtils:
+    @staticmethod
+    def get_base_camera(context):
+        base_camera = context.scene.camera
+        if base_camera.multicam_child and base_camera.parent is not None and base_camera.parent.type == 'CAMERA':
+            base_camera = base_camera.parent
+            context.scene.camera = base_camera
+        return base_camera
+
+    @staticmethod
+    def reset_multicamera(context):
+        # reset multicamera by deleting all children
+        base_camera = CameraUtils.get_base_camera(context)
+
+        CameraUtils.remove_child_cameras(base_camera.children)
+        VirtualRig.clear(base_camera)
+
+        collection = base_camera.multicam_collection
+        if collection is not None and not collection.objects:
+            bpy.data.collections.remove(collection)
+
+        base_camera.constraints.clear()
+
+    @staticmethod
+    def remove_child_cameras(children):
+        # remove objects together with the camera data they own in one batch,
+        # data is taken from the objects so renamed datablocks are not leaked
+        owned = set()
+        for cam_obj in children:
+            owned.add(cam_obj)
+            if cam_obj.type == 'CAMERA' and cam_obj.data.users == 1:
+                owned.add(cam_obj.data)
+        if owned:
+            bpy.data.batch_remove(owned)
+
+    @staticmethod
+    def get_rig_collection(base_camera):
+        # children of a rig live in their own collection, next to the base camera
+        collection = base_camera.multicam_collection
+        if collection is None:
+            collection = bpy.data.collections.new(base_camera.name + RIG_COLLECTION_SUFFIX)
+            base_camera.users_collection[0].children.link(collection)
+            base_camera.multicam_collection = collection
+        return collection
+
+    @staticmethod
+    def sync_child_cameras(context, suffixes):
+        # make children of the base camera match given suffixes,
+        # reusing cameras that already exist and creating/removing only the difference
+        base_camera = CameraUtils.get_base_camera(context)
+        wanted = set(suffixes)
+
+        existing = {}
+        stale = []
+        for obj in base_camera.children:
+            if obj.multicam_child and obj.type == 'CAMERA' and obj.multicam_child_id in wanted \
+                    and obj.multicam_child_id not in existing:
+                existing[obj.multicam_child_id] = obj
+            else:
+                stale.append(obj)
+        CameraUtils.remove_child_cameras(stale)
+
+        base_camera.constraints.clear()
+
+        missing = [suffix for suffix in suffixes if suffix not in existing]
+        existing.update(zip(missing, CameraUtils.create_child_cameras(missing, base_camera)))
+
+        return base_camera, [existing[suffix] for suffix in suffixes]
+
+    @staticmethod
+    def apply_layout(context, rig, world_space=False):
+        # sync children with a layout.Layout, world space layouts (mesh rigs) are converted
+        # into the space of the base camera; virtual rigs only store the layout as a table
+        base_camera = CameraUtils.get_base_camera(context)
+        locations = rig.locations
+        rotations = rig.rotations
+        if world_space:
+            locations, rotations = CameraUtils.to_parent_space(base_camera, locations, rotations)
+
+        if base_camera.virtual_rig:
+            VirtualRig.store(base_camera, rig.suffixes, locations, rotations)
+            CameraUtils.sync_child_cameras(context, ())
+            return []
+        VirtualRig.clear(base_camera)
+
+        base_camera, children = CameraUtils.sync_child_cameras(context, rig.suffixes)
+        for cam_obj in children:
+            CameraUtils.copy_camera_data(cam_obj.data, base_camera.data)
+            # cam.dof_distance = center_cam.data.dof_distance
+            # cam.dof_object = center_cam.data.dof_object
+
+        collection = CameraUtils.get_rig_collection(base_camera)
+        CameraUtils.set_transforms(collection, children, "rotation_euler", rotations)
+        CameraUtils.set_transforms(collection, children, "location", locations)
+        return children
+
+    @staticmethod
+    def to_parent_space(base_camera, locations, rotations):
+        # world space locations and XYZ euler rotations (N, 3) relative to the base camera,
+        # children are parented without inverse, so world = parent @ local
+        parent_inverse = np.array(base_camera.matrix_world.inverted())
+        locations = locations @ parent_inverse[:3, :3].T + parent_inverse[:3, 3]
+        rotations = parent_inverse[:3, :3] @ layout.euler_to_matrix(rotations)
+        # drop a scale of the base camera
+        return locations, layout.matrix_to_euler(rotations / np.linalg.norm(rotations, axis=2, keepdims=True))
+
+    @staticmethod
+    def get_transforms(collection, children, attr):
+        # (N, 3) transform of all children with a single foreach_get on the rig collection
+        objects = collection.objects
+        index = {obj.name: i for i, obj in enumerate(objects)}
+        positions = [index.get(obj.name) for obj in children]
+        if None in positions:
+            # child moved out of the rig collection by the user
+            return np.array([getattr(cam_obj, attr) for cam_obj in children], dtype=float).reshape(-1, 3)
+        values = np.empty((len(objects), 3), dtype=np.float32)
+        objects.foreach_get(attr, values.ravel())
+        return values[positions].astype(float)
+
+    @staticmethod
+    def set_transforms(collection, children, attr, values):
+        # write a transform of all children with a single foreach_set on the rig collection,
+        # skipping the write when nothing changed
+        objects = collection.objects
+        index = {obj.name: i for i, obj in enumerate(objects)}
+        positions = [index.get(obj.name) for obj in children]
+        if None in positions:
+            # child moved out of the rig collection by the user
+            for cam_obj, value in zip(children, values.tolist()):
+                setattr(cam_obj, attr, value)
+            return
+
+        current = np.empty((len(objects), 3), dtype=np.float32)
+        objects.foreach_get(attr, current.ravel())
+        wanted = current.copy()
+        wanted[positions] = values
+        changed = np.any(np.abs(wanted - current) > SYNC_EPSILON, axis=1)
+        if changed.any():
+            objects.foreach_set(attr, wanted.ravel())
+            for i in np.flatnonzero(changed).tolist():
+                objects[i].update_tag(refresh={'OBJECT'})
+
+    @staticmethod
+    def set_if_changed(owner, attr, value):
+        if abs(getattr(owner, attr) - value) > SYNC_EPSILON:
+            setattr(owner, attr, value)
+
+    @staticmethod
+    def copy_camera_data(cam_data, base_data):
+        for attr in CAMERA_DATA_PROPERTIES:
+            CameraUtils.set_if_changed(cam_data, attr, getattr(base_data, attr))
+
+    @staticmethod
+    def create_child_cameras(suffixes, parent):
+        # create all cameras straight into the rig collection in one pass
+        collection = CameraUtils.get_rig_collection(parent)
+        children = []
+        for suffix in suffixes:
+            cam_data = bpy.data.cameras.new(DEFAULT_CAMERA_NAME + suffix)
+            cam_obj = bpy.data.objects.new(DEFAULT_CAMERA_NAME + suffix, cam_data)
+            cam_obj.multicam_child = True
+            cam_obj.multicam_child_id = suffix
+            cam_obj.parent = parent
+            collection.objects.link(cam_obj)
+            children.append(cam_obj)
+
+        return children
+
+    @staticmethod
+    def rig_cameras(base_camera):
+        # names, world matrices (N, 4, 4), field of view angles and (shift x, shift y) of the rig cameras
+        # at the current frame, with a (N,) mask of the perspective ones, read in bulk
+        if base_camera.virtual_rig:
+            _, rig, intrinsics, _ = VirtualRig.table(base_camera)
+            names = VirtualRig.view_names(base_camera)
+            matrices = np.tile(np.eye(4), (len(rig), 1, 1))
+            matrices[:, :3, :3] = layout.euler_to_matrix(rig.rotations)
+            matrices[:, :3, 3] = rig.locations
+            matrices = np.array(base_camera.matrix_world) @ matrices
+            angles = intrinsics[:, CAMERA_DATA_PROPERTIES.index("angle")]
+            shifts = intrinsics[:, CAMERA_DATA_PROPERTIES.index("shift_x")], \
+                intrinsics[:, CAMERA_DATA_PROPERTIES.index("shift_y")]
+            return names, matrices, angles, shifts, np.ones(len(names), dtype=bool)
+
+        cameras = [obj for obj in base_camera.children if obj.type == 'CAMERA']
+        names = [camera.name for camera in cameras]
+        collection = base_camera.multicam_collection
+        objects = collection.objects if collection is not None else []
+        index = {obj.name: i for i, obj in enumerate(objects)}
+        rows = [index.get(name) for name in names]
+        if None in rows:
+            # child moved out of the rig collection by the user
+            matrices = np.array([camera.matrix_world for camera in cameras]).reshape(-1, 4, 4)
+        else:
+            # matrices are stored column major
+            flat = np.empty(len(objects) * 16, dtype=np.float32)
+            objects.foreach_get("matrix_world", flat)
+            matrices = flat.reshape(-1, 4, 4).transpose(0, 2, 1)[rows].astype(float)
+
+        cam_data = bpy.data.cameras
+        data_index = {data.name: i for i, data in enumerate(cam_data)}
+        data_rows = [data_index[camera.data.name] for camera in cameras]
+        values = {}
+        for attr in ("angle", "shift_x", "shift_y", "type"):
+            value = np.empty(len(cam_data), dtype=np.int32 if attr == "type" else np.float32)
+            cam_data.foreach_get(attr, value)
+            values[attr] = value[data_rows]
+        # 0 is PERSP
+        return names, matrices, values["angle"].astype(float), \
+            (values["shift_x"].astype(float), values["shift_y"].astype(float)), values["type"] == 0
+
+
+class VirtualRig:
+    # a rig stored as a table of views on the base camera instead of child cameras,
+    # rendering moves a single proxy child camera to each view in turn
+    TABLE_KEY = "multicam_virtual_rig"
+    PROXY_SUFFIX = " proxy"
+    PREVIEW_COLOR = (1.0, 0.6, 0.1, 1.0)
+
+    # base camera name -> (stamp, layout.Layout, intrinsics, suffix -> row), loaded from the table
+    tables = {}
+    # base camera name -> proxy camera name
+    proxies = {}
+    preview_key = None
+    preview_batch = None
+    draw_handler = None
+
+    @classmethod
+    def store(cls, base_camera, suffixes, locations, rotations):
+        # rows are views, transforms are local to the base camera,
+        # intrinsics are taken from the base camera when the rig is built
+        intrinsics = [getattr(base_camera.data, attr) for attr in CAMERA_DATA_PROPERTIES] * len(suffixes)
+        base_camera[cls.TABLE_KEY] = {
+            'stamp': time.time(),
+            'suffixes': list(suffixes),
+            'locations': np.asarray(locations, dtype=float).ravel().tolist(),
+            'rotations': np.asarray(rotations, dtype=float).ravel().tolist(),
+            'intrinsics': intrinsics,
+        }
+        cls.tables.pop(base_camera.name, None)
+
+    @classmethod
+    def clear(cls, base_camera):
+        if cls.TABLE_KEY in base_camera:
+            del base_camera[cls.TABLE_KEY]
+        cls.tables.pop(base_camera.name, None)
+
+    @classmethod
+    def table(cls, base_camera):
+        # cached arrays of the stored table, reloaded when it changed (e.g. by undo)
+        stored = base_camera.get(cls.TABLE_KEY)
+        if stored is None:
+            return None
+        cached = cls.tables.get(base_camera.name)
+        if cached is None or cached[0] != stored['stamp']:
+            suffixes = list(stored['suffixes'])
+            rig = layout.Layout(suffixes,
+                                np.array(stored['locations'], dtype=float).reshape(-1, 3),
+                                np.array(stored['rotations'], dtype=float).reshape(-1, 3))
+            intrinsics = np.array(stored['intrinsics'], dtype=float).reshape(-1, len(CAMERA_DATA_PROPERTIES))
+            cached = (stored['stamp'], rig, intrinsics, {suffix: row for row, suffix in enumerate(suffixes)})
+            cls.tables[base_camera.name] = cached
+        return cached
+
+    @classmethod
+    def view_names(cls, base_camera):
+        table = cls.table(base_camera)
+        if table is None:
+            return []
+        return [DEFAULT_CAMERA_NAME + suffix for suffix in table[1].suffixes]
+
+    @classmethod
+    def proxy(cls, base_camera):
+        proxy = bpy.data.objects.get(cls.proxies.get(base_camera.name, ""))
+        if proxy is None or proxy.parent != base_camera:
+            cam_data = bpy.data.cameras.new(base_camera.name + cls.PROXY_SUFFIX)
+            CameraUtils.copy_camera_data(cam_data, base_camera.data)
+            proxy = bpy.data.objects.new(base_camera.name + cls.PROXY_SUFFIX, cam_data)
+            proxy.multicam_child = True
+            proxy.parent = base_camera
+            CameraUtils.get_rig_collection(base_camera).objects.link(proxy)
+            cls.proxies[base_camera.name] = proxy.name
+        return proxy
+
+    @classmethod
+    def place(cls, proxy, view_name):
+        # move the proxy to a view of its rig, False if the rig has no such view
+        _, rig, intrinsics, rows = cls.table(proxy.parent)
+        row = rows.get(view_name[len(DEFAULT_CAMERA_NAME):])
+        if row is None:
+            return False
+        proxy.multicam_child_id = rig.suffixes[row]
+        proxy.location = rig.locations[row].tolist()
+        proxy.rotation_euler = rig.rotations[row].tolist()
+        for attr, value in zip(CAMERA_DATA_PROPERTIES, intrinsics[row].tolist()):
+            CameraUtils.set_if_changed(proxy.data, attr, value)
+        return True
+
+    @classmethod
+    def remove_proxies(cls):
+        proxies = [bpy.data.objects.get(name) for name in cls.proxies.values()]
+        CameraUtils.remove_child_cameras([proxy for proxy in proxies if proxy is not None])
+        cls.proxies.clear()
+
+    @classmethod
+    def draw_preview(cls):
+        # a line along the view direction of each view of the scene camera rig,
+        # built once per table and base camera transform
+        scene = bpy.context.scene
+        base_camera = scene.camera if scene is not None else None
+        if base_camera is not None and base_camera.multicam_child and base_camera.parent is not None:
+            base_camera = base_camera.parent
+        if base_camera is None or not base_camera.virtual_rig:
+            return
+        table = cls.table(base_camera)
+        if table is None or not len(table[1]):
+            return
+
+        shader = gpu.shader.from_builtin('UNIFORM_COLOR' if bpy.app.version >= (4, 0, 0) else '3D_UNIFORM_COLOR')
+        matrix = np.array(base_camera.matrix_world)
+        key = (base_camera.name, table[0], matrix.tobytes(), base_camera.data.display_size)
+        if cls.preview_key != key:
+            rig = table[1]
+            starts = rig.locations @ matrix[:3, :3].T + matrix[:3, 3]
+            directions = -(matrix[:3, :3] @ layout.euler_to_matrix(rig.rotations))[:, :, 2]
+            ends = starts + directions * base_camera.data.display_size
+            coords = np.stack((starts, ends), axis=1).reshape(-1, 3).astype(np.float32)
+            cls.preview_batch = batch_for_shader(shader, 'LINES', {"pos": coords})
+            cls.preview_key = key
+
+        shader.bind()
+        shader.uniform_float("color", cls.PREVIEW_COLOR)
+        cls.preview_batch.draw(shader)
+
+    @classmethod
+    def register(cls):
+        cls.draw_handler = bpy.types.SpaceView3D.draw_handler_add(cls.draw_preview, (), 'WINDOW', 'POST_VIEW')
+
+    @classmethod
+    def unregister(cls):
+        if cls.draw_handler is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(cls.draw_handler, 'WINDOW')
+            cls.draw_handler = None
+        cls.preview_key = None
+        cls.preview_batch = None
+        cls.tables.clear()
+
+
+class RigUpdateScheduler:
+    # coalesces bursts of rig property changes (slider drags) into a single rig update,
+    # applied once the input settles; changes that keep the camera count are previewed
+    # at a limited rate in the meantime as they only move existing cameras
+    settle_delay = 0.25
+    preview_interval = 1 / 30
+
+    # scene name -> (time of last change, whether the change can be previewed)
+    pending = {}
+    last_preview = 0.0
+    # window the changes were made in, timers run without one
+    window = None
+
+    @classmethod
+    def request(cls, camera, context, preview):
+        now = time.monotonic()
+        if context.window is not None:
+            cls.window = context.window
+        _, could_preview = cls.pending.get(context.scene.name, (now, True))
+        preview = preview and could_preview
+        cls.pending[context.scene.name] = (now, preview)
+
+        if preview and now - cls.last_preview >= cls.preview_interval:
+            cls.last_preview = now
+            OBJECT_PT_multicam_panel.update_camera_type(camera, context)
+
+        if not bpy.app.timers.is_registered(cls.flush):
+            bpy.app.timers.register(cls.flush, first_interval=cls.settle_delay)
+
+    @classmethod
+    def flush(cls):
+        now = time.monotonic()
+        for scene_name, (changed_at, _) in list(cls.pending.items()):
+            if now - changed_at < cls.settle_delay:
+                continue
+            del cls.pending[scene_name]
+
+            scene = bpy.data.scenes.get(scene_name)
+            if scene is None or scene.camera is None:
+                continue
+            with bpy.context.temp_override(scene=scene):
+                context = bpy.context
+                base_camera = CameraUtils.get_base_camera(context)
+                OBJECT_PT_multicam_panel.update_camera_type(base_camera, context)
+            cls.push_undo()
+
+        # wake up again when the oldest change still settling is due
+        if cls.pending:
+            return max(min(changed_at for changed_at, _ in cls.pending.values()) + cls.settle_delay - now, 0.01)
+        return None
+
+    @classmethod
+    def push_undo(cls):
+        # one undo step for the whole drag, pushed in the window it was made in
+        # as undo_push does not poll without one
+        windows = bpy.context.window_manager.windows[:]
+        window = cls.window if cls.window in windows else next(iter(windows), None)
+        if window is None:
+            return
+        with bpy.context.temp_override(window=window, screen=window.screen):
+            if bpy.ops.ed.undo_push.poll():
+                bpy.ops.ed.undo_push(message="Update multi camera rig")
+
+    @classmethod
+    def cancel(cls):
+        cls.pending.clear()
+        cls.window = None
+        if bpy.app.timers.is_registered(cls.flush):
+            bpy.app.timers.unregister(cls.flush)
+
+
+class LookAtBaker:
+    # points orbit and sphere rigs at their target by writing the rotations of all cameras at once
+    # instead of a TRACK_TO constraint per camera, so evaluating the rig costs nothing per camera;
+    # rotations are baked again only when the target or the base camera moved
+    BAKED_PATTERNS = {'ORBIT', 'SPHERE'}
+
+    # base camera name -> (target name, placement of target and base camera when last baked)
+    rigs = {}
+
+    @staticmethod
+    def placement(base_camera, target):
+        # the rotations depend on the target location and the whole base camera transform
+        return tuple(np.round(np.concatenate((np.array(base_camera.matrix_world).ravel(),
+                                              np.array(target.matrix_world.translation))), 6).tolist())
+
+    @classmethod
+    def track(cls, base_camera, target):
+        # rotations of the rig look at the target now, keep them doing so
+        cls.rigs[base_camera.name] = (target.name, cls.placement(base_camera, target))
+
+    @classmethod
+    def forget(cls, base_camera):
+        cls.rigs.pop(base_camera.name, None)
+
+    @classmethod
+    def bake(cls, base_camera, target):
+        # turn every camera of the rig towards the target from where it is
+        base_matrix = np.array(base_camera.matrix_world)
+        target_location = np.array(target.matrix_world.translation)
+        if base_camera.virtual_rig:
+            table = VirtualRig.table(base_camera)
+            if table is None:
+                return
+            rig = table[1]
+            world_locations = rig.locations @ base_matrix[:3, :3].T + base_matrix[:3, 3]
+            _, rotations = CameraUtils.to_parent_space(base_camera, world_locations,
+                                                       layout.look_at(world_locations, target_location))
+            VirtualRig.store(base_camera, rig.suffixes, rig.locations, rotations)
+        else:
+            collection = base_camera.multicam_collection
+            children = [obj for obj in base_camera.children if obj.type == 'CAMERA']
+            if collection is None or not children:
+                return
+            locations = CameraUtils.get_transforms(collection, children, "location")
+            world_locations = locations @ base_matrix[:3, :3].T + base_matrix[:3, 3]
+            _, rotations = CameraUtils.to_parent_space(base_camera, world_locations,
+                                                       layout.look_at(world_locations, target_location))
+            CameraUtils.set_transforms(collection, children, "rotation_euler", rotations)
+        cls.track(base_camera, target)
+
+    @classmethod
+    def update(cls):
+        # cost depends on the amount of rigs only, unless one of them has to be baked
+        for base_name, (target_name, placement) in list(cls.rigs.items()):
+            base_camera = bpy.data.objects.get(base_name)
+            target = bpy.data.objects.get(target_name)
+            if base_camera is None or target is None or base_camera.target_object != target_name \
+                    or base_camera.camera_type != 'MESH' or base_camera.pattern_type not in cls.BAKED_PATTERNS \
+                    or not (base_camera.mesh_baked_orientation or base_camera.virtual_rig):
+                del cls.rigs[base_name]
+            elif cls.placement(base_camera, target) != placement:
+                cls.bake(base_camera, target)
+
+    @staticmethod
+    @persistent
+    def on_update(*args):
+        # after depsgraph updates and frame changes, writing the rotations triggers
+        # another update which finds the placement unchanged
+        LookAtBaker.update()
+
+    @staticmethod
+    @persistent
+    def on_load(*args):
+        # rigs of the loaded file, baked on the next update
+        LookAtBaker.rigs.clear()
+        for obj in bpy.data.objects:
+            if obj.type == 'CAMERA' and obj.camera_type == 'MESH' and obj.pattern_type in LookAtBaker.BAKED_PATTERNS \
+                    and (obj.mesh_baked_orientation or obj.virtual_rig) and obj.target_object:
+                LookAtBaker.rigs[obj.name] = (obj.target_object, None)
+
+    @classmethod
+    def register(cls):
+        bpy.app.handlers.depsgraph_update_post.append(cls.on_update)
+        bpy.app.handlers.frame_change_post.append(cls.on_update)
+        bpy.app.handlers.load_post.append(cls.on_load)
+
+    @classmethod
+    def unregister(cls):
+        for handlers, handler in ((bpy.app.handlers.depsgraph_update_post, cls.on_update),
+                                  (bpy.app.handlers.frame_change_post, cls.on_update),
+                                  (bpy.app.handlers.load_post, cls.on_load)):
+            if handler in handlers:
+                handlers.remove(handler)
+        cls.rigs.clear()
+
+
+class OBJECT_PT_multicam_panel(bpy.types.Panel):  # noqa
+    # panel location
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "data"
+
+    bl_category = "Multi camera"
+    bl_label = "Multi camera properties"
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'CAMERA'
+
+    def update_camera_type(self, context):
+        # property changes update the rig in place instead of running the operators,
+        # so a slider tweak does not rebuild every camera or push extra undo steps
+        match self.camera_type:
+            case "SINGLE":
+                ObjectOTSetSingleCamera.set_camera(context)
+            case "STEREO":
+                ObjectOTSetStereoCameras.set_camera(context)
+            case "MATRIX":
+                ObjectOTSetMatrixCameras.set_camera(context)
+            case "MESH":
+                ObjectOTSetMeshCameras.set_camera(context)
+
+    # slider properties are coalesced by RigUpdateScheduler while being dragged
+    def update_rig_preview(self, context):
+        RigUpdateScheduler.request(self, context, preview=True)
+
+    def update_rig_deferred(self, context):
+        OBJECT_PT_multicam_panel.limit_object_rig(self)
+        RigUpdateScheduler.request(self, context, preview=False)
+
+    def update_virtual_rig(self, context):
+        OBJECT_PT_multicam_panel.limit_object_rig(self)
+        OBJECT_PT_multicam_panel.update_camera_type(self, context)
+
+    # amounts of child camera rigs, larger rigs need a virtual rig
+    OBJECT_RIG_LIMITS = {"matrix_vertical_amount": 15, "matrix_horizontal_amount": 15,
+                         "mesh_orbit_cameras_amount": 100, "mesh_sphere_cameras_amount": 100,
+                         "mesh_optimal_cameras_amount": 100}
+
+    @staticmethod
+    def limit_object_rig(camera):
+        if camera.virtual_rig:
+            return
+        for name, limit in OBJECT_PT_multicam_panel.OBJECT_RIG_LIMITS.items():
+            if getattr(camera, name) > limit:
+                # written as ID property, so the update does not run again
+                camera[name] = limit
+
+    bpy.types.Object.camera_type = bpy.props.EnumProperty(
+        attr="camera_type",
+        items=(("SINGLE", "Single", "Default single camera"),
+               ("STEREO", "Stereo", "Stereo camera"),
+               ("MATRIX", "Matrix", "Matrix of cameras (light-field)"),
+               ("MESH", "Mesh", "Mesh of cameras around object")),
+        name="camera_type",
+        description="Camera type (single camera / multiple cameras in different configurations)",
+        default="SINGLE",
+        update=update_camera_type
+    )
+
+    bpy.types.Object.multicam_child = bpy.props.BoolProperty(
+        attr="multicam_child",
+        name="multicam_child",
+        description="Camera is a multicam child",
+        default=False
+    )
+
+    bpy.types.Object.multicam_child_id = bpy.props.StringProperty(
+        attr="multicam_child_id",
+        name="multicam_child_id",
+        description="Identifier of multicam child within its rig",
+        default=""
+    )
+
+    bpy.types.Object.virtual_rig = bpy.props.BoolProperty(
+        attr="virtual_rig",
+        name="virtual_rig",
+        description="Store the rig as a table of views instead of child cameras, "
+                    "rendering moves one proxy camera through the views",
+        default=False,
+        update=update_virtual_rig
+    )
+
+    bpy.types.Object.multicam_collection = bpy.props.PointerProperty(
+        attr="multicam_collection",
+        name="multicam_collection",
+        description="Collection holding the multicam children",
+        type=bpy.types.Collection
+    )
+
+    # Stereo camera properties
+    bpy.types.Object.is_convergent = bpy.props.BoolProperty(
+        attr="is_convergent",
+        name="is_convergent",
+        description="If checked, the cameras will focus on one point. If not, they'll be parallel.",
+        default=False,
+        update=update_camera_type
+    )
+
+    bpy.types.Object.stereo_focal_distance = bpy.props.FloatProperty(
+        attr="stereo_focal_distance",
+        name="stereo_focal_distance",
+        description="Distance to the Stereo-Window (Zero Parallax) in Blender Units",
+        min=0.01, soft_min=0.01, max=1000, soft_max=1000, default=20,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.cameras_spacing = bpy.props.FloatProperty(
+        attr="cameras_spacing",
+        name="cameras_spacing",
+        description="Distance between the cameras in Blender Units",
+        min=0.01, soft_min=0.01, max=1000, soft_max=1000, default=20,
+        update=update_rig_preview
+    )
+
+    # Matrix camera properties
+    bpy.types.Object.matrix_vertical_distance = bpy.props.IntProperty(
+        attr="matrix_vertical_distance",
+        name="matrix_vertical_distance",
+        description="Distance between cameras in vertical direction",
+        min=0, soft_min=0, max=10000, soft_max=1000, default=100,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.matrix_horizontal_distance = bpy.props.IntProperty(
+        attr="matrix_horizontal_distance",
+        name="matrix_horizontal_distance",
+        description="Distance between cameras in horizontal direction",
+        min=0, soft_min=0, max=10000, soft_max=1000, default=100,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.matrix_vertical_amount = bpy.props.IntProperty(
+        attr="matrix_vertical_amount",
+        name="matrix_vertical_amount",
+        description="Amount of cameras in vertical axis, up to 15 without a virtual rig",
+        min=2, soft_min=0, max=150, soft_max=15, default=3,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.matrix_horizontal_amount = bpy.props.IntProperty(
+        attr="matrix_horizontal_amount",
+        name="matrix_horizontal_amount",
+        description="Amount of cameras in horizontal axis, up to 15 without a virtual rig",
+        min=2, soft_min=0, max=150, soft_max=15, default=3,
+        update=update_rig_deferred
+    )
+
+    # Mesh camera properties
+    bpy.types.Object.pattern_type = bpy.props.EnumProperty(
+        attr="pattern_type",
+        items=(("ORBIT", "Orbit", "Orbit around object"),
+               ("SPHERE", "Sphere", "Sphere of cameras around object"),
+               ("OPTIMAL", "Optimal", "Minimal amount of cameras to show whole object"),
+               ("COVERAGE", "Coverage", "Fewest cameras seeing a share of the object surface")),
+        name="pattern_type",
+        description="Pattern type (orbit / sphere) for mesh camera",
+        default="ORBIT",
+        update=update_camera_type
+    )
+
+    bpy.types.Object.target_object = bpy.props.StringProperty(
+        attr="target_object",
+        name="target_object",
+        description="Target object for mesh camera",
+        default="",
+        update=update_camera_type
+    )
+
+    bpy.types.Object.radius = bpy.props.FloatProperty(
+        attr="radius",
+        name="radius",
+        description="Radius of mesh camera",
+        min=0.0, soft_min=0.0, max=1000, soft_max=1000, default=5,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.mesh_orbit_cameras_amount = bpy.props.IntProperty(
+        attr="mesh_orbit_cameras_amount",
+        name="mesh_orbit_cameras_amount",
+        description="Amount of cameras on orbit, up to 100 without a virtual rig",
+        min=2, soft_min=0, max=20000, soft_max=30, default=4,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.orbit_rotation_offset = bpy.props.FloatProperty(
+        attr="orbit_rotation_offset",
+        name="orbit_rotation_offset",
+        description="Offset of orbit rotation",
+        min=0.0, soft_min=0.0, max=360.0, soft_max=360.0, default=0.0,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.orbit_tilt_x = bpy.props.FloatProperty(
+        attr="orbit_tilt_x",
+        name="orbit_tilt_x",
+        description="Tilt around x axis of orbit",
+        min=-360.0, soft_min=-360.0, max=360.0, soft_max=360.0, default=0.0,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.orbit_tilt_y = bpy.props.FloatProperty(
+        attr="orbit_tilt_y",
+        name="orbit_tilt_y",
+        description="Tilt around y axis of orbit",
+        min=-360.0, soft_min=-360.0, max=360.0, soft_max=360.0, default=0.0,
+        update=update_rig_preview
+    )
+
+    bpy.types.Object.mesh_baked_orientation = bpy.props.BoolProperty(
+        attr="mesh_baked_orientation",
+        name="mesh_baked_orientation",
+        description="Write the rotations looking at the target directly instead of a tracking constraint per camera, "
+                    "baked again whenever the target moves",
+        default=False,
+        update=update_camera_type
+    )
+
+    bpy.types.Object.mesh_sphere_cameras_amount = bpy.props.IntProperty(
+        attr="mesh_sphere_cameras_amount",
+        name="mesh_sphere_cameras_amount",
+        description="Amount of cameras around the object, up to 100 without a virtual rig",
+        min=2, soft_min=0, max=20000, soft_max=100, default=6,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.mesh_optimal_z_rotation_offset = bpy.props.FloatProperty(
+        attr="mesh_optimal_z_rotation_offset",
+        name="mesh_optimal_z_rotation_offset",
+        description="Offset of optimal rotation around z axis",
+        min=0.0, soft_min=0.0, max=360.0, soft_max=360.0, default=0.0,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.mesh_optimal_cameras_amount = bpy.props.IntProperty(
+        attr="mesh_optimal_cameras_amount",
+        name="mesh_optimal_cameras_amount",
+        description="Amount of viewing directions, 6 looks along the axes, other amounts are spread evenly, "
+                    "up to 100 without a virtual rig",
+        min=1, soft_min=1, max=20000, soft_max=100, default=6,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.mesh_optimal_fit = bpy.props.EnumProperty(
+        attr="mesh_optimal_fit",
+        name="mesh_optimal_fit",
+        description="Geometry of the target kept in frame",
+        items=[
+            ("BOUNDS", "Bounding box", "Frame the bounding box of the target", 1),
+            ("VERTICES", "Vertices", "Frame the evaluated vertices of a mesh target, tighter for round shapes", 2)
+        ],
+        default="BOUNDS",
+        update=update_camera_type
+    )
+
+    bpy.types.Object.mesh_coverage_candidates = bpy.props.IntProperty(
+        attr="mesh_coverage_candidates",
+        name="mesh_coverage_candidates",
+        description="Amount of evenly spread viewing directions the cameras are picked from",
+        min=6, soft_min=6, max=1000, soft_max=500, default=100,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.mesh_coverage_percentage = bpy.props.FloatProperty(
+        attr="mesh_coverage_percentage",
+        name="mesh_coverage_percentage",
+        description="Share of the target surface area seen by at least one camera",
+        subtype='PERCENTAGE',
+        min=1.0, soft_min=1.0, max=100.0, soft_max=100.0, default=95.0,
+        update=update_rig_deferred
+    )
+
+    bpy.types.Object.mesh_coverage_result = bpy.props.FloatProperty(
+        attr="mesh_coverage_result",
+        name="mesh_coverage_result",
+        description="Share of the target surface area seen by the current cameras",
+        subtype='PERCENTAGE',
+        min=0.0, max=100.0, default=0.0
+    )
+
+    # render budget of a rig camera, used by the per camera budget rule
+    bpy.types.Object.budget_resolution = bpy.props.IntProperty(
+        attr="budget_resolution",
+        name="budget_resolution",
+        description="Resolution of the camera, relative to the scene resolution",
+        subtype='PERCENTAGE',
+        min=1, soft_min=10, max=100, soft_max=100, default=100
+    )
+
+    bpy.types.Object.budget_samples = bpy.props.IntProperty(
+        attr="budget_samples",
+        name="budget_samples",
+        description="Samples of the camera, 0 keeps the samples of the scene",
+        min=0, soft_min=0, max=65536, soft_max=4096, default=0
+    )
+
+    bpy.types.Object.budget_simplify = bpy.props.IntProperty(
+        attr="budget_simplify",
+        name="budget_simplify",
+        description="Highest subdivision level of the camera through the simplify settings, "
+                    "-1 keeps the settings of the scene",
+        min=-1, soft_min=-1, max=6, soft_max=6, default=-1
+    )
+
+    bpy.types.Object.budget_denoise = bpy.props.EnumProperty(
+        attr="budget_denoise",
+        name="budget_denoise",
+        description="Denoiser of the camera",
+        items=[
+            ("SCENE", "Scene", "Keep the denoising setting of the scene", 1),
+            ("ON", "On", "Denoise the images of the camera", 2),
+            ("OFF", "Off", "Do not denoise the images of the camera", 3)
+        ],
+        default="SCENE"
+    )
+
+    # user interface
+
+    def draw(self, context):
+        layout = self.layout
+
+        camera = context.active_object
+        if camera.parent is not None and camera.parent.type == 'CAMERA':
+            camera = camera.parent
+
+        row = layout.row()
+        row.prop(camera, "camera_type", text="Stereo Camera Type", expand=True)
+        if camera.camera_type != "SINGLE":
+            row = layout.row()
+            row.prop(camera, "virtual_rig", text="Virtual rig")
+            if camera.virtual_rig:
+                row.label(text=str(len(VirtualRig.view_names(camera))) + " views")
+
+        match camera.camera_type:
+            case "SINGLE":
+                self.draw_single_camera_sub_layout(context)
+            case "STEREO":
+                self.draw_stereo_camera_sub_layout(context)
+            case "MATRIX":
+                self.draw_matrix_camera_sub_layout(context)
+            case "MESH":
+                self.draw_mesh_camera_sub_layout(context)
+
+        child = context.active_object
+        if child.multicam_child and context.scene.budgetRule == 'CAMERA':
+            self.draw_budget_sub_layout(child)
+
+    def draw_budget_sub_layout(self, child):
+        column = self.layout.column()
+        column.label(text="Render budget of " + child.name)
+        row1 = column.row()
+        row1.prop(child, "budget_resolution", text="Resolution")
+        row1.prop(child, "budget_samples", text="Samples")
+        row2 = column.row()
+        row2.prop(child, "budget_simplify", text="Subdivision")
+        row2.prop(child, "budget_denoise", text="Denoise")
+
+    def draw_single_camera_sub_layout(self, context):
+        row = self.layout.row()
+
+    def draw_stereo_camera_sub_layout(self, context):
+        camera = context.scene.camera
+        row1 = self.layout.grid_flow(
+            columns=2, even_columns=False, even_rows=False, align=True)
+
+        column1 = row1.column()
+        column1.alignment = "RIGHT"
+        column1.label(text="Convergent")
+        if camera.is_convergent:
+            column1.label(text="Zero Parallax")
+        column1.label(text="Cameras spacing")
+
+        column2 = row1.column()
+        column2.prop(camera, "is_convergent", text="")  # , toggle=-1
+        if camera.is_convergent:
+            column2.prop(camera, "stereo_focal_distance", text="", slider=True)
+        column2.prop(camera, "cameras_spacing", text="", slider=True)
+
+    def draw_matrix_camera_sub_layout(self, context):
+        camera = context.scene.camera
+        row1 = self.layout.grid_flow(
+            columns=2, even_columns=False, even_rows=False, align=True)
+
+        column1 = row1.column()
+        column1.alignment = "RIGHT"
+        column1.label(text="Vertical amount")
+        column1.label(text="Horizontal amount")
+        column1.label(text="Vertical distance")
+        column1.label(text="Horizontal distance")
+        column2 = row1.column()
+        column2.prop(camera, "matrix_vertical_amount", text="", slider=True)
+        column2.prop(camera, "matrix_horizontal_amount", text="", slider=True)
+        column2.prop(camera, "matrix_vertical_distance", text="", slider=True)
+        column2.prop(camera, "matrix_horizontal_distance",
+                     text="", slider=True)
+
+    def draw_mesh_camera_sub_layout(self, context):
+        camera = context.scene.camera
+        column = self.layout.column()
+
+        row1 = column.row()
+        row1.prop(context.scene.camera, "pattern_type",
+                  text="Pattern Type", expand=True)
+
+        row2 = column.row()
+        row2.prop_search(context.scene.camera, "target_object",
+                         context.scene, "objects", text="Target Object")
+
+        if camera.pattern_type == "ORBIT":
+            row3 = column.row()
+            row3.prop(context.scene.camera, "radius", text="Radius")
+            row4 = column.row()
+            row4.prop(context.scene.camera, "mesh_orbit_cameras_amount",
+                      text="Cameras amount", slider=True)
+            row5 = column.row()
+            row5.prop(context.scene.camera, "orbit_rotation_offset",
+                      text="Rotation offset", slider=True)
+            row6 = column.row()
+            row6.prop(context.scene.camera, "orbit_tilt_x",
+                      text="Tilt x", slider=True)
+            row7 = column.row()
+            row7.prop(context.scene.camera, "orbit_tilt_y",
+                      text="Tilt y", slider=True)
+
+        if camera.pattern_type == "SPHERE":
+            row3 = column.row()
+            row3.prop(context.scene.camera, "radius", text="Radius")
+            row5 = column.row()
+            row5.prop(context.scene.camera, "mesh_sphere_cameras_amount",
+                      text="Cameras amount", slider=True)
+
+        if camera.pattern_type in LookAtBaker.BAKED_PATTERNS and not camera.virtual_rig:
+            row8 = column.row()
+            row8.prop(context.scene.camera, "mesh_baked_orientation", text="Baked orientation")
+
+        if camera.pattern_type == "OPTIMAL":
+            row3 = column.row()
+            row3.prop(context.scene.camera,
+                      "mesh_optimal_z_rotation_offset", text="Z rotation offset", slider=True)
+            row4 = column.row()
+            row4.prop(context.scene.camera, "mesh_optimal_cameras_amount",
+                      text="Cameras amount", slider=True)
+            row5 = column.row()
+            row5.prop(context.scene.camera, "mesh_optimal_fit", text="Fit", expand=True)
+
+        if camera.pattern_type == "COVERAGE":
+            row3 = column.row()
+            row3.prop(context.scene.camera, "mesh_coverage_percentage", text="Coverage", slider=True)
+            row4 = column.row()
+            row4.prop(context.scene.camera, "mesh_coverage_candidates", text="Candidates")
+            row5 = column.row()
+            cameras = len(VirtualRig.view_names(camera)) if camera.virtual_rig else len(camera.children)
+            row5.label(text="%d cameras see %.1f%% of the surface" % (cameras, camera.mesh_coverage_result))
+
+
+class OUTPUT_PT_multicam_panel(bpy.types.Panel):  # noqa
+    # panel location
+    bl_space_type = "PROPERTIES"
+    bl_region_type = "WINDOW"
+    bl_context = "output"
+
+    bl_category = "Multi camera"
+    bl_label = "Multi camera output"
+
+    # Options
+    bpy.types.Scene.frameByFrame = bpy.props.BoolProperty(
+        attr="frameByFrame",
+        name="frameByFrame",
+        description="Frame by frame rendering mode",
+        default=False
+    )
+    bpy.types.Scene.copyMainCameraProperties = bpy.props.BoolProperty(
+        attr="copyMainCameraProperties",
+        name="copyMainCameraProperties",
+        description="Copy main camera properties to all cameras",
+        default=True
+    )
+
+    bpy.types.Scene.persistentData = bpy.props.BoolProperty(
+        attr="persistentData",
+        name="persistentData",
+        description="Keep render data between frame by frame jobs, so cameras of the same frame reuse "
+                    "the synchronized scene",
+        default=True
+    )
+    bpy.types.Scene.telemetryFormat = bpy.props.EnumProperty(
+        attr="telemetryFormat",
+        items=(("NONE", "None", "Do not write render telemetry"),
+               ("JSONL", "JSON Lines", "Write one JSON record per queue item"),
+               ("CSV", "CSV", "Write one CSV row per queue item")),
+        name="telemetryFormat",
+        description="Format of per queue item timing, memory and output size records in the output directory",
+        default="JSONL"
+    )
+    bpy.types.Scene.sweepRender = bpy.props.BoolProperty(
+        attr="sweepRender",
+        name="sweepRender",
+        description="Render the start frame of a static scene for all cameras as one animation, "
+                    "a frame per camera, split into the camera directories afterwards",
+        default=False
+    )
+    bpy.types.Scene.previewEngine = bpy.props.EnumProperty(
+        attr="previewEngine",
+        items=(("WORKBENCH", "Workbench", "Solid shading, fastest"),
+               ("SCENE", "Scene engine", "Render engine of the scene with preview samples")),
+        name="previewEngine",
+        description="Render engine of the preview sheet",
+        default="WORKBENCH"
+    )
+    bpy.types.Scene.previewResolution = bpy.props.IntProperty(
+        attr="previewResolution",
+        name="previewResolution",
+        description="Resolution of the preview sheet cameras, relative to the render resolution",
+        subtype='PERCENTAGE',
+        min=1, soft_min=1, max=100, soft_max=100, default=10
+    )
+    bpy.types.Scene.previewSamples = bpy.props.IntProperty(
+        attr="previewSamples",
+        name="previewSamples",
+        description="Render samples of the preview sheet with the scene render engine",
+        min=1, soft_min=1, max=4096, soft_max=64, default=4
+    )
+    bpy.types.Scene.queueOrder = bpy.props.EnumProperty(
+        attr="queueOrder",
+        items=(("DEFAULT", "Default", "Cameras in rig order"),
+               ("SERPENTINE", "Serpentine", "Along the rows of a matrix rig, alternating direction"),
+               ("NEAREST", "Nearest", "Always on to the closest camera not rendered yet")),
+        name="queueOrder",
+        description="Order of cameras in the render queue, other than default also alternates the direction "
+                    "between frames, so neighbouring jobs share as much as possible",
+        default="DEFAULT"
+    )
+    bpy.types.Scene.queueFrameBlock = bpy.props.IntProperty(
+        attr="queueFrameBlock",
+        name="queueFrameBlock",
+        description="Without frame by frame rendering, render all cameras for blocks of this many frames "
+                    "before the next block (0 renders the whole range per camera)",
+        min=0, soft_min=0, max=100000, soft_max=1000, default=0
+    )
+    bpy.types.Scene.exportCameras = bpy.props.EnumProperty(
+        attr="exportCameras",
+        items=(("TRANSFORMS", "transforms.json", "Camera to world matrices and intrinsics per output file"),
+               ("COLMAP", "COLMAP", "COLMAP text model with a camera per intrinsics and an image per output file")),
+        name="exportCameras",
+        description="Camera poses and intrinsics written to the output directory when rendering starts",
+        options={'ENUM_FLAG'},
+        default=set()
+    )
+    bpy.types.Scene.skipStaticFrames = bpy.props.EnumProperty(
+        attr="skipStaticFrames",
+        items=(("NONE", "Render all", "Render every frame of every camera"),
+               ("LINK", "Link", "Hardlink frames which can not change from the earlier frame (copy where "
+                                "the file system has no links)"),
+               ("COPY", "Copy", "Copy frames which can not change from the earlier frame")),
+        name="skipStaticFrames",
+        description="Frames of a camera which render the same image as an earlier frame are not rendered",
+        default="NONE"
+    )
+    bpy.types.Scene.spoolDirectory = bpy.props.StringProperty(
+        attr="spoolDirectory",
+        name="spoolDirectory",
+        description="Shared directory the render queue is submitted to as job files, rendered by "
+                    "headless workers started with --spool",
+        subtype='DIR_PATH',
+        default=""
+    )
+    bpy.types.Scene.spoolChunkSize = bpy.props.IntProperty(
+        attr="spoolChunkSize",
+        name="spoolChunkSize",
+        description="Frames per spooled job, 0 keeps the frame ranges of the render queue",
+        min=0, soft_min=0, max=100000, soft_max=100, default=0
+    )
+    bpy.types.Scene.postConvert = bpy.props.EnumProperty(
+        attr="postConvert",
+        items=(("NONE", "None", "Keep the rendered files as they are"),
+               ("PNG", "PNG recompress", "Recompress PNG files at the highest compression level"),
+               ("JPEG", "JPEG", "Write a JPEG file next to each rendered file"),
+               ("WEBP", "WebP lossless", "Write a lossless WebP file next to each rendered file")),
+        name="postConvert",
+        description="Conversion of each rendered file with ffmpeg, run while the next job renders",
+        default="NONE"
+    )
+    bpy.types.Scene.postVideo = bpy.props.BoolProperty(
+        attr="postVideo",
+        name="postVideo",
+        description="Encode a video of each camera from its rendered images with ffmpeg, "
+                    "as soon as all frames of the camera are rendered",
+        default=False
+    )
+    bpy.types.Scene.postStereo = bpy.props.EnumProperty(
+        attr="postStereo",
+        items=(("NONE", "None", "No stereo composites"),
+               ("SIDE_BY_SIDE", "Side by side", "Left and right view next to each other"),
+               ("ANAGLYPH", "Anaglyph", "Red and cyan anaglyph")),
+        name="postStereo",
+        description="Composite of the left and right view of a stereo rig per frame, written as PNG",
+        default="NONE"
+    )
+    bpy.types.Scene.postWorkers = bpy.props.IntProperty(
+        attr="postWorkers",
+        name="postWorkers",
+        description="Threads running post-render work next to rendering",
+        min=1, soft_min=1, max=64, soft_max=8, default=2
+    )
+    bpy.types.Scene.budgetRule = bpy.props.EnumProperty(
+        attr="budgetRule",
+        items=(("NONE", "Scene settings", "Render every camera with the settings of the scene"),
+               ("CAMERA", "Per camera", "Resolution, samples, simplify and denoiser set on each rig camera"),
+               ("DISTANCE", "Rig centre", "Cameras close to the centre of the rig render at full quality, "
+                                          "the farthest ones at the minimums"),
+               ("COVERAGE", "Target coverage", "Cameras filling their frame with the target render at full "
+                                               "quality, the ones seeing least of it at the minimums")),
+        name="budgetRule",
+        description="Render budget of each camera of the rig",
+        default="NONE"
+    )
+    bpy.types.Scene.budgetMinResolution = bpy.props.IntProperty(
+        attr="budgetMinResolution",
+        name="budgetMinResolution",
+        description="Resolution of the least important cameras, relative to the scene resolution",
+        subtype='PERCENTAGE',
+        min=1, soft_min=10, max=100, soft_max=100, default=50
+    )
+    bpy.types.Scene.budgetMinSamples = bpy.props.IntProperty(
+        attr="budgetMinSamples",
+        name="budgetMinSamples",
+        description="Samples of the least important cameras",
+        min=1, soft_min=1, max=65536, soft_max=1024, default=16
+    )
+    bpy.types.Scene.budgetSimplify = bpy.props.IntProperty(
+        attr="budgetSimplify",
+        name="budgetSimplify",
+        description="Subdivision levels the least important cameras render with less than the scene, "
+                    "through the simplify settings",
+        min=0, soft_min=0, max=6, soft_max=6, default=0
+    )
+    bpy.types.Scene.budgetDenoise = bpy.props.BoolProperty(
+        attr="budgetDenoise",
+        name="budgetDenoise",
+        description="Denoise cameras rendering with fewer samples than the scene",
+        default=True
+    )
+    bpy.types.Scene.budgetTime = bpy.props.FloatProperty(
+        attr="budgetTime",
+        name="budgetTime",
+        description="Total render time in minutes the samples of all cameras are distributed over, "
+                    "estimated by pilot renders before the queue starts (0 to disable)",
+        min=0.0, soft_min=0.0, max=100000.0, soft_max=1440.0, default=0.0
+    )
+    bpy.types.Scene.budgetPilotSamples = bpy.props.IntProperty(
+        attr="budgetPilotSamples",
+        name="budgetPilotSamples",
+        description="Samples of the first of the two pilot renders timing the time budget, the second "
+                    "renders twice as many",
+        min=1, soft_min=1, max=4096, soft_max=256, default=16
+    )
+    bpy.types.Scene.resumeRender = bpy.props.BoolProperty(
+        attr="resumeRender",
+        name="resumeRender",
+        description="Skip frames already rendered according to the manifest in the output directory",
+        default=False
+    )
+    bpy.types.Scene.multiView = bpy.props.BoolProperty(
+        attr="multiView",
+        name="multiView",
+        description="Render all cameras of a stereo or matrix rig in a single multi-view render per frame range",
+        default=False
+    )
+    bpy.types.Scene.autoBorder = bpy.props.BoolProperty(
+        attr="autoBorder",
+        name="autoBorder",
+        description="Render only the region of each camera's frame covered by the target",
+        default=False
+    )
+    bpy.types.Scene.autoBorderPadding = bpy.props.FloatProperty(
+        attr="autoBorderPadding",
+        name="autoBorderPadding",
+        description="Margin around the target region, relative to the frame size",
+        subtype='PERCENTAGE',
+        min=0.0, soft_min=0.0, max=50.0, soft_max=20.0, default=5.0
+    )
+    bpy.types.Scene.autoBorderCollection = bpy.props.PointerProperty(
+        attr="autoBorderCollection",
+        name="autoBorderCollection",
+        description="Objects kept in the render region, defaults to the target object of the rig",
+        type=bpy.types.Collection
+    )
+    bpy.types.Scene.autoBorderCrop = bpy.props.BoolProperty(
+        attr="autoBorderCrop",
+        name="autoBorderCrop",
+        description="Crop the output to the render region, otherwise keep the full frame with empty pixels around it",
+        default=False
+    )
+    bpy.types.Scene.multiViewOutput = bpy.props.EnumProperty(
+        attr="multiViewOutput",
+        items=(("FILES", "Per camera files", "Move each view into its camera directory"),
+               ("EXR", "Multi-view EXR", "Single OpenEXR file with all views (requires OpenEXR output)")),
+        name="multiViewOutput",
+        description="Output of multi-view rendering",
+        default="FILES"
+    )
+
+    # Current render queue state, the queue itself is kept in memory by RenderQueue
+    bpy.types.Scene.renderQueueDone = bpy.props.IntProperty(
+        attr="renderQueueDone",
+        name="renderQueueDone",
+        description="Amount of finished render queue items",
+        default=0
+    )
+    bpy.types.Scene.renderQueueTotal = bpy.props.IntProperty(
+        attr="renderQueueTotal",
+        name="renderQueueTotal",
+        description="Amount of items in render queue",
+        default=0
+    )
+    bpy.types.Scene.rendering = bpy.props.BoolProperty(
+        attr="rendering",
+        name="rendering",
+        description="Render in progress",
+        default=False
+    )
+    bpy.types.Scene.cancelRender = bpy.props.BoolProperty(
+        attr="cancelRender",
+        name="cancelRender",
+        description="Render canceled",
+        default=False
+    )
+    bpy.types.Scene.baseOutputPath = bpy.props.StringProperty(
+        attr="baseOutputPath",
+        name="baseOutputPath",
+        description="Base output path",
+        default=""
+    )
+    bpy.types.Scene.baseStartFrame = bpy.props.IntProperty(
+        attr="baseStartFrame",
+        name="baseStartFrame",
+        description="Saved start frame of scene",
+        default=0
+    )
+    bpy.types.Scene.baseEndFrame = bpy.props.IntProperty(
+        attr="baseEndFrame",
+        name="baseEndFrame",
+        description="Saved end frame of scene",
+        default=0
+    )
+    bpy.types.Scene.basePersistentData = bpy.props.BoolProperty(
+        attr="basePersistentData",
+        name="basePersistentData",
+        description="Saved persistent data setting of scene",
+        default=False
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.active_object is not None and context.active_object.type == 'CAMERA' and context.active_object.camera_type != 'SINGLE'
+
+    @staticmethod
+    def isVideoRender(video_format):
+        videoFormats = [
+            'AVI_JPEG',
+            'AVI_RAW',
+            'FFMPEG'
+        ]
+        return video_format in videoFormats
+
+    def draw(self, context):
+        scene = context.scene
+        column = self.layout.column()
+        row1 = column.row()
+        if RenderQueue.active:
+            row1.label(text="Rendering " + str(scene.renderQueueDone + 1) + " / " + str(scene.renderQueueTotal))
+            row1.operator('multicam.cancel_rendering')
+            throughput = RenderTelemetry.throughput
+            if throughput is not None and throughput.eta is not None:
+                row1b = column.row()
+                row1b.label(text="%.1f jobs/min, ETA %s" % (throughput.jobs_per_minute,
+                                                            telemetry.format_duration(throughput.eta)))
+        else:
+            row1.operator('multicam.render_multi_cameras')
+            row1a = column.row()
+            row1a.operator('multicam.render_preview')
+            row1a.prop(context.scene, "previewEngine", text="")
+            row1a.prop(context.scene, "previewResolution", text="Size")
+            if scene.previewEngine == 'SCENE':
+                row1a.prop(context.scene, "previewSamples", text="Samples")
+        row2 = column.row()
+        if self.isVideoRender(
+                scene.render.image_settings.file_format):
+            row2.label(
+                text="No frame by frame rendering to video files, choose an image format and Encode videos")
+        elif scene.sweepRender:
+            row2.prop(context.scene, "sweepRender", text="Static scene as one animation")
+        else:
+            row2a = column.row()
+            row2a.prop(context.scene, "sweepRender", text="Static scene as one animation")
+            row2.prop(context.scene, "frameByFrame",
+                      text="Frame by frame rendering")
+            if scene.frameByFrame:
+                row2.prop(context.scene, "persistentData",
+                          text="Keep render data")
+        row2b = column.row()
+        row2b.prop(context.scene, "queueOrder", text="Order")
+        if not scene.frameByFrame and not scene.sweepRender \
+                and not self.isVideoRender(scene.render.image_settings.file_format):
+            row2b.prop(context.scene, "queueFrameBlock", text="Frame blocks")
+        row3 = column.row()
+        row3.prop(context.scene, "copyMainCameraProperties",
+                  text="Copy main camera properties to all cameras")
+        row3b = column.row()
+        row3b.prop(context.scene, "resumeRender",
+                   text="Resume previous render")
+        row3c = column.row()
+        row3c.prop(context.scene, "telemetryFormat", text="Telemetry")
+        row3h = column.row()
+        row3h.prop(context.scene, "spoolDirectory", text="Spool")
+        row3h.prop(context.scene, "spoolChunkSize", text="Chunk")
+        row3h.operator('multicam.submit_spool', text="", icon='EXPORT')
+        row3i = column.row()
+        row3i.prop(context.scene, "postConvert", text="Convert")
+        row3i.prop(context.scene, "postVideo", text="Encode videos")
+        row3j = column.row()
+        row3j.prop(context.scene, "postStereo", text="Stereo")
+        row3j.prop(context.scene, "postWorkers", text="Threads")
+        row3g = column.row()
+        row3g.prop(context.scene, "skipStaticFrames", text="Unchanged frames")
+        row3k = column.row()
+        row3k.prop(context.scene, "budgetRule", text="Budget")
+        if scene.budgetRule == 'CAMERA':
+            row3k.label(text="Set on each rig camera")
+        elif scene.budgetRule != 'NONE':
+            row3l = column.row()
+            row3l.prop(context.scene, "budgetMinResolution", text="Min resolution")
+            row3l.prop(context.scene, "budgetMinSamples", text="Min samples")
+            row3m = column.row()
+            row3m.prop(context.scene, "budgetSimplify", text="Subdivision drop")
+            row3m.prop(context.scene, "budgetDenoise", text="Denoise")
+        row3n = column.row()
+        row3n.prop(context.scene, "budgetTime", text="Time budget (min)")
+        if scene.budgetTime > 0:
+            row3n.prop(context.scene, "budgetPilotSamples", text="Pilot samples")
+            if scene.budgetRule in {'NONE', 'CAMERA'}:
+                row3n.prop(context.scene, "budgetMinSamples", text="Min samples")
+        row3f = column.row()
+        row3f.label(text="Export cameras")
+        row3f.prop(context.scene, "exportCameras")
+        row3f.operator('multicam.export_cameras', text="", icon='EXPORT')
+        row3d = column.row()
+        row3d.prop(context.scene, "autoBorder", text="Render target region only")
+        if scene.autoBorder:
+            row3d.prop(context.scene, "autoBorderPadding", text="Padding")
+            row3e = column.row()
+            row3e.prop(context.scene, "autoBorderCollection", text="Region of")
+            row3e.prop(context.scene, "autoBorderCrop", text="Crop")
+
+        camera = context.active_object
+        if camera.parent is not None and camera.parent.type == 'CAMERA':
+            camera = camera.parent
+        if camera.camera_type in MultiView.RIG_TYPES and not camera.virtual_rig:
+            row4 = column.row()
+            row4.prop(context.scene, "multiView", text="Render as multi-view")
+            if scene.multiView:
+                row5 = column.row()
+                row5.prop(context.scene, "multiViewOutput", expand=True)
+
+
+class MultiView:
+    # renders every camera of a stereo or matrix rig in one job with blender multi-view,
+    # each child is a view found by its name suffix (Camera_L -> _L, Camera_Y0_X1 -> _Y0_X1)
+    RIG_TYPES = {'STEREO', 'MATRIX'}
+    VIEW_PREFIX = "multicam"
+    EXR_FORMATS = {'OPEN_EXR', 'OPEN_EXR_MULTILAYER'}
+
+    # scene name -> multi-view settings of the scene before rendering
+    saved = {}
+
+    @staticmethod
+    def available(base_camera, cameras):
+        # multi-view looks cameras up by name, so children must not have been renamed
+        return base_camera.camera_type in MultiView.RIG_TYPES and bool(cameras) and all(
+            camera.name == DEFAULT_CAMERA_NAME + camera.multicam_child_id for camera in cameras)
+
+    @classmethod
+    def setup(cls, scene, suffixes):
+        render = scene.render
+        if scene.name not in cls.saved:
+            cls.saved[scene.name] = (render.use_multiview, render.views_format,
+                                     render.image_settings.views_format,
+                                     {view.name: view.use for view in render.views})
+
+        render.use_multiview = True
+        render.views_format = 'MULTIVIEW'
+        exr = scene.multiViewOutput == 'EXR' and render.image_settings.file_format in cls.EXR_FORMATS
+        render.image_settings.views_format = 'MULTIVIEW' if exr else 'INDIVIDUAL'
+
+        for view in render.views:
+            view.use = False
+        for suffix in suffixes:
+            view = render.views.get(cls.VIEW_PREFIX + suffix) or render.views.new(cls.VIEW_PREFIX + suffix)
+            view.camera_suffix = suffix
+            view.use = True
+
+    @classmethod
+    def restore(cls, scene):
+        saved = cls.saved.pop(scene.name, None)
+        if saved is None:
+            return
+        render = scene.render
+        use_multiview, views_format, image_views_format, used = saved
+        for view in list(render.views):
+            if view.name in used:
+                view.use = used[view.name]
+            else:
+                render.views.remove(view)
+        render.image_settings.views_format = image_views_format
+        render.views_format = views_format
+        render.use_multiview = use_multiview
+
+    @classmethod
+    def split_views(cls, scene, queueItem):
+        # move per-view files of a finished job into per-camera directories,
+        # so the output looks the same as when rendering camera by camera
+        render = scene.render
+        base_dir = bpy.path.abspath(scene.baseOutputPath)
+        if OUTPUT_PT_multicam_panel.isVideoRender(render.image_settings.file_format):
+            frames = [queueItem['frameStart']]
+        else:
+            frames = range(queueItem['frameStart'], queueItem['frameEnd'] + 1, scene.frame_step)
+
+        for suffix in queueItem['views']:
+            camera_dir = os.path.join(base_dir, DEFAULT_CAMERA_NAME + suffix)
+            os.makedirs(camera_dir, exist_ok=True)
+            for frame in frames:
+                source = render.frame_path(frame=frame, view=cls.VIEW_PREFIX + suffix)
+                if os.path.exists(source):
+                    os.replace(source, os.path.join(camera_dir, os.path.basename(render.frame_path(frame=frame))))
+
+
+class SweepRender:
+    # renders every camera of a static scene as one animation, camera i on frame sweepStart + i:
+    # child cameras are bound to timeline markers, virtual rigs keyframe their proxy camera
+    MARKER_PREFIX = "multicam_sweep_"
+
+    # scene name -> (motion blur, frame step, camera bindings of other markers) before rendering
+    saved = {}
+    # names of the actions baked for virtual rigs
+    actions = []
+
+    @classmethod
+    def setup(cls, scene, base_camera, queueItem):
+        sweep = queueItem['sweep']
+        start = queueItem['sweepStart']
+        render = scene.render
+        if scene.name not in cls.saved:
+            bound = [(marker, marker.camera) for marker in scene.timeline_markers
+                     if marker.camera is not None and not marker.name.startswith(cls.MARKER_PREFIX)]
+            cls.saved[scene.name] = (render.use_motion_blur, scene.frame_step, bound)
+            # cameras of other markers would take over frames of the sweep
+            for marker, _ in bound:
+                marker.camera = None
+        # each frame is a different view, nothing moves within a frame
+        render.use_motion_blur = False
+        scene.frame_step = 1
+        cls.clear(scene)
+
+        if 'rig' in queueItem:
+            proxy = VirtualRig.proxy(base_camera)
+            if scene.copyMainCameraProperties is True:
+                OutputOTRenderMultiCameras.copy_main_camera_properties(proxy)
+            if not cls.bake_views(proxy, sweep, start):
+                return False
+            scene.camera = proxy
+            return True
+
+        cameras = [scene.objects.get(cameraName) for cameraName in sweep]
+        if None in cameras:
+            return False
+        for i, camera in enumerate(cameras):
+            marker = scene.timeline_markers.new(cls.MARKER_PREFIX + str(i), frame=start + i)
+            marker.camera = camera
+        scene.camera = cameras[queueItem['frameStart'] - start]
+        return True
+
+    @classmethod
+    def bake_views(cls, proxy, sweep, start):
+        # transforms and intrinsics of the virtual views as constant keyframes, False for unknown views
+        _, rig, intrinsics, rows = VirtualRig.table(proxy.parent)
+        indices = [rows.get(cameraName[len(DEFAULT_CAMERA_NAME):]) for cameraName in sweep]
+        if None in indices:
+            return False
+        frames = start + np.arange(len(indices))
+        cls.bake(proxy, "location", rig.locations[indices], frames)
+        cls.bake(proxy, "rotation_euler", rig.rotations[indices], frames)
+        for column, attr in enumerate(CAMERA_DATA_PROPERTIES):
+            cls.bake(proxy.data, attr, intrinsics[indices, column:column + 1], frames)
+        return True
+
+    @classmethod
+    def bake(cls, owner, data_path, values, frames):
+        # all keyframes of a property written at once
+        animation_data = owner.animation_data or owner.animation_data_create()
+        if animation_data.action is None:
+            animation_data.action = bpy.data.actions.new(owner.name + " sweep")
+            cls.actions.append(animation_data.action.name)
+        fcurves = animation_data.action.fcurves
+        for index in range(values.shape[1]):
+            fcurve = fcurves.find(data_path, index=index) or fcurves.new(data_path, index=index)
+            keyframes = fcurve.keyframe_points
+            keyframes.clear()
+            keyframes.add(len(frames))
+            keyframes.foreach_set("co", np.stack((frames, values[:, index]), axis=1).astype(np.float32).ravel())
+            # 0 is CONSTANT
+            keyframes.foreach_set("interpolation", [0] * len(frames))
+            fcurve.update()
+
+    @staticmethod
+    def output_files(scene, queueItem):
+        # each frame of the sweep is the static frame of its camera
+        render = scene.render
+        base_output_path = scene.baseOutputPath or render.filepath
+        saved = render.filepath
+        files = {}
+        for frame in range(queueItem['frameStart'], queueItem['frameEnd'] + 1):
+            render.filepath = os.path.join(base_output_path, queueItem['sweep'][frame - queueItem['sweepStart']], '')
+            files[str(frame)] = [render.frame_path(frame=queueItem['frame'])]
+        render.filepath = saved
+        return files
+
+    @classmethod
+    def split(cls, scene, queueItem):
+        # move the frames of the sweep into per camera directories, named as the static frame
+        render = scene.render
+        for frame, paths in cls.output_files(scene, queueItem).items():
+            source = render.frame_path(frame=int(frame))
+            if os.path.exists(source):
+                os.makedirs(os.path.dirname(paths[0]), exist_ok=True)
+                os.replace(source, paths[0])
+
+    @classmethod
+    def clear(cls, scene):
+        # remove markers and keyframes of the sweep
+        for marker in [marker for marker in scene.timeline_markers if marker.name.startswith(cls.MARKER_PREFIX)]:
+            scene.timeline_markers.remove(marker)
+        for name in cls.actions:
+            action = bpy.data.actions.get(name)
+            if action is not None:
+                bpy.data.actions.remove(action)
+        cls.actions.clear()
+
+    @classmethod
+    def restore(cls, scene):
+        cls.clear(scene)
+        saved = cls.saved.pop(scene.name, None)
+        if saved is None:
+            return
+        scene.render.use_motion_blur, scene.frame_step, bound = saved
+        for marker, camera in bound:
+            marker.camera = camera
+
+
+class AutoBorder:
+    # sets the render border of each job to the frame region covered by the target,
+    # projected for all cameras of the rig at once and cached per frame
+    BORDER_PROPERTIES = ("use_border", "use_crop_to_border",
+                         "border_min_x", "border_min_y", "border_max_x", "border_max_y")
+
+    # scene name -> border settings of the scene before rendering
+    saved = {}
+    # frame -> (camera name -> row, (N, 4) frame regions)
+    frames = {}
+
+    @staticmethod
+    def target_points(scene, base_camera):
+        # world space bounding box corners of the evaluated target objects
+        collection = scene.autoBorderCollection
+        if collection is not None:
+            objects = list(collection.all_objects)
+        else:
+            target = bpy.data.objects.get(base_camera.target_object)
+            objects = [target] if target is not None else []
+
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        points = []
+        for obj in objects:
+            if obj.type in {'CAMERA', 'LIGHT', 'EMPTY', 'SPEAKER', 'LIGHT_PROBE'}:
+                continue
+            obj_eval = obj.evaluated_get(depsgraph)
+            matrix = np.array(obj_eval.matrix_world)
+            points.append(np.array(obj_eval.bound_box) @ matrix[:3, :3].T + matrix[:3, 3])
+        return np.concatenate(points) if points else None
+
+    @classmethod
+    def frame_regions(cls, scene, base_camera, frame):
+        if frame in cls.frames:
+            return cls.frames[frame]
+        current = scene.frame_current
+        if frame != current:
+            scene.frame_set(frame)
+        try:
+            points = cls.target_points(scene, base_camera)
+            names, matrices, angles, (shift_x, shift_y), perspective = CameraUtils.rig_cameras(base_camera)
+            regions = np.tile((0.0, 0.0, 1.0, 1.0), (len(names), 1))
+            if points is not None and perspective.any():
+                tan_x, tan_y = layout.frustum_tangents(angles[perspective], base_camera.data.sensor_fit,
+                                                       CameraExport.aspect(scene))
+                projected = layout.project_points(matrices[perspective], points, tan_x, tan_y,
+                                                  shift_x[perspective], shift_y[perspective])
+                regions[perspective] = layout.screen_bounds(projected, scene.autoBorderPadding / 100)
+        finally:
+            if frame != current:
+                scene.frame_set(current)
+        cls.frames[frame] = ({name: row for row, name in enumerate(names)}, regions)
+        return cls.frames[frame]
+
+    @classmethod
+    def setup(cls, scene, base_camera, cameraNames, frames):
+        # render border around the target for all cameras and frames of a job,
+        # cameras without a known region (e.g. orthographic) render the full frame
+        region = None
+        for frame in frames:
+            rows, regions = cls.frame_regions(scene, base_camera, frame)
+            for cameraName in cameraNames:
+                row = rows.get(cameraName)
+                frame_region = regions[row] if row is not None else np.array((0.0, 0.0, 1.0, 1.0))
+                region = frame_region if region is None else np.concatenate(
+                    (np.minimum(region[:2], frame_region[:2]), np.maximum(region[2:], frame_region[2:])))
+        if region is None:
+            return
+
+        render = scene.render
+        if scene.name not in cls.saved:
+            cls.saved[scene.name] = {attr: getattr(render, attr) for attr in cls.BORDER_PROPERTIES}
+        render.use_border = True
+        render.use_crop_to_border = scene.autoBorderCrop
+        for attr, value in zip(cls.BORDER_PROPERTIES[2:], region.tolist()):
+            CameraUtils.set_if_changed(render, attr, value)
+
+    @classmethod
+    def restore(cls, scene):
+        cls.frames.clear()
+        saved = cls.saved.pop(scene.name, None)
+        if saved is None:
+            return
+        for attr, value in saved.items():
+            setattr(scene.render, attr, value)
+
+
+class RenderBudget:
+    # renders each camera with its own resolution, samples, simplify level and denoiser, set by hand
+    # on the rig cameras or derived from their importance, optionally fitted into a total render time
+    # measured with pilot renders; budgets travel with the queue items, so workers apply them too
+    # (path from the scene, property) of settings changed by budgets
+    SETTINGS = (("render", "resolution_percentage"), ("render", "use_simplify"),
+                ("render", "simplify_subdivision_render"), ("cycles", "samples"), ("eevee", "taa_render_samples"),
+                ("cycles", "use_denoising"))
+    # subdivision level of a scene without simplify
+    FULL_SIMPLIFY = 6
+
+    # scene name -> settings of the scene before rendering
+    saved = {}
+    # pilot renders started from the user interface run as jobs of the render queue,
+    # (camera budgets, output path) while they run and (samples, seconds) of the finished ones
+    pilot_state = None
+    timings = []
+
+    @staticmethod
+    def sample_setting(scene):
+        # (path, property) of the sample count of the render engine, None if it has none
+        engine = scene.render.engine
+        if engine == 'CYCLES' and hasattr(scene, "cycles"):
+            return "cycles", "samples"
+        if engine.startswith('BLENDER_EEVEE'):
+            return "eevee", "taa_render_samples"
+        return None
+
+    @staticmethod
+    def item_cameras(queueItem):
+        # names of all cameras rendered by a queue item
+        if queueItem.get('sweep'):
+            return queueItem['sweep']
+        if queueItem.get('views'):
+            return [DEFAULT_CAMERA_NAME + suffix for suffix in queueItem['views']]
+        return [queueItem['camera']]
+
+    @classmethod
+    def camera_budgets(cls, scene, base_camera, cameraNames, positions):
+        # camera name -> budget by the budget rule of the scene
+        rule = scene.budgetRule
+        if rule == 'CAMERA':
+            budgets = {}
+            # views of virtual rigs have no objects to hold a budget, they render with the scene settings
+            for cameraName in cameraNames:
+                camera = scene.objects.get(cameraName)
+                if camera is None:
+                    continue
+                budgets[cameraName] = {
+                    'resolution': camera.budget_resolution,
+                    'samples': camera.budget_samples or None,
+                    'simplify': camera.budget_simplify if camera.budget_simplify >= 0 else None,
+                    'denoise': None if camera.budget_denoise == 'SCENE' else camera.budget_denoise == 'ON'}
+            return budgets
+
+        weights = np.ones(len(cameraNames))
+        if rule == 'DISTANCE':
+            weights = budget.distance_weights(positions)
+        elif rule == 'COVERAGE':
+            points = AutoBorder.target_points(scene, base_camera)
+            names, matrices, angles, (shift_x, shift_y), perspective = CameraUtils.rig_cameras(base_camera)
+            if points is None or not perspective.all():
+                print("Coverage budgets need a target and perspective cameras, rendering all cameras alike")
+            else:
+                tan_x, tan_y = layout.frustum_tangents(angles, base_camera.data.sensor_fit,
+                                                       CameraExport.aspect(scene))
+                rows = {name: row for row, name in enumerate(names)}
+                weights = budget.coverage_weights(layout.project_points(matrices, points, tan_x, tan_y,
+                                                                        shift_x, shift_y))
+                weights = np.array([weights[rows[name]] if name in rows else 1.0 for name in cameraNames])
+
+        setting = cls.sample_setting(scene)
+        samples = getattr(scene.path_resolve(setting[0]), setting[1]) if setting else None
+        render = scene.render
+        simplify = render.simplify_subdivision_render if render.use_simplify else cls.FULL_SIMPLIFY
+        budgets = budget.weighted_budgets(weights, samples, scene.budgetMinSamples, scene.budgetMinResolution,
+                                          simplify, scene.budgetSimplify, scene.budgetDenoise)
+        return dict(zip(cameraNames, budgets))
+
+    @classmethod
+    def frame_counts(cls, scene, renderQueue):
+        # camera name -> frames it renders in the queue
+        frames = {}
+        for queueItem in renderQueue:
+            count = len(range(queueItem['frameStart'], queueItem['frameEnd'] + 1, scene.frame_step))
+            for cameraName in cls.item_cameras(queueItem):
+                frames[cameraName] = frames.get(cameraName, 0) + count
+        return frames
+
+    @classmethod
+    def pilot_jobs(cls, scene, renderQueue, budgets):
+        # queue items rendering a frame of the largest camera at two sample counts, the other
+        # cameras are estimated by their pixel count
+        cameraName = max(cls.frame_counts(scene, renderQueue),
+                         key=lambda name: (budgets.get(name) or {}).get('resolution') or 100)
+        queueItem = next(queueItem for queueItem in renderQueue if cameraName in cls.item_cameras(queueItem))
+        job = {'camera': cameraName, 'frameStart': scene.frame_current, 'frameEnd': scene.frame_current}
+        if 'rig' in queueItem:
+            job['rig'] = queueItem['rig']
+        camera_budget = budgets.get(cameraName) or dict.fromkeys(budget.KEYS)
+        return [dict(job, pilot=samples, budget=dict(camera_budget, samples=samples, denoise=None))
+                for samples in (scene.budgetPilotSamples, scene.budgetPilotSamples * 2)]
+
+    @classmethod
+    def pilot(cls, scene, renderQueue, budgets):
+        # (fixed, per sample) seconds of a frame, timed by rendering the pilot jobs in place
+        saved_camera = scene.camera
+        timings = []
+        try:
+            for queueItem in cls.pilot_jobs(scene, renderQueue, budgets):
+                if queueItem.get('rig'):
+                    scene.camera = VirtualRig.proxy(bpy.data.objects[queueItem['rig']])
+                    VirtualRig.place(scene.camera, queueItem['camera'])
+                else:
+                    scene.camera = scene.objects[queueItem['camera']]
+                cls.apply(scene, queueItem['budget'])
+                started = time.perf_counter()
+                bpy.ops.render.render(scene=scene.name)
+                timings.append((queueItem['pilot'], time.perf_counter() - started))
+        finally:
+            cls.restore(scene)
+            scene.camera = saved_camera
+            VirtualRig.remove_proxies()
+        return budget.fit_timing(*zip(*timings))
+
+    @classmethod
+    def fit_time(cls, scene, renderQueue, budgets, timing):
+        """Budgets with their samples distributed so the queue renders in the time budget of the scene,
+        timing is (fixed, per sample) seconds of a frame of the pilot camera. Returns the budgets and
+        a summary of the estimate."""
+        fixed, per_sample = timing
+        owner, attr = cls.sample_setting(scene)
+        full_samples = getattr(scene.path_resolve(owner), attr)
+        frames = cls.frame_counts(scene, renderQueue)
+        names = list(frames)
+        for cameraName in names:
+            budgets.setdefault(cameraName, dict.fromkeys(budget.KEYS, None))
+        resolutions = np.array([budgets[name]['resolution'] or 100 for name in names], dtype=float)
+        planned = np.array([budgets[name]['samples'] or full_samples for name in names], dtype=float)
+
+        pixels = (resolutions / resolutions.max()) ** 2
+        counts = [frames[name] for name in names]
+        samples = budget.distribute_samples(planned / planned.max(), counts, pixels, fixed, per_sample,
+                                            scene.budgetTime * 60, scene.budgetMinSamples, full_samples)
+        for cameraName, camera_samples in zip(names, samples.tolist()):
+            budgets[cameraName] = dict(budgets[cameraName], samples=camera_samples)
+            if scene.budgetDenoise and camera_samples < full_samples:
+                budgets[cameraName]['denoise'] = True
+        estimate = budget.estimate_seconds(samples, counts, pixels, fixed, per_sample)
+        return budgets, "Time budget: %d to %d samples, estimated %s of %s" % (
+            samples.min(), samples.max(), telemetry.format_duration(estimate),
+            telemetry.format_duration(scene.budgetTime * 60))
+
+    @classmethod
+    def timed(cls, scene):
+        # the time budget is met by scaling samples, engines without samples ignore it
+        return scene.budgetTime > 0 and cls.sample_setting(scene) is not None
+
+    @classmethod
+    def camera_plan(cls, scene):
+        base_camera = scene.camera
+        _, cameraNames, positions, _ = OutputOTRenderMultiCameras.rig_views(base_camera)
+        return cls.camera_budgets(scene, base_camera, cameraNames, positions)
+
+    @classmethod
+    def assign(cls, renderQueue, budgets):
+        # queue items with the combined budget of their cameras
+        return [dict(queueItem, budget=budget.combine([budgets[cameraName] for cameraName
+                                                       in cls.item_cameras(queueItem) if cameraName in budgets]))
+                for queueItem in renderQueue]
+
+    @classmethod
+    def plan(cls, scene, renderQueue, timed=True):
+        """Queue items with the budget of their cameras, with timed the samples are fitted into the
+        time budget by pilot renders rendered right away, which blocks until they are done.
+        Returns renderQueue as it is without budgets."""
+        if timed and scene.budgetTime > 0 and cls.sample_setting(scene) is None:
+            print("The render engine has no samples, the time budget is ignored")
+        timed = timed and cls.timed(scene)
+        if scene.budgetRule == 'NONE' and not timed:
+            return renderQueue
+        budgets = cls.camera_plan(scene)
+        if timed:
+            budgets, summary = cls.fit_time(scene, renderQueue, budgets, cls.pilot(scene, renderQueue, budgets))
+            print(summary)
+        return cls.assign(renderQueue, budgets)
+
+    @classmethod
+    def start_pilots(cls, context, renderQueue):
+        """Start the pilot renders of the time budget in the render queue, rendering into a
+        temporary directory; finish_pilots plans the queue once they are done."""
+        scene = context.scene
+        budgets = cls.camera_plan(scene)
+        jobs = cls.pilot_jobs(scene, renderQueue, budgets)
+        cls.pilot_state = (budgets, scene.render.filepath)
+        cls.timings = []
+        scene.render.filepath = os.path.join(tempfile.mkdtemp(prefix="multicam_pilot_"), "")
+        RenderQueue.start(context, jobs)
+
+    @classmethod
+    def finish_job(cls, scene, queueItem):
+        # render time of a pilot job, from render init until its last frame is written
+        job = RenderTelemetry.job
+        if 'pilot' in queueItem and job is not None:
+            cls.timings.append((queueItem['pilot'], job['rendered'] - job['init']))
+
+    @classmethod
+    def finish_pilots(cls, scene, renderQueue):
+        """Queue items with budgets fitted to the pilot renders and a summary of the estimate,
+        None for the queue if the pilots did not finish."""
+        budgets, filepath = cls.pilot_state
+        cls.pilot_state = None
+        shutil.rmtree(bpy.path.abspath(scene.render.filepath), ignore_errors=True)
+        scene.render.filepath = filepath
+        if len(cls.timings) < 2:
+            return None, "Pilot renders of the time budget did not finish"
+        budgets, summary = cls.fit_time(scene, renderQueue, budgets, budget.fit_timing(*zip(*cls.timings)))
+        return cls.assign(renderQueue, budgets), summary
+
+    @staticmethod
+    def resolution(scene, queueItem):
+        # resolution percentage a queue item renders with
+        percentage = scene.render.resolution_percentage
+        item_budget = queueItem.get('budget')
+        if item_budget is None or item_budget['resolution'] is None:
+            return percentage
+        return max(1, int(round(percentage * item_budget['resolution'] / 100)))
+
+    @classmethod
+    def apply(cls, scene, item_budget):
+        # every job starts from the scene settings, jobs without a budget render with them
+        if scene.name not in cls.saved:
+            saved = {}
+            for path, attr in cls.SETTINGS:
+                try:
+                    saved[path, attr] = getattr(scene.path_resolve(path), attr)
+                except ValueError:
+                    # render engine add-on not enabled
+                    continue
+            cls.saved[scene.name] = saved
+        saved = cls.saved[scene.name]
+        values = dict(saved)
+        if item_budget is not None:
+            if item_budget['resolution'] is not None:
+                values["render", "resolution_percentage"] = max(
+                    1, int(round(saved["render", "resolution_percentage"] * item_budget['resolution'] / 100)))
+            setting = cls.sample_setting(scene)
+            if item_budget['samples'] is not None and setting in values:
+                values[setting] = item_budget['samples']
+            if item_budget['simplify'] is not None:
+                values["render", "use_simplify"] = True
+                values["render", "simplify_subdivision_render"] = item_budget['simplify']
+            if item_budget['denoise'] is not None and ("cycles", "use_denoising") in values:
+                values["cycles", "use_denoising"] = item_budget['denoise']
+        # unchanged settings keep persistent render data valid
+        for (path, attr), value in values.items():
+            CameraUtils.set_if_changed(scene.path_resolve(path), attr, value)
+
+    @classmethod
+    def restore(cls, scene):
+        saved = cls.saved.pop(scene.name, None)
+        if saved is None:
+            return
+        for (path, attr), value in saved.items():
+            setattr(scene.path_resolve(path), attr, value)
+
+
+class CameraExport:
+    # writes poses and intrinsics of every view of the render queue next to its output files,
+    # gathered for the whole rig at once per frame and streamed to the writers
+    TRANSFORMS_NAME = "transforms.json"
+    COLMAP_DIR = "colmap"
+
+    @staticmethod
+    def aspect(scene):
+        render = scene.render
+        return (render.resolution_x * render.pixel_aspect_x) / (render.resolution_y * render.pixel_aspect_y)
+
+    @staticmethod
+    def queue_views(scene, queueItem):
+        # (camera name, frame of its pose, output file) of each view a queue item writes
+        files = OutputOTRenderMultiCameras.output_files(scene, queueItem)
+        sweep = queueItem.get('sweep')
+        views = queueItem.get('views')
+        for frame, paths in files.items():
+            frame = int(frame)
+            if sweep:
+                yield sweep[frame - queueItem['sweepStart']], queueItem['frame'], paths[0]
+            elif views:
+                # a multi-view EXR holds all views in one file
+                for i, suffix in enumerate(views):
+                    yield DEFAULT_CAMERA_NAME + suffix, frame, paths[min(i, len(paths) - 1)]
+            else:
+                yield queueItem['camera'], frame, paths[0]
+
+    @classmethod
+    def write(cls, scene, renderQueue, formats):
+        """Export the views of renderQueue in the given formats to the base output directory,
+        returns the amount of views written."""
+        formats = set(formats)
+        if not formats or not renderQueue:
+            return 0
+        # views of a queue item render at the resolution of its budget
+        entries = sorted((entry + (RenderBudget.resolution(scene, queueItem),) for queueItem in renderQueue
+                          for entry in cls.queue_views(scene, queueItem)), key=lambda entry: entry[1])
+
+        directory = RenderManifest.directory(scene)
+        writers = []
+        if 'TRANSFORMS' in formats:
+            writers.append(camera_export.TransformsWriter(os.path.join(directory, cls.TRANSFORMS_NAME)))
+        if 'COLMAP' in formats:
+            writers.append(camera_export.ColmapWriter(os.path.join(directory, cls.COLMAP_DIR)))
+
+        render = scene.render
+        width = int(render.resolution_x * render.resolution_percentage / 100)
+        height = int(render.resolution_y * render.resolution_percentage / 100)
+        base_camera = scene.camera
+        current = scene.frame_current
+        count = 0
+        try:
+            for frame, group in itertools.groupby(entries, key=lambda entry: entry[1]):
+                if frame != scene.frame_current:
+                    scene.frame_set(frame)
+                names, matrices, angles, (shift_x, shift_y), perspective = CameraUtils.rig_cameras(base_camera)
+                rows = {name: row for row, name in enumerate(names)}
+                tan_x, tan_y = layout.frustum_tangents(angles, base_camera.data.sensor_fit, cls.aspect(scene))
+                fx, fy, cx, cy = camera_export.pixel_intrinsics(tan_x, tan_y, shift_x, shift_y, width, height)
+                for cameraName, _, path, percentage in group:
+                    row = rows.get(cameraName)
+                    # orthographic cameras have no pinhole intrinsics
+                    if row is None or not perspective[row]:
+                        continue
+                    view_width = int(render.resolution_x * percentage / 100)
+                    view_height = int(render.resolution_y * percentage / 100)
+                    # intrinsics scale with the image size
+                    scale_x, scale_y = view_width / width, view_height / height
+                    view = {'camera': cameraName, 'frame': frame, 'path': path, 'matrix': matrices[row],
+                            'fx': float(fx[row] * scale_x), 'fy': float(fy[row] * scale_y),
+                            'cx': float(cx[row] * scale_x), 'cy': float(cy[row] * scale_y),
+                            'width': view_width, 'height': view_height}
+                    for writer in writers:
+                        writer.write(view)
+                    count += 1
+        finally:
+            for writer in writers:
+                writer.close()
+            if scene.frame_current != current:
+                scene.frame_set(current)
+        return count
+
+
+class StaticFrames:
+    # leaves frames out of the queue whose image can not differ from an earlier frame of the same camera:
+    # a pre-pass hashes object transforms, animated and driven properties and the camera per frame,
+    # the output of skipped frames is linked or copied from the earlier frame once the queue is done
+    REPORT_NAME = "multicam_static_frames.json"
+    # data whose animation and drivers can change an image, node trees are checked with their owner
+    ANIMATED_DATA = ("objects", "meshes", "curves", "armatures", "shape_keys", "lattices", "cameras", "lights",
+                     "materials", "textures", "worlds", "node_groups", "particles", "scenes")
+    # changes over time without any animated property
+    DYNAMIC_MODIFIERS = {'CLOTH', 'SOFT_BODY', 'FLUID', 'DYNAMIC_PAINT', 'PARTICLE_SYSTEM', 'OCEAN',
+                         'EXPLODE', 'NODES'}
+
+    # (queue item of the camera, skipped frame, frame it is copied from)
+    copies = []
+    # frames left to render, None when the queue was not planned
+    rendered = None
+
+    @classmethod
+    def dynamic(cls, scene):
+        # reason why frames of the scene can not be compared, None if they can
+        if scene.rigidbody_world is not None and scene.rigidbody_world.enabled:
+            return "the scene has a rigid body simulation"
+        for obj in scene.objects:
+            for modifier in obj.modifiers:
+                if modifier.type in cls.DYNAMIC_MODIFIERS:
+                    return obj.name + " has a " + modifier.type.lower().replace("_", " ") + " modifier"
+        for image in bpy.data.images:
+            if image.users and image.source in {'SEQUENCE', 'MOVIE'}:
+                return "image " + image.name + " is a sequence"
+        if scene.render.use_sequencer and scene.sequence_editor is not None and scene.sequence_editor.sequences_all:
+            return "the scene has video sequencer strips"
+        return None
+
+    @classmethod
+    def animated_properties(cls):
+        # (datablock, data path, array index) of every animated or driven property, camera objects
+        # excepted as their transforms are part of the camera digest
+        properties = []
+        for collection in cls.ANIMATED_DATA:
+            for datablock in getattr(bpy.data, collection):
+                if collection == "objects" and datablock.type == 'CAMERA':
+                    continue
+                owners = [datablock]
+                if getattr(datablock, "node_tree", None) is not None:
+                    owners.append(datablock.node_tree)
+                for owner in owners:
+                    animation_data = owner.animation_data
+                    if animation_data is None:
+                        continue
+                    actions = [animation_data.action] + [strip.action for track in animation_data.nla_tracks
+                                                         for strip in track.strips]
+                    fcurves = [fcurve for action in actions if action is not None for fcurve in action.fcurves]
+                    properties += [(owner, fcurve.data_path, fcurve.array_index)
+                                   for fcurve in fcurves + list(animation_data.drivers)]
+        return properties
+
+    @staticmethod
+    def property_values(properties):
+        # numeric values and the text of other values (e.g. enums) of animated properties
+        numbers = []
+        texts = []
+        for owner, data_path, index in properties:
+            try:
+                value = owner.path_resolve(data_path)
+            except ValueError:
+                continue
+            if hasattr(value, "__len__") and not isinstance(value, str):
+                value = value[index] if index < len(value) else None
+            if isinstance(value, (bool, int, float)):
+                numbers.append(float(value))
+            else:
+                texts.append(str(value))
+        return numbers, repr(texts).encode()
+
+    @classmethod
+    def duplicates(cls, scene, frames, cameraNames):
+        # camera name -> {skipped frame: frame with the same image}
+        objects = scene.objects
+        types = [obj.type for obj in objects]
+        scene_rows = [row for row, obj_type in enumerate(types) if obj_type != 'CAMERA']
+        flat = np.empty(len(objects) * 16, dtype=np.float32)
+        properties = cls.animated_properties()
+        digests = {cameraName: [] for cameraName in cameraNames}
+        current = scene.frame_current
+        try:
+            for frame in frames:
+                if frame != scene.frame_current:
+                    scene.frame_set(frame)
+                objects.foreach_get("matrix_world", flat)
+                numbers, texts = cls.property_values(properties)
+                scene_digest = dedup.digest(flat.reshape(-1, 16)[scene_rows], numbers, texts)
+                names, matrices, angles, (shift_x, shift_y), _ = CameraUtils.rig_cameras(scene.camera)
+                for row, name in enumerate(names):
+                    if name in digests:
+                        digests[name].append((frame, dedup.digest(scene_digest, matrices[row],
+                                                                  (angles[row], shift_x[row], shift_y[row]))))
+        finally:
+            if scene.frame_current != current:
+                scene.frame_set(current)
+        return {cameraName: dedup.duplicate_frames(frame_digests) for cameraName, frame_digests in digests.items()}
+
+    @classmethod
+    def plan(cls, scene, renderQueue):
+        """Queue items narrowed to the frames which have to be rendered, videos, multi-view
+        and sweep items are kept as they are."""
+        cls.copies = []
+        cls.rendered = None
+        if OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format):
+            return renderQueue
+        reason = cls.dynamic(scene)
+        if reason is not None:
+            print("Rendering all frames, " + reason)
+            return renderQueue
+
+        step = scene.frame_step
+        items = [queueItem for queueItem in renderQueue if not queueItem.get('views') and not queueItem.get('sweep')]
+        frames = sorted({frame for queueItem in items
+                         for frame in range(queueItem['frameStart'], queueItem['frameEnd'] + 1, step)})
+        duplicates = cls.duplicates(scene, frames, {queueItem['camera'] for queueItem in items})
+
+        eligible = {id(queueItem) for queueItem in items}
+        planned = []
+        cls.rendered = 0
+        for queueItem in renderQueue:
+            if id(queueItem) not in eligible:
+                planned.append(queueItem)
+                continue
+            skipped = duplicates[queueItem['camera']]
+            frames = range(queueItem['frameStart'], queueItem['frameEnd'] + 1, step)
+            kept = [frame for frame in frames if frame not in skipped]
+            cls.copies += [(queueItem, frame, skipped[frame]) for frame in frames if frame in skipped]
+            cls.rendered += len(kept)
+            planned += [dict(queueItem, frameStart=start, frameEnd=end)
+                        for start, end in manifest.frame_ranges(kept, step)]
+        return planned
+
+    @classmethod
+    def finish(cls, scene):
+        # materialize skipped frames from their rendered frame and write the report
+        if cls.rendered is None:
+            return
+        journal = RenderManifest.manifest
+        if journal is None:
+            journal = manifest.Manifest(RenderManifest.directory(scene))
+            journal.open_journal()
+        counts = {mode: 0 for mode in dedup.MODES}
+        missing = 0
+        cameras = {}
+        for queueItem, frame, source_frame in cls.copies:
+            source, target = (OutputOTRenderMultiCameras.output_files(
+                scene, dict(queueItem, frameStart=f, frameEnd=f))[str(f)][0] for f in (source_frame, frame))
+            cameras.setdefault(queueItem['camera'], {})[str(frame)] = source_frame
+            if not os.path.exists(source):
+                # source frame failed or the queue was canceled
+                missing += 1
+                continue
+            counts[dedup.materialize(source, target, scene.skipStaticFrames)] += 1
+            journal.record([target])
+            PostRender.output(scene, queueItem['camera'], frame, target)
+        if journal is not RenderManifest.manifest:
+            journal.close()
+
+        report = {'rendered': cls.rendered, 'skipped': len(cls.copies), 'linked': counts['LINK'],
+                  'copied': counts['COPY'], 'missing': missing, 'cameras': cameras}
+        manifest.write_atomic(os.path.join(RenderManifest.directory(scene), cls.REPORT_NAME),
+                              json.dumps(report, indent=1))
+        print("Static frames: %d rendered, %d skipped (%d linked, %d copied, %d missing source)"
+              % (cls.rendered, len(cls.copies), counts['LINK'], counts['COPY'], missing))
+        cls.copies = []
+        cls.rendered = None
+
+
+class PostRender:
+    # hands the outputs of finished jobs to a thread pool while the next job renders: conversion of
+    # each file, a video per camera once all its frames are there, stereo pairs once both views are
+    STEREO_NAMES = (DEFAULT_CAMERA_NAME + "_L", DEFAULT_CAMERA_NAME + "_R")
+    VIDEO_EXTENSION = ".mp4"
+
+    pipeline = None
+    ffmpeg = False
+    base_name = ""
+    # camera name -> outputs still to come in this queue
+    remaining = {}
+    # camera name -> {frame: output file} of the whole rig, the frames of its video
+    videos = {}
+    # frame -> {camera name: output file} of stereo views waiting for the other view
+    stereo = {}
+
+    @staticmethod
+    def enabled(scene):
+        return scene.postConvert != 'NONE' or scene.postVideo or scene.postStereo != 'NONE'
+
+    @classmethod
+    def start(cls, scene, fullQueue, renderQueue):
+        # fullQueue has all frames of the rig, renderQueue the ones rendered now
+        if not cls.enabled(scene):
+            return
+        cls.ffmpeg = postprocess.ffmpeg_path() is not None
+        if not cls.ffmpeg and (scene.postConvert != 'NONE' or scene.postVideo):
+            print("ffmpeg not found on the PATH, conversion and video encoding are skipped")
+        cls.pipeline = postprocess.Pipeline(scene.postWorkers)
+        cls.base_name = scene.camera.name
+        cls.stereo = {}
+        cls.videos = {}
+        for queueItem in fullQueue:
+            for cameraName, frame, path in CameraExport.queue_views(scene, queueItem):
+                cls.videos.setdefault(cameraName, {})[frame] = path
+        cls.remaining = {}
+        for queueItem in renderQueue:
+            for cameraName, _, _ in CameraExport.queue_views(scene, queueItem):
+                cls.remaining[cameraName] = cls.remaining.get(cameraName, 0) + 1
+        # frames left out as unchanged come when the queue is done
+        for queueItem, _, _ in StaticFrames.copies:
+            cls.remaining[queueItem['camera']] = cls.remaining.get(queueItem['camera'], 0) + 1
+
+    @classmethod
+    def finish_job(cls, scene, queueItem):
+        if cls.pipeline is None:
+            return
+        for cameraName, frame, path in CameraExport.queue_views(scene, queueItem):
+            cls.output(scene, cameraName, frame, path)
+
+    @classmethod
+    def output(cls, scene, cameraName, frame, path):
+        # a final output file was written
+        if cls.pipeline is None or not os.path.exists(path):
+            return
+        if scene.postConvert != 'NONE' and cls.ffmpeg:
+            cls.pipeline.submit("conversion of " + path, postprocess.convert, path, scene.postConvert)
+
+        if scene.postStereo != 'NONE' and cameraName in cls.STEREO_NAMES:
+            views = cls.stereo.setdefault(frame, {})
+            views[cameraName] = path
+            if len(views) == 2:
+                del cls.stereo[frame]
+                # decoded by blender, composited and encoded in the pool
+                left, right = (OutputOTRenderPreview.load_tile(views[name]) for name in cls.STEREO_NAMES)
+                output = os.path.join(RenderManifest.directory(scene), cls.base_name + "_" + scene.postStereo.lower(),
+                                      os.path.splitext(os.path.basename(views[cls.STEREO_NAMES[0]]))[0] + ".png")
+                cls.pipeline.submit("stereo frame " + str(frame), postprocess.composite_stereo,
+                                    left, right, scene.postStereo, output)
+
+        cls.remaining[cameraName] = cls.remaining.get(cameraName, 1) - 1
+        if cls.remaining[cameraName] == 0 and scene.postVideo and cls.ffmpeg:
+            frames = cls.videos.get(cameraName, {})
+            paths = [frames[f] for f in sorted(frames) if os.path.exists(frames[f])]
+            output = os.path.join(RenderManifest.directory(scene), cameraName + cls.VIDEO_EXTENSION)
+            cls.pipeline.submit("video of " + cameraName, postprocess.encode_video,
+                                paths, output, scene.render.fps / scene.render.fps_base)
+
+    @classmethod
+    def stop(cls, scene):
+        # remaining work finishes in the background, waited for without a user interface
+        pipeline = cls.pipeline
+        if pipeline is None:
+            return
+        cls.pipeline = None
+        if scene.postVideo and cls.ffmpeg:
+            for cameraName, remaining in cls.remaining.items():
+                if remaining > 0:
+                    print("Video of " + cameraName + " is not encoded, " + str(remaining) + " frames are missing")
+        if bpy.app.background:
+            pipeline.shutdown(wait=True)
+            cls.report(pipeline)
+        else:
+            pipeline.shutdown(wait=False)
+            bpy.app.timers.register(functools.partial(cls.report_when_idle, pipeline), first_interval=1.0)
+
+    @staticmethod
+    def report(pipeline):
+        print("Post-render: " + str(pipeline.done) + " tasks done, " + str(len(pipeline.errors)) + " failed")
+
+    @classmethod
+    def report_when_idle(cls, pipeline):
+        if not pipeline.idle():
+            return 1.0
+        cls.report(pipeline)
+        return None
+
+
+class SyncTimer:
+    # measures the time from the start of each job to its first sample, i.e. the scene
+    # synchronization that persistent data saves for consecutive jobs on the same frame
+    SAMPLE_PATTERN = re.compile(r'\bSample \d|\d+ samples')
+
+    active = False
+    started = None
+    synced = None
+    # sync time of the first job, nothing was kept for it yet
+    full_sync = None
+    saved_total = 0.0
+
+    @classmethod
+    def start(cls):
+        cls.active = True
+        cls.started = cls.synced = cls.full_sync = None
+        cls.saved_total = 0.0
+        bpy.app.handlers.render_init.append(cls.on_render_init)
+        bpy.app.handlers.render_stats.append(cls.on_render_stats)
+
+    @classmethod
+    def stop(cls):
+        if not cls.active:
+            return
+        bpy.app.handlers.render_init.remove(cls.on_render_init)
+        bpy.app.handlers.render_stats.remove(cls.on_render_stats)
+        cls.active = False
+        if cls.full_sync is not None:
+            print("Persistent data saved %.2fs of scene synchronization" % cls.saved_total)
+
+    @classmethod
+    def on_render_init(cls, scene, *args):
+        cls.started = time.perf_counter()
+        cls.synced = None
+
+    @classmethod
+    def on_render_stats(cls, stats, *args):
+        if cls.started is not None and cls.synced is None and cls.SAMPLE_PATTERN.search(stats):
+            cls.synced = time.perf_counter()
+
+    @classmethod
+    def report(cls, queueItem):
+        # render stats are not reported by every engine and mode, nothing to compare then
+        if cls.started is None or cls.synced is None:
+            return
+        sync = cls.synced - cls.started
+        cls.started = None
+        if cls.full_sync is None:
+            cls.full_sync = sync
+            print("Camera " + queueItem['camera'] + " frame " + str(queueItem['frameStart'])
+                  + ": full sync %.2fs" % sync)
+            return
+        saved = max(cls.full_sync - sync, 0.0)
+        cls.saved_total += saved
+        print("Camera " + queueItem['camera'] + " frame " + str(queueItem['frameStart'])
+              + ": sync %.2fs, saved %.2fs" % (sync, saved))
+
+
+class RenderManifest:
+    # keeps a manifest of the queue in the base output directory and journals every
+    # written frame, so an interrupted queue can be resumed without redoing finished frames
+    manifest = None
+    # outputs of the current job are recorded once it finishes (moved views, videos)
+    record_on_finish = False
+
+    @staticmethod
+    def directory(scene):
+        return bpy.path.abspath(scene.baseOutputPath or scene.render.filepath)
+
+    @classmethod
+    def start(cls, scene, renderQueue, resume=False):
+        """Write the manifest, returns the queue items left to render."""
+        jobs = []
+        for queueItem in renderQueue:
+            job = dict(queueItem, files=OutputOTRenderMultiCameras.output_files(scene, queueItem))
+            job['single_output'] = OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format)
+            jobs.append(job)
+
+        cls.manifest = manifest.Manifest(cls.directory(scene))
+        if resume:
+            renderQueue = manifest.pending_jobs(jobs, cls.manifest.recorded_files(), scene.frame_step)
+        cls.manifest.create(jobs, {'scene': scene.name, 'camera': scene.camera.name,
+                                   'blend': bpy.data.filepath}, keep_journals=resume)
+        cls.attach(scene)
+        return renderQueue
+
+    @classmethod
+    def attach(cls, scene):
+        # journal frames written by this process
+        if cls.manifest is None:
+            cls.manifest = manifest.Manifest(cls.directory(scene))
+        cls.manifest.open_journal()
+        bpy.app.handlers.render_write.append(cls.on_render_write)
+
+    @classmethod
+    def start_job(cls, scene, queueItem):
+        cls.record_on_finish = bool(queueItem.get('views') or queueItem.get('sweep')) or \
+            OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format)
+
+    @classmethod
+    def on_render_write(cls, scene, *args):
+        if cls.manifest is not None and not cls.record_on_finish:
+            cls.manifest.record([scene.render.frame_path(frame=scene.frame_current)])
+
+    @classmethod
+    def finish_job(cls, scene, queueItem):
+        if cls.manifest is not None and cls.record_on_finish:
+            files = OutputOTRenderMultiCameras.output_files(scene, queueItem)
+            cls.manifest.record([path for paths in files.values() for path in paths])
+
+    @classmethod
+    def stop(cls):
+        if cls.manifest is None:
+            return
+        if cls.on_render_write in bpy.app.handlers.render_write:
+            bpy.app.handlers.render_write.remove(cls.on_render_write)
+        cls.manifest.close()
+        cls.manifest = None
+
+
+class RenderTelemetry:
+    # times every queue item split into render handler phases (init: render_init until the
+    # first frame starts, render: until the last frame is done, complete: until the job is
+    # cleaned up), records peak memory and output size, and tracks throughput for the panel
+    PEAK_PATTERN = re.compile(r'Peak:?\s*([\d.]+)([KMG])')
+    UNITS = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+    writer = None
+    throughput = None
+    job = None
+
+    @classmethod
+    def start(cls, scene, total):
+        cls.throughput = telemetry.Throughput(total)
+        cls.job = None
+        if scene.telemetryFormat != 'NONE':
+            cls.writer = telemetry.TelemetryWriter(bpy.path.abspath(scene.baseOutputPath), scene.telemetryFormat)
+        bpy.app.handlers.render_init.append(cls.on_render_init)
+        bpy.app.handlers.render_pre.append(cls.on_render_pre)
+        bpy.app.handlers.render_post.append(cls.on_render_post)
+        bpy.app.handlers.render_stats.append(cls.on_render_stats)
+
+    @classmethod
+    def stop(cls):
+        if cls.throughput is None:
+            return
+        bpy.app.handlers.render_init.remove(cls.on_render_init)
+        bpy.app.handlers.render_pre.remove(cls.on_render_pre)
+        bpy.app.handlers.render_post.remove(cls.on_render_post)
+        bpy.app.handlers.render_stats.remove(cls.on_render_stats)
+        if cls.writer is not None:
+            cls.writer.close()
+            cls.writer = None
+        cls.throughput = None
+
+    @classmethod
+    def on_render_init(cls, scene, *args):
+        now = time.perf_counter()
+        cls.job = {'init': now, 'render': now, 'rendered': now, 'peak': 0, 'started': time.time()}
+
+    @classmethod
+    def on_render_pre(cls, scene, *args):
+        if cls.job is not None and cls.job['render'] == cls.job['init']:
+            cls.job['render'] = time.perf_counter()
+
+    @classmethod
+    def on_render_post(cls, scene, *args):
+        if cls.job is not None:
+            cls.job['rendered'] = time.perf_counter()
+
+    @classmethod
+    def on_render_stats(cls, stats, *args):
+        match = cls.PEAK_PATTERN.search(stats)
+        if cls.job is not None and match:
+            peak = int(float(match.group(1)) * cls.UNITS[match.group(2)])
+            cls.job['peak'] = max(cls.job['peak'], peak)
+
+    @classmethod
+    def finish_job(cls, scene, queueItem):
+        if cls.throughput is None:
+            return
+        cls.throughput.job_done()
+        job, cls.job = cls.job, None
+        if cls.writer is not None and job is not None:
+            now = time.perf_counter()
+            files = OutputOTRenderMultiCameras.output_files(scene, queueItem)
+            output_bytes = sum(os.path.getsize(path) for paths in files.values()
+                               for path in paths if os.path.exists(path))
+            cls.writer.write({
+                'camera': queueItem['camera'],
+                'frameStart': queueItem['frameStart'],
+                'frameEnd': queueItem['frameEnd'],
+                'views': queueItem.get('views'),
+                'started': round(job['started'], 3),
+                'init_time': round(job['render'] - job['init'], 4),
+                'render_time': round(job['rendered'] - job['render'], 4),
+                'complete_time': round(now - job['rendered'], 4),
+                'wall_time': round(now - job['init'], 4),
+                # engines not reporting their peak fall back to the peak of the process
+                'peak_memory': job['peak'] or pool.peak_memory(),
+                'output_bytes': output_bytes,
+            })
+        # live throughput readout in the output panel
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'PROPERTIES':
+                    area.tag_redraw()
+
+
+class RenderQueue:
+    # in-memory queue of the running multicam render; the next job is dispatched
+    # as soon as the previous one completes, only a cursor is persisted on the scene
+    jobs = deque()
+    active = False
+    scene_name = ""
+    window = None
+
+    @classmethod
+    def start(cls, context, jobs):
+        scene = context.scene
+        cls.jobs = deque(jobs)
+        cls.active = True
+        cls.scene_name = scene.name
+        cls.window = context.window
+
+        scene.cancelRender = False
+        scene.rendering = False
+        OutputOTRenderMultiCameras.setup_queue(scene, len(cls.jobs))
+
+        # Register callback functions
+        bpy.app.handlers.render_init.append(cls.pre_render)
+        bpy.app.handlers.render_complete.append(cls.post_render)
+        bpy.app.handlers.render_cancel.append(cls.on_render_cancel)
+        cls.schedule_next()
+
+    @classmethod
+    def schedule_next(cls):
+        # render operator can not be started from within render handlers,
+        # so the next job starts on the next event loop iteration
+        bpy.app.timers.register(cls.dispatch_next, first_interval=0)
+
+    # Rendering callback functions
+    @staticmethod
+    def pre_render(scene, *args):
+        scene.rendering = True
+
+    @classmethod
+    def post_render(cls, scene, *args):
+        queueItem = cls.jobs.popleft()  # remove finished item from render queue
+        OutputOTRenderMultiCameras.finish_job(scene, queueItem)
+        scene.renderQueueDone += 1
+        scene.rendering = False
+        cls.schedule_next()
+
+    @classmethod
+    def on_render_cancel(cls, scene, *args):
+        scene.cancelRender = True
+        scene.rendering = False
+        cls.schedule_next()
+
+    @classmethod
+    def dispatch_next(cls):
+        if not cls.active:
+            return None
+        scene = bpy.data.scenes.get(cls.scene_name)
+        # If cancelled or no items in queue to render, finish.
+        if scene is None or not cls.jobs or scene.cancelRender is True:
+            cls.finish(scene)
+            return None
+        if scene.rendering is True:
+            return None
+
+        queueItem = cls.jobs[0]
+        if not OutputOTRenderMultiCameras.setup_job(scene, queueItem):
+            print("Can not find camera " + queueItem['camera'] + " in scene!")
+            cls.finish(scene)
+            return None
+
+        print("Rendering camera: " + queueItem['camera'])
+        # start new render
+        with bpy.context.temp_override(window=cls.window, scene=scene):
+            bpy.ops.render.render("INVOKE_DEFAULT", animation=True)
+        return None
+
+    @classmethod
+    def finish(cls, scene):
+        # remove all render callbacks
+        bpy.app.handlers.render_init.remove(cls.pre_render)
+        bpy.app.handlers.render_complete.remove(cls.post_render)
+        bpy.app.handlers.render_cancel.remove(cls.on_render_cancel)
+        cls.jobs.clear()
+        cls.active = False
+        cls.window = None
+
+        if scene is not None:
+            OutputOTRenderMultiCameras.restore_scene(scene)
+        print("RENDER QUEUE FINISHED")
+
+
+class OutputOTRenderMultiCameras(bpy.types.Operator):
+    bl_label = 'Render Multi Cameras'
+    bl_idname = 'multicam.render_multi_cameras'
+    bl_description = 'Render selected multicamera'
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return not RenderQueue.active
+
+    @staticmethod
+    def rig_views(base_camera):
+        # child cameras, names and local positions of the views of a rig,
+        # with the queue item keys of virtual rigs, whose views are rendered through a proxy camera
+        cameras = [obj for obj in base_camera.children if obj.type == 'CAMERA']
+        cameraNames = [camera.name for camera in cameras]
+        positions = np.array([camera.location for camera in cameras]).reshape(-1, 3)
+        rig = {}
+        if base_camera.virtual_rig:
+            cameras = []
+            cameraNames = VirtualRig.view_names(base_camera)
+            positions = VirtualRig.table(base_camera)[1].locations if cameraNames else positions
+            rig = {'rig': base_camera.name}
+        return cameras, cameraNames, positions, rig
+
+    @staticmethod
+    def sweep_job(scene, base_camera, cameraNames, rig):
+        # one animation job, each camera renders its own frame of the static scene
+        return dict({'camera': base_camera.name, 'frameStart': scene.frame_start,
+                     'frameEnd': scene.frame_start + len(cameraNames) - 1, 'frame': scene.frame_start,
+                     'sweep': cameraNames, 'sweepStart': scene.frame_start}, **rig)
+
+    @staticmethod
+    def build_queue(scene):
+        # video files can only be rendered in one piece per camera
+        video = OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format)
+        if video:
+            scene.frameByFrame = False
+
+        # fill renderQueue with all cameras
+        base_camera = scene.camera
+        cameras, cameraNames, positions, rig = OutputOTRenderMultiCameras.rig_views(base_camera)
+
+        if scene.sweepRender is True and not video and cameraNames:
+            order = ordering.camera_order(scene.queueOrder, positions)
+            return [OutputOTRenderMultiCameras.sweep_job(scene, base_camera, [cameraNames[i] for i in order], rig)]
+
+        def plan(names):
+            return ordering.plan_jobs(names, scene.frame_start, scene.frame_end, scene.frame_step,
+                                      scene.frameByFrame, 0 if video else scene.queueFrameBlock,
+                                      alternate=scene.queueOrder != 'DEFAULT')
+
+        if scene.multiView is True and MultiView.available(base_camera, cameras):
+            # one job renders all cameras as views, the scene camera picks the view cameras
+            views = [camera.multicam_child_id for camera in cameras]
+            return [dict(queueItem, views=views) for queueItem in plan([cameras[0].name])]
+        if scene.multiView is True:
+            print("Multi-view rendering needs a stereo or matrix rig with unrenamed cameras, "
+                  "rendering camera by camera")
+
+        order = ordering.camera_order(scene.queueOrder, positions)
+        return [dict(queueItem, **rig) for queueItem in plan([cameraNames[i] for i in order])]
+
+    @staticmethod
+    def setup_queue(scene, total):
+        # save scene state restored by restore_scene once the queue is done
+        scene.renderQueueDone = 0
+        scene.renderQueueTotal = total
+        scene.baseOutputPath = scene.render.filepath
+        scene.baseStartFrame = scene.frame_start
+        scene.baseEndFrame = scene.frame_end
+        scene.basePersistentData = scene.render.use_persistent_data
+
+        RenderTelemetry.start(scene, total)
+
+        if scene.frameByFrame is True and scene.persistentData is True:
+            # consecutive jobs of a frame only switch camera and output path
+            scene.render.use_persistent_data = True
+            SyncTimer.start()
+
+    @staticmethod
+    def setup_job(scene, queueItem):
+        # point scene camera, output path and frame range at a queue item
+        cameraName = queueItem['camera']
+        if scene.baseOutputPath:
+            scene.render.filepath = scene.baseOutputPath  # restore base output path
+
+        # change scene active camera
+        sweep = queueItem.get('sweep')
+        if sweep:
+            base_camera = scene.objects.get(cameraName)
+            if base_camera is None or not SweepRender.setup(scene, base_camera, queueItem):
+                return False
+        elif 'rig' in queueItem:
+            base_camera = scene.objects.get(queueItem['rig'])
+            if base_camera is None or VirtualRig.table(base_camera) is None:
+                return False
+            scene.camera = VirtualRig.proxy(base_camera)
+        elif cameraName not in scene.objects:
+            return False
+        else:
+            scene.camera = bpy.data.objects[cameraName]
+        base_camera = scene.camera.parent
+
+        views = queueItem.get('views')
+        if sweep:
+            # frames are moved into camera directories once rendered, virtual rig views are
+            # baked with the properties of the main camera already
+            cameras = [] if 'rig' in queueItem else [scene.objects[name] for name in sweep]
+            output_name = base_camera.name
+        elif views:
+            cameras = [scene.objects.get(DEFAULT_CAMERA_NAME + suffix) for suffix in views]
+            if None in cameras:
+                return False
+            MultiView.setup(scene, views)
+            # views are written next to each other, then split into camera directories
+            output_name = base_camera.name
+        else:
+            cameras = [scene.camera]
+            output_name = cameraName
+
+        if scene.copyMainCameraProperties is True:
+            for camera in cameras:
+                OutputOTRenderMultiCameras.copy_main_camera_properties(camera)
+        if 'rig' in queueItem and not sweep and not VirtualRig.place(scene.camera, cameraName):
+            return False
+        if scene.autoBorder is True and sweep:
+            AutoBorder.setup(scene, base_camera, sweep, [queueItem['frame']])
+        elif scene.autoBorder is True:
+            cameraNames = [DEFAULT_CAMERA_NAME + suffix for suffix in views] if views else [cameraName]
+            AutoBorder.setup(scene, base_camera, cameraNames,
+                             range(queueItem['frameStart'], queueItem['frameEnd'] + 1, scene.frame_step))
+        if queueItem.get('budget') is not None or scene.name in RenderBudget.saved:
+            RenderBudget.apply(scene, queueItem.get('budget'))
+
+        # set output file path as base path + camera name
+        output_dir = scene.render.filepath
+        os.makedirs(os.path.join(output_dir, output_name), exist_ok=True)
+        scene.render.filepath = os.path.join(output_dir, output_name, '')
+        RenderManifest.start_job(scene, queueItem)
+        # unchanged frame range keeps persistent render data valid
+        if scene.frame_start != queueItem['frameStart']:
+            scene.frame_start = queueItem['frameStart']
+        if scene.frame_end != queueItem['frameEnd']:
+            scene.frame_end = queueItem['frameEnd']
+        return True
+
+    @staticmethod
+    def output_files(scene, queueItem):
+        # final output files of a queue item per frame, the same paths setup_job and finish_job produce
+        if queueItem.get('sweep'):
+            return SweepRender.output_files(scene, queueItem)
+        render = scene.render
+        base_output_path = scene.baseOutputPath or render.filepath
+        views = queueItem.get('views')
+        if views and (scene.multiViewOutput != 'EXR' or render.image_settings.file_format not in MultiView.EXR_FORMATS):
+            output_names = [DEFAULT_CAMERA_NAME + suffix for suffix in views]
+        elif views:
+            output_names = [bpy.data.objects[queueItem['camera']].parent.name]
+        else:
+            output_names = [queueItem['camera']]
+
+        saved = render.filepath, scene.frame_start, scene.frame_end
+        if OUTPUT_PT_multicam_panel.isVideoRender(render.image_settings.file_format):
+            # movie file names contain the frame range
+            scene.frame_start = queueItem['frameStart']
+            scene.frame_end = queueItem['frameEnd']
+            frames = [queueItem['frameStart']]
+        else:
+            frames = range(queueItem['frameStart'], queueItem['frameEnd'] + 1, scene.frame_step)
+
+        files = {}
+        for output_name in output_names:
+            render.filepath = os.path.join(base_output_path, output_name, '')
+            for frame in frames:
+                files.setdefault(str(frame), []).append(render.frame_path(frame=frame))
+        render.filepath, start, end = saved
+        if (scene.frame_start, scene.frame_end) != (start, end):
+            scene.frame_start = start
+            scene.frame_end = end
+        return files
+
+    @staticmethod
+    def copy_main_camera_properties(camera):
+        # copy camera properties from base camera
+        previous_data = camera.data
+        camera.data = camera.parent.data.copy()
+        if previous_data.users == 0:
+            bpy.data.cameras.remove(previous_data)
+
+    @staticmethod
+    def finish_job(scene, queueItem):
+        # clean up after a rendered queue item
+        if SyncTimer.active:
+            SyncTimer.report(queueItem)
+        if queueItem.get('views'):
+            if scene.render.image_settings.views_format == 'INDIVIDUAL':
+                MultiView.split_views(scene, queueItem)
+            MultiView.restore(scene)
+        if queueItem.get('sweep'):
+            SweepRender.split(scene, queueItem)
+        RenderManifest.finish_job(scene, queueItem)
+        RenderBudget.finish_job(scene, queueItem)
+        RenderTelemetry.finish_job(scene, queueItem)
+        PostRender.finish_job(scene, queueItem)
+        scene.camera = scene.camera.parent  # restore base camera
+
+    @staticmethod
+    def restore_scene(scene):
+        scene.renderQueueDone = 0
+        scene.renderQueueTotal = 0
+        scene.cancelRender = False
+        scene.rendering = False
+        # restore base output path
+        scene.render.filepath = scene.baseOutputPath
+        scene.baseOutputPath = ""
+        # restore selected frame range
+        scene.frame_start = scene.baseStartFrame
+        scene.frame_end = scene.baseEndFrame
+        scene.render.use_persistent_data = scene.basePersistentData
+        SyncTimer.stop()
+        StaticFrames.finish(scene)
+        PostRender.stop(scene)
+        RenderManifest.stop()
+        RenderTelemetry.stop()
+
+        MultiView.restore(scene)
+        AutoBorder.restore(scene)
+        RenderBudget.restore(scene)
+        SweepRender.restore(scene)
+
+        # restore base camera
+        currentCamera = scene.camera
+        if currentCamera is not None and currentCamera.multicam_child:
+            scene.camera = currentCamera.parent
+        VirtualRig.remove_proxies()
+
+    def execute(self, context):
+        scene = context.scene
+        renderQueue = self.build_queue(scene)
+        if not renderQueue:
+            self.report({'WARNING'}, "No cameras to render")
+            return {'CANCELLED'}
+
+        if scene.budgetTime > 0 and not RenderBudget.timed(scene):
+            self.report({'WARNING'}, "The render engine has no samples, the time budget is ignored")
+        if RenderBudget.timed(scene):
+            # pilot renders are rendered by the queue first, the queue itself starts once they are timed
+            self._queue = renderQueue
+            RenderBudget.start_pilots(context, renderQueue)
+            self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+            context.window_manager.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
+        return self.start(context, RenderBudget.plan(scene, renderQueue, timed=False))
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or RenderQueue.active:
+            return {'PASS_THROUGH'}
+        context.window_manager.event_timer_remove(self._timer)
+        renderQueue, summary = RenderBudget.finish_pilots(context.scene, self._queue)
+        if renderQueue is None:
+            self.report({'WARNING'}, summary)
+            return {'CANCELLED'}
+        self.report({'INFO'}, summary)
+        return self.start(context, renderQueue)
+
+    def start(self, context, renderQueue):
+        # render queue items planned with their budgets
+        scene = context.scene
+        CameraExport.write(scene, renderQueue, scene.exportCameras)
+        fullQueue = renderQueue
+        renderQueue = RenderManifest.start(scene, renderQueue, resume=scene.resumeRender)
+        if scene.skipStaticFrames != 'NONE':
+            renderQueue = StaticFrames.plan(scene, renderQueue)
+        PostRender.start(scene, fullQueue, renderQueue)
+        if not renderQueue:
+            StaticFrames.finish(scene)
+            PostRender.stop(scene)
+            RenderManifest.stop()
+            self.report({'INFO'}, "All queue items are already rendered")
+            return {'FINISHED'}
+
+        RenderQueue.start(context, renderQueue)
+        skipped = ", " + str(len(StaticFrames.copies)) + " unchanged frames skipped" if StaticFrames.copies else ""
+        self.report({"INFO"}, "Rendering " + str(len(renderQueue)) + " queue items" + skipped)
+        return {'FINISHED'}
+
+
+class OutputOTRenderPreview(bpy.types.Operator):
+    bl_label = 'Render Preview Sheet'
+    bl_idname = 'multicam.render_preview'
+    bl_description = 'Quickly render every camera of the rig at low quality into one labelled image'
+    bl_options = {'REGISTER'}
+
+    IMAGE_NAME = "Multicam preview"
+    FILE_NAME = "multicam_preview.png"
+    # (path from the scene, property) of settings changed for the preview
+    SETTINGS = (("render", "engine"), ("render", "resolution_percentage"), ("render", "filepath"),
+                ("render", "use_border"), ("render.image_settings", "file_format"),
+                ("render.image_settings", "color_mode"), ("cycles", "samples"), ("eevee", "taa_render_samples"))
+
+    @classmethod
+    def poll(cls, context):
+        return not RenderQueue.active and context.scene.camera is not None
+
+    @classmethod
+    def preview_settings(cls, scene, directory):
+        saved = {}
+        for path, attr in cls.SETTINGS:
+            try:
+                owner = scene.path_resolve(path)
+            except ValueError:
+                # render engine add-on not enabled
+                continue
+            saved[path, attr] = getattr(owner, attr)
+        render = scene.render
+        if scene.previewEngine == 'WORKBENCH':
+            render.engine = 'BLENDER_WORKBENCH'
+        elif ("cycles", "samples") in saved and render.engine == 'CYCLES':
+            scene.cycles.samples = scene.previewSamples
+        elif ("eevee", "taa_render_samples") in saved:
+            scene.eevee.taa_render_samples = scene.previewSamples
+        render.resolution_percentage = scene.previewResolution
+        render.use_border = False
+        render.image_settings.file_format = 'PNG'
+        render.image_settings.color_mode = 'RGBA'
+        render.filepath = os.path.join(directory, '')
+        return saved
+
+    @staticmethod
+    def load_tile(path):
+        # rendered file as top down RGBA array, None if it was not written
+        if not os.path.exists(path):
+            return None
+        image = bpy.data.images.load(path)
+        try:
+            width, height = image.size
+            pixels = np.empty(width * height * 4, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+        finally:
+            bpy.data.images.remove(image)
+        return np.flipud(pixels.reshape(height, width, 4))
+
+    @classmethod
+    def render_sheet(cls, scene, base_camera):
+        """Render all cameras of the rig as one animation and assemble them, returns the sheet image."""
+        _, cameraNames, _, rig = OutputOTRenderMultiCameras.rig_views(base_camera)
+        if not cameraNames:
+            return None
+        queueItem = OutputOTRenderMultiCameras.sweep_job(scene, base_camera, cameraNames, rig)
+        output_dir = os.path.dirname(bpy.path.abspath(scene.render.filepath))
+        directory = tempfile.mkdtemp(prefix="multicam_preview_")
+        saved = cls.preview_settings(scene, directory)
+        saved_frames = scene.frame_start, scene.frame_end
+        try:
+            if not SweepRender.setup(scene, base_camera, queueItem):
+                return None
+            scene.frame_start, scene.frame_end = queueItem['frameStart'], queueItem['frameEnd']
+            bpy.ops.render.render(animation=True, scene=scene.name)
+            tiles = [cls.load_tile(scene.render.frame_path(frame=frame))
+                     for frame in range(queueItem['frameStart'], queueItem['frameEnd'] + 1)]
+        finally:
+            SweepRender.restore(scene)
+            VirtualRig.remove_proxies()
+            scene.camera = base_camera
+            scene.frame_start, scene.frame_end = saved_frames
+            for (path, attr), value in saved.items():
+                setattr(scene.path_resolve(path), attr, value)
+            shutil.rmtree(directory, ignore_errors=True)
+
+        columns = base_camera.matrix_horizontal_amount if base_camera.camera_type == 'MATRIX' else None
+        # cameras are labelled by their suffix, e.g. Y0_X1
+        labels = [cameraName[len(DEFAULT_CAMERA_NAME) + 1:] if cameraName.startswith(DEFAULT_CAMERA_NAME + '_')
+                  else cameraName for cameraName in cameraNames]
+        sheet = contact_sheet.assemble(tiles, labels, columns)
+
+        image = bpy.data.images.get(cls.IMAGE_NAME)
+        if image is not None:
+            bpy.data.images.remove(image)
+        image = bpy.data.images.new(cls.IMAGE_NAME, sheet.shape[1], sheet.shape[0], alpha=True)
+        image.pixels.foreach_set(np.flipud(sheet).ravel())
+        os.makedirs(output_dir, exist_ok=True)
+        image.filepath_raw = os.path.join(output_dir, cls.FILE_NAME)
+        image.file_format = 'PNG'
+        image.save()
+        return image
+
+    def execute(self, context):
+        base_camera = CameraUtils.get_base_camera(context)
+        try:
+            image = self.render_sheet(context.scene, base_camera)
+        except RuntimeError as error:
+            self.report({'ERROR'}, "Preview render failed: " + str(error))
+            return {'CANCELLED'}
+        if image is None:
+            self.report({'WARNING'}, "No cameras to preview")
+            return {'CANCELLED'}
+
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'IMAGE_EDITOR':
+                    area.spaces.active.image = image
+        self.report({'INFO'}, "Preview sheet saved to " + image.filepath_raw)
+        return {'FINISHED'}
+
+
+class OutputOTExportCameras(bpy.types.Operator):
+    bl_label = 'Export Cameras'
+    bl_idname = 'multicam.export_cameras'
+    bl_description = 'Write the camera poses and intrinsics of the render queue without rendering'
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return not RenderQueue.active and bool(context.scene.exportCameras)
+
+    def execute(self, context):
+        scene = context.scene
+        # budgets change the image size, their samples do not matter here
+        renderQueue = RenderBudget.plan(scene, OutputOTRenderMultiCameras.build_queue(scene), timed=False)
+        count = CameraExport.write(scene, renderQueue, scene.exportCameras)
+        if not count:
+            self.report({'WARNING'}, "No cameras to export")
+            return {'CANCELLED'}
+        self.report({'INFO'}, "Exported " + str(count) + " views to " + RenderManifest.directory(scene))
+        return {'FINISHED'}
+
+
+class OutputOTSubmitSpool(bpy.types.Operator):
+    bl_label = 'Submit to Spool'
+    bl_idname = 'multicam.submit_spool'
+    bl_description = 'Write the render queue as job files into the spool directory, for render nodes to claim'
+    bl_options = {'REGISTER'}
+
+    @classmethod
+    def poll(cls, context):
+        return not RenderQueue.active and bool(context.scene.spoolDirectory)
+
+    def execute(self, context):
+        scene = context.scene
+        renderQueue = OutputOTRenderMultiCameras.build_queue(scene)
+        if not renderQueue:
+            self.report({'WARNING'}, "No cameras to render")
+            return {'CANCELLED'}
+
+        if scene.budgetTime > 0 and not RenderBudget.timed(scene):
+            self.report({'WARNING'}, "The render engine has no samples, the time budget is ignored")
+        if RenderBudget.timed(scene):
+            # the spooled jobs carry budgets fitted to pilot renders of this machine
+            self._queue = renderQueue
+            RenderBudget.start_pilots(context, renderQueue)
+            self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+            context.window_manager.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
+        return self.submit(context, RenderBudget.plan(scene, renderQueue, timed=False))
+
+    def modal(self, context, event):
+        if event.type != 'TIMER' or RenderQueue.active:
+            return {'PASS_THROUGH'}
+        context.window_manager.event_timer_remove(self._timer)
+        renderQueue, summary = RenderBudget.finish_pilots(context.scene, self._queue)
+        if renderQueue is None:
+            self.report({'WARNING'}, summary)
+            return {'CANCELLED'}
+        self.report({'INFO'}, summary)
+        return self.submit(context, renderQueue)
+
+    def submit(self, context, renderQueue):
+        # write queue items planned with their budgets into the spool
+        scene = context.scene
+        CameraExport.write(scene, renderQueue, scene.exportCameras)
+        # workers journal into the manifest, so the spooled queue can be resumed like any other
+        renderQueue = RenderManifest.start(scene, renderQueue, resume=scene.resumeRender)
+        RenderManifest.stop()
+        if not OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format):
+            renderQueue = pool.split_jobs(renderQueue, scene.spoolChunkSize, scene.frame_step)
+        directory = bpy.path.abspath(scene.spoolDirectory)
+        spool.Spool(directory).submit(renderQueue)
+        if PostRender.enabled(scene):
+            # workers only see their own jobs
+            self.report({'WARNING'}, "Submitted " + str(len(renderQueue)) + " queue items to " + directory
+                        + ", post-render work is left to the workers (--convert only)")
+            return {'FINISHED'}
+        self.report({'INFO'}, "Submitted " + str(len(renderQueue)) + " queue items to " + directory)
+        return {'FINISHED'}
+
+
+class OutputOTCancelRendering(bpy.types.Operator):
+    bl_label = 'Cancel'
+    bl_idname = 'multicam.cancel_rendering'
+    bl_description = 'Cancel rendering queue'
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        context.scene.cancelRender = True
+        # queue stops once the current render finishes
+        if not context.scene.rendering:
+            RenderQueue.schedule_next()
+        return {'FINISHED'}
+
+
+class ObjectOTSetSingleCamera(bpy.types.Operator):
+    bl_label = 'Set Single Camera'
+    bl_idname = 'multicam.set_single_camera'
+    bl_description = 'Setup the Camera'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        self.set_camera(context)
+        return {'FINISHED'}
+
+    @classmethod
+    def set_camera(cls, context):
+        CameraUtils.reset_multicamera(context)
+
+        return {'FINISHED'}
+
+
+class ObjectOTSetStereoCameras(bpy.types.Operator):
+    bl_label = 'Set Stereo Cameras'
+    bl_idname = 'multicam.set_stereo_cameras'
+    bl_description = 'Setup the Cameras'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        self.set_camera(context)
+        return {'FINISHED'}
+
+    @classmethod
+    def set_camera(cls, context):
+        base_camera = CameraUtils.get_base_camera(context)
+        rig = layout.stereo(base_camera.cameras_spacing,
+                            base_camera.stereo_focal_distance, base_camera.is_convergent)
+        CameraUtils.apply_layout(context, rig)
+
+        # select the center camera (object mode)
+        bpy.ops.object.select_all(action='DESELECT')
+        base_camera.select_set(True)
+
+        return {'FINISHED'}
+
+
+class ObjectOTSetMatrixCameras(bpy.types.Operator):
+    bl_label = 'Set Matrix Cameras'
+    bl_idname = 'multicam.set_matrix_cameras'
+    bl_description = 'Setup the Cameras'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        self.set_camera(context)
+        return {'FINISHED'}
+
+    @classmethod
+    def set_camera(cls, context):
+        base_camera = CameraUtils.get_base_camera(context)
+
+        rig = layout.matrix(base_camera.matrix_horizontal_amount, base_camera.matrix_vertical_amount,
+                            base_camera.matrix_horizontal_distance, base_camera.matrix_vertical_distance)
+        CameraUtils.apply_layout(context, rig)
+
+        return {'FINISHED'}
+
+
+class ObjectOTSetMeshCameras(bpy.types.Operator):
+    bl_label = 'Set Mesh Cameras'
+    bl_idname = 'multicam.set_mesh_cameras'
+    bl_description = 'Setup the Cameras'
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        self.set_camera(context)
+        return {'FINISHED'}
+
+    @staticmethod
+    def track_camera_to_object(camera, target):
+        # reuse the constraint of a synced camera instead of stacking a new one
+        track_to = next((c for c in camera.constraints if c.type == 'TRACK_TO'), None)
+        if track_to is None:
+            track_to = camera.constraints.new('TRACK_TO')
+        if track_to.target != target:
+            track_to.target = target
+        track_to.track_axis = 'TRACK_NEGATIVE_Z'
+        track_to.up_axis = 'UP_Y'
+
+    @staticmethod
+    def target_points(context, target, fit):
+        # world space points to keep in frame, mesh vertices come from the evaluated mesh
+        matrix = np.array(target.matrix_world)
+        points = np.array(target.bound_box)
+        if fit == 'VERTICES' and target.type == 'MESH':
+            mesh = target.evaluated_get(context.evaluated_depsgraph_get()).data
+            if len(mesh.vertices):
+                points = np.empty(len(mesh.vertices) * 3)
+                mesh.vertices.foreach_get("co", points)
+                points = points.reshape(-1, 3)
+        return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+    @staticmethod
+    def target_surface(context, target):
+        # world space vertices, polygons, face centers, normals and areas of the evaluated mesh
+        if target.type != 'MESH':
+            return None
+        target_eval = target.evaluated_get(context.evaluated_depsgraph_get())
+        mesh = target_eval.to_mesh()
+        try:
+            if not len(mesh.polygons):
+                return None
+            verts = np.empty(len(mesh.vertices) * 3)
+            mesh.vertices.foreach_get("co", verts)
+            loop_starts = np.empty(len(mesh.polygons), dtype=np.int32)
+            mesh.polygons.foreach_get("loop_start", loop_starts)
+            loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+            mesh.loops.foreach_get("vertex_index", loop_verts)
+            centers = np.empty(len(mesh.polygons) * 3)
+            mesh.polygons.foreach_get("center", centers)
+            normals = np.empty(len(mesh.polygons) * 3)
+            mesh.polygons.foreach_get("normal", normals)
+            areas = np.empty(len(mesh.polygons))
+            mesh.polygons.foreach_get("area", areas)
+        finally:
+            target_eval.to_mesh_clear()
+
+        matrix = np.array(target.matrix_world)
+        verts = verts.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        centers = centers.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+        polygons = [face.tolist() for face in np.split(loop_verts, loop_starts[1:])]
+        # normals and areas of planar faces transform with the cofactor matrix
+        normals = normals.reshape(-1, 3) @ np.linalg.inv(matrix[:3, :3])
+        scale = np.linalg.norm(normals, axis=1)
+        normals /= np.maximum(scale, 1e-12)[:, None]
+        areas *= abs(np.linalg.det(matrix[:3, :3])) * scale
+        return verts, polygons, centers, normals, areas
+
+    @staticmethod
+    def visible_faces(verts, polygons, centers, normals, locations):
+        # (C, F) mask of faces seen from each location: turned towards it and not occluded,
+        # rays go from the faces to the camera so only faces facing it are cast
+        visible = coverage.facing(locations, centers, normals)
+        bvh = BVHTree.FromPolygons(verts.tolist(), polygons)
+        ray_cast = bvh.ray_cast
+        # start off the surface, so a ray doesn't hit its own face
+        epsilon = 1e-4 * np.linalg.norm(verts.max(axis=0) - verts.min(axis=0))
+        for candidate, location in enumerate(locations):
+            faces = np.flatnonzero(visible[candidate])
+            origins = centers[faces] + normals[faces] * epsilon
+            directions = location - origins
+            distances = np.linalg.norm(directions, axis=1)
+            visible[candidate, faces] = [ray_cast(origin, direction, distance)[0] is None for origin, direction, distance
+                                         in zip(origins.tolist(), directions.tolist(), distances.tolist())]
+        return visible
+
+    @classmethod
+    def coverage_rig(cls, context, base_camera, target):
+        # candidates framing the whole target from evenly spread directions,
+        # reduced to the fewest of them which see the wanted share of its surface
+        surface = cls.target_surface(context, target)
+        if surface is None:
+            base_camera.mesh_coverage_result = 0.0
+            return layout.Layout([], np.zeros((0, 3)), np.zeros((0, 3)))
+        verts, polygons, centers, normals, areas = surface
+
+        directions = layout.fibonacci_sphere(base_camera.mesh_coverage_candidates)
+        candidates = layout.Layout([''] * len(directions), np.zeros_like(directions),
+                                   layout.look_at(directions, (0.0, 0.0, 0.0)))
+        candidates = cls.frame_target(context, candidates, base_camera, verts)
+
+        visible = cls.visible_faces(verts, polygons, centers, normals, candidates.locations)
+        chosen, seen = coverage.greedy_cover(visible, areas, base_camera.mesh_coverage_percentage / 100)
+        base_camera.mesh_coverage_result = seen * 100
+        return layout.Layout(['_' + str(i) for i in range(len(chosen))],
+                             candidates.locations[chosen], candidates.rotations[chosen])
+
+    @staticmethod
+    def frame_target(context, rig, base_camera, points):
+        # place every camera of the rig as close to the target points as its frame allows,
+        # computed from the camera settings instead of the viewport
+        render = context.scene.render
+        cam = base_camera.data
+        aspect = (render.resolution_x * render.pixel_aspect_x) / (render.resolution_y * render.pixel_aspect_y)
+        angle = {'AUTO': cam.angle, 'HORIZONTAL': cam.angle_x, 'VERTICAL': cam.angle_y}[cam.sensor_fit]
+        tan_x, tan_y = layout.frustum_tangents(angle, cam.sensor_fit, aspect)
+
+        locations = layout.frame_points(rig.rotations, points, tan_x, tan_y,
+                                        cam.shift_x, cam.shift_y, cam.clip_start)
+        return rig._replace(locations=locations)
+
+    @classmethod
+    def set_camera(cls, context):
+        scene = context.scene
+        base_camera = CameraUtils.get_base_camera(context)
+
+        target = bpy.data.objects.get(base_camera.target_object)
+
+        if not target:
+            CameraUtils.sync_child_cameras(context, ())
+            VirtualRig.clear(base_camera)
+            return {'FINISHED'}
+
+        radius = base_camera.radius
+        target_pos = target.matrix_world.translation
+
+        if base_camera.pattern_type == "ORBIT":
+            rig = layout.orbit(base_camera.mesh_orbit_cameras_amount, radius,
+                               base_camera.orbit_rotation_offset,
+                               base_camera.orbit_tilt_x, base_camera.orbit_tilt_y, target_pos)
+        if base_camera.pattern_type == "SPHERE":
+            rig = layout.sphere(base_camera.mesh_sphere_cameras_amount, radius, target_pos)
+        if base_camera.pattern_type in LookAtBaker.BAKED_PATTERNS:
+            # the layout rotations already look at the target
+            children = CameraUtils.apply_layout(context, rig, world_space=True)
+            if base_camera.mesh_baked_orientation or base_camera.virtual_rig:
+                for cam_obj in children:
+                    cam_obj.constraints.clear()
+                LookAtBaker.track(base_camera, target)
+            else:
+                for cam_obj in children:
+                    cls.track_camera_to_object(cam_obj, target)
+                LookAtBaker.forget(base_camera)
+        if base_camera.pattern_type == "OPTIMAL":
+            rig = layout.optimal(base_camera.mesh_optimal_z_rotation_offset,
+                                 base_camera.mesh_optimal_cameras_amount)
+            points = cls.target_points(context, target, base_camera.mesh_optimal_fit)
+            rig = cls.frame_target(context, rig, base_camera, points)
+        if base_camera.pattern_type == "COVERAGE":
+            rig = cls.coverage_rig(context, base_camera, target)
+        if base_camera.pattern_type in ("OPTIMAL", "COVERAGE"):
+            children = CameraUtils.apply_layout(context, rig, world_space=True)
+            for cam_obj in children:
+                # cameras reused from the sphere pattern still track the target
+                cam_obj.constraints.clear()
+
+        scene.camera = base_camera
+
+        return {'FINISHED'}
+
+
+classes = (
+    OBJECT_PT_multicam_panel,
+    ObjectOTSetSingleCamera,
+    ObjectOTSetStereoCameras,
+    ObjectOTSetMatrixCameras,
+    ObjectOTSetMeshCameras,
+    OutputOTRenderMultiCameras,
+    OutputOTRenderPreview,
+    OutputOTExportCameras,
+    OutputOTSubmitSpool,
+    OutputOTCancelRendering,
+    OUTPUT_PT_multicam_panel
+)
+
+
+def register():
+    for c in classes:
+        bpy.utils.register_class(c)
+    VirtualRig.register()
+    LookAtBaker.register()
+
+
+def unregister():
+    RigUpdateScheduler.cancel()
+    LookAtBaker.unregister()
+    VirtualRig.unregister()
+    for c in classes:
+        bpy.utils.unregister_class(c)
@@ -0,0 +1,126 @@
+"""Per-camera render budgets derived from camera importance, independent of bpy.
+
+A budget holds the settings a job renders with, None keeps the setting of the scene:
+'resolution' in percent of the scene resolution, 'samples', 'simplify' as the highest subdivision
+level and 'denoise'. Importance weights run from 0 for the least to 1 for the most important camera.
+"""
+
+import numpy as np
+
+KEYS = ('resolution', 'samples', 'simplify', 'denoise')
+
+
+def distance_weights(positions):
+    """1 for the cameras closest to the rig centre down to 0 for the farthest ones."""
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    if not len(positions):
+        return np.ones(0)
+    distances = np.linalg.norm(positions - positions.mean(axis=0), axis=1)
+    near, far = distances.min(), distances.max()
+    # cameras on a sphere or orbit around the centre are all equally important
+    if far - near < 1e-9:
+        return np.ones(len(positions))
+    return (far - distances) / (far - near)
+
+
+def coverage_weights(projected):
+    """Share of the frame covered by the bounds of projected points (N, M, 3) in front of each camera,
+    relative to the camera covering the most. Cameras not seeing any point weigh 0."""
+    x, y, depth = projected[..., 0], projected[..., 1], projected[..., 2]
+    visible = depth > 0
+    inf = np.inf
+    low_x = np.clip(np.where(visible, x, inf).min(axis=1), 0.0, 1.0)
+    low_y = np.clip(np.where(visible, y, inf).min(axis=1), 0.0, 1.0)
+    high_x = np.clip(np.where(visible, x, -inf).max(axis=1), 0.0, 1.0)
+    high_y = np.clip(np.where(visible, y, -inf).max(axis=1), 0.0, 1.0)
+    areas = np.where(visible.any(axis=1), np.maximum(high_x - low_x, 0) * np.maximum(high_y - low_y, 0), 0.0)
+    if areas.max(initial=0.0) <= 0:
+        return np.ones(len(areas))
+    return areas / areas.max()
+
+
+def weighted_budgets(weights, samples=None, min_samples=1, min_resolution=50, simplify=None, simplify_drop=0,
+                     denoise=False):
+    """Budgets scaling from the minimums at weight 0 to the full settings at weight 1.
+
+    samples is the full sample count, None for engines without samples; simplify the full subdivision
+    level, of which the least important cameras drop simplify_drop levels. With denoise, cameras
+    rendering fewer than the full samples are denoised.
+    """
+    budgets = []
+    for weight in np.clip(np.asarray(weights, dtype=float), 0.0, 1.0).tolist():
+        camera_budget = dict.fromkeys(KEYS)
+        camera_budget['resolution'] = int(round(min_resolution + (100 - min_resolution) * weight))
+        if samples is not None:
+            low = min(min_samples, samples)
+            camera_budget['samples'] = max(1, int(round(low + (samples - low) * weight)))
+            if denoise and camera_budget['samples'] < samples:
+                camera_budget['denoise'] = True
+        if simplify is not None and simplify_drop:
+            level = max(0, simplify - int(round(simplify_drop * (1 - weight))))
+            # cameras at the full level leave simplify as the scene has it
+            camera_budget['simplify'] = level if level < simplify else None
+        budgets.append(camera_budget)
+    return budgets
+
+
+def combine(budgets):
+    """Budget of one render of several cameras: the largest of each setting, denoised only if all are."""
+    if not budgets:
+        return None
+    combined = {}
+    for key in KEYS:
+        values = [camera_budget[key] for camera_budget in budgets]
+        if None in values:
+            combined[key] = None
+        elif key == 'denoise':
+            combined[key] = all(values)
+        else:
+            combined[key] = max(values)
+    return combined
+
+
+def fit_timing(samples, seconds):
+    """(fixed, per sample) seconds of a frame fitted to pilot renders at different sample counts."""
+    samples = np.asarray(samples, dtype=float)
+    seconds = np.asarray(seconds, dtype=float)
+    if len(samples) < 2 or np.ptp(samples) == 0:
+        return 0.0, float(seconds.mean() / max(samples.mean(), 1.0))
+    per_sample, fixed = np.polyfit(samples, seconds, 1)
+    # timing noise must not turn into negative costs
+    per_sample = max(float(per_sample), 1e-6)
+    return max(float(fixed), 0.0), per_sample
+
+
+def estimate_seconds(samples, frames, pixels, fixed, per_sample):
+    """Render time of cameras rendering frames (N,) at samples (N,), pixels relative to the pilot render."""
+    samples, frames, pixels = (np.asarray(value, dtype=float) for value in (samples, frames, pixels))
+    return float(np.sum(frames * pixels * (fixed + per_sample * samples)))
+
+
+def distribute_samples(weights, frames, pixels, fixed, per_sample, total_seconds, min_samples, max_samples):
+    """Samples (N,) proportional to weights and between min_samples and max_samples, as many as
+    the estimated time of all frames fits into total_seconds. Cameras keep min_samples when even that
+    exceeds the budget."""
+    weights = np.clip(np.asarray(weights, dtype=float), 0.0, 1.0)
+    min_samples = min(min_samples, max_samples)
+
+    def samples_at(scale):
+        return np.clip(scale * weights, min_samples, max_samples)
+
+    def cost(scale):
+        return estimate_seconds(samples_at(scale), frames, pixels, fixed, per_sample)
+
+    # the largest scale needed to give every weighted camera max_samples
+    high = max_samples / max(weights[weights > 0].min(initial=1.0), 1e-9)
+    if cost(high) <= total_seconds:
+        return np.floor(samples_at(high)).astype(int)
+    low = 0.0
+    for _ in range(60):
+        middle = (low + high) / 2
+        if cost(middle) <= total_seconds:
+            low = middle
+        else:
+            high = middle
+    # rounded down, the budget is not exceeded
+    return np.floor(samples_at(low)).astype(int)
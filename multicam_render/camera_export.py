@@ -0,0 +1,124 @@
+"""Writers of camera poses and intrinsics for reconstruction tools, independent of bpy.
+
+Views are written one at a time as they come, so rigs of any size are streamed to disk.
+Matrices are Blender camera to world matrices (camera looking down -Z with Y up),
+the same convention as transforms.json; COLMAP gets world to camera poses in OpenCV axes.
+"""
+
+import json
+import os
+
+import numpy as np
+
+FORMATS = ('TRANSFORMS', 'COLMAP')
+# Blender / OpenGL camera axes to OpenCV camera axes
+FLIP_YZ = np.diag((1.0, -1.0, -1.0))
+
+
+def pixel_intrinsics(tan_x, tan_y, shift_x, shift_y, width, height):
+    """Focal lengths and principal point (fx, fy, cx, cy) in pixels, origin in the top left corner."""
+    fx = width / 2 / np.asarray(tan_x, dtype=float)
+    fy = height / 2 / np.asarray(tan_y, dtype=float)
+    # shift moves the frame by a fraction of its larger side
+    offset_max = 2 * np.maximum(tan_x, tan_y)
+    cx = width / 2 - fx * np.asarray(shift_x) * offset_max
+    cy = height / 2 + fy * np.asarray(shift_y) * offset_max
+    return fx, fy, cx, cy
+
+
+def matrix_to_quaternion(matrix):
+    """(w, x, y, z) of a rotation matrix (3, 3)."""
+    m = np.asarray(matrix, dtype=float)
+    trace = np.trace(m)
+    if trace > 0:
+        s = 2 * np.sqrt(trace + 1)
+        q = (s / 4, (m[2, 1] - m[1, 2]) / s, (m[0, 2] - m[2, 0]) / s, (m[1, 0] - m[0, 1]) / s)
+    elif m[0, 0] > m[1, 1] and m[0, 0] > m[2, 2]:
+        s = 2 * np.sqrt(1 + m[0, 0] - m[1, 1] - m[2, 2])
+        q = ((m[2, 1] - m[1, 2]) / s, s / 4, (m[0, 1] + m[1, 0]) / s, (m[0, 2] + m[2, 0]) / s)
+    elif m[1, 1] > m[2, 2]:
+        s = 2 * np.sqrt(1 + m[1, 1] - m[0, 0] - m[2, 2])
+        q = ((m[0, 2] - m[2, 0]) / s, (m[0, 1] + m[1, 0]) / s, s / 4, (m[1, 2] + m[2, 1]) / s)
+    else:
+        s = 2 * np.sqrt(1 + m[2, 2] - m[0, 0] - m[1, 1])
+        q = ((m[1, 0] - m[0, 1]) / s, (m[0, 2] + m[2, 0]) / s, (m[1, 2] + m[2, 1]) / s, s / 4)
+    q = np.array(q)
+    # COLMAP expects w >= 0
+    return q if q[0] >= 0 else -q
+
+
+def normalized(matrix):
+    # camera to world matrix without scale
+    matrix = np.array(matrix, dtype=float)
+    matrix[:3, :3] /= np.linalg.norm(matrix[:3, :3], axis=0)
+    return matrix
+
+
+class TransformsWriter:
+    # transforms.json as used by NeRF tools, intrinsics of the first view on top
+    # and per view intrinsics next to each frame
+
+    def __init__(self, path):
+        self.path = path
+        self.directory = os.path.dirname(path)
+        os.makedirs(self.directory, exist_ok=True)
+        self.file = open(path, "w")
+        self.count = 0
+
+    def write(self, view):
+        intrinsics = {'fl_x': view['fx'], 'fl_y': view['fy'], 'cx': view['cx'], 'cy': view['cy'],
+                      'w': view['width'], 'h': view['height']}
+        if self.count == 0:
+            header = dict(camera_angle_x=2 * float(np.arctan(view['width'] / 2 / view['fx'])),
+                          camera_angle_y=2 * float(np.arctan(view['height'] / 2 / view['fy'])), **intrinsics)
+            self.file.write(json.dumps(header)[:-1] + ', "frames": [\n')
+        else:
+            self.file.write(",\n")
+        frame = dict(file_path=os.path.relpath(view['path'], self.directory).replace(os.sep, "/"),
+                     transform_matrix=normalized(view['matrix']).tolist(),
+                     camera=view['camera'], frame=view['frame'], **intrinsics)
+        self.file.write(json.dumps(frame))
+        self.count += 1
+
+    def close(self):
+        if self.count == 0:
+            self.file.write('{"frames": [')
+        self.file.write("\n]}\n")
+        self.file.close()
+
+
+class ColmapWriter:
+    # COLMAP text model: a PINHOLE camera per distinct intrinsics, an image per view, no points
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.cameras = open(os.path.join(directory, "cameras.txt"), "w")
+        self.images = open(os.path.join(directory, "images.txt"), "w")
+        self.cameras.write("# CAMERA_ID, MODEL, WIDTH, HEIGHT, PARAMS[]\n")
+        self.images.write("# IMAGE_ID, QW, QX, QY, QZ, TX, TY, TZ, CAMERA_ID, NAME\n"
+                          "# POINTS2D[] as (X, Y, POINT3D_ID)\n")
+        with open(os.path.join(directory, "points3D.txt"), "w") as points:
+            points.write("# POINT3D_ID, X, Y, Z, R, G, B, ERROR, TRACK[] as (IMAGE_ID, POINT2D_IDX)\n")
+        self.camera_ids = {}
+        self.count = 0
+
+    def camera_id(self, view):
+        key = (view['width'], view['height']) + tuple(round(float(view[k]), 6) for k in ('fx', 'fy', 'cx', 'cy'))
+        if key not in self.camera_ids:
+            self.camera_ids[key] = len(self.camera_ids) + 1
+            self.cameras.write("%d PINHOLE %d %d %r %r %r %r\n" % ((self.camera_ids[key],) + key))
+        return self.camera_ids[key]
+
+    def write(self, view):
+        camera_to_world = normalized(view['matrix'])
+        rotation = FLIP_YZ @ camera_to_world[:3, :3].T
+        translation = -rotation @ camera_to_world[:3, 3]
+        values = tuple(matrix_to_quaternion(rotation).tolist()) + tuple(translation.tolist())
+        self.count += 1
+        name = os.path.relpath(view['path'], os.path.dirname(self.directory)).replace(os.sep, "/")
+        self.images.write("%d %r %r %r %r %r %r %r %d %s\n\n" % ((self.count,) + values + (self.camera_id(view), name)))
+
+    def close(self):
+        self.cameras.close()
+        self.images.close()
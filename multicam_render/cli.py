@@ -0,0 +1,445 @@
+"""Headless rendering of a multicam rig.
+
+Usage:
+    blender -b scene.blend -P multicam_render/cli.py -- [--rig CAMERA] [--frames 1-250] [--frame-by-frame]
+        [--workers N]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import bpy
+
+EXIT_OK = 0
+EXIT_RENDER_FAILED = 1
+# same as argparse uses for invalid arguments
+EXIT_USAGE = 2
+
+
+def parse_frames(value):
+    # "10" or "1-250"
+    start, _, end = value.partition('-')
+    try:
+        start = int(start)
+        end = int(end) if end else start
+    except ValueError:
+        raise argparse.ArgumentTypeError("frames must be N or START-END, got " + repr(value))
+    if end < start:
+        raise argparse.ArgumentTypeError("frame range end is before its start")
+    return start, end
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="blender -b scene.blend -P multicam_render/cli.py --",
+        description="Render every camera of a multicam rig in background mode.")
+    parser.add_argument("--scene", help="scene to render, defaults to the active scene")
+    parser.add_argument("--rig", help="base camera of the rig, defaults to the scene camera")
+    parser.add_argument("--frames", type=parse_frames, help="frame or frame range, e.g. 1-250")
+    parser.add_argument("--frame-step", type=int, help="frame step, defaults to the scene frame step")
+    parser.add_argument("--output", help="base output path, defaults to the scene output path")
+    parser.add_argument("--frame-by-frame", dest="frame_by_frame", action="store_true", default=None,
+                        help="render each frame for each camera, then proceed to the next frame")
+    parser.add_argument("--camera-by-camera", dest="frame_by_frame", action="store_false",
+                        help="render all frames for a camera, then proceed to the next camera")
+    parser.add_argument("--sweep", dest="sweep", action="store_true", default=None,
+                        help="render the start frame of a static scene for all cameras as one animation")
+    parser.add_argument("--preview", action="store_true",
+                        help="only render a low quality preview sheet of all cameras into the output directory")
+    parser.add_argument("--order", choices=("DEFAULT", "SERPENTINE", "NEAREST"),
+                        help="order of cameras in the render queue")
+    parser.add_argument("--frame-block", type=int,
+                        help="with --camera-by-camera, render all cameras for blocks of this many frames at a time")
+    parser.add_argument("--no-persistent-data", dest="persistent_data", action="store_false", default=None,
+                        help="do not keep render data between frame by frame jobs")
+    parser.add_argument("--telemetry", choices=("NONE", "JSONL", "CSV"),
+                        help="format of per queue item telemetry written to the output directory")
+    parser.add_argument("--resume", dest="resume", action="store_true", default=None,
+                        help="skip frames already rendered according to the manifest in the output directory")
+    parser.add_argument("--multi-view", dest="multi_view", action="store_true", default=None,
+                        help="render stereo and matrix rigs as a single multi-view render per frame range")
+    parser.add_argument("--auto-border", type=float, metavar="PADDING",
+                        help="render only the frame region covered by the target, with a padding in percent")
+    parser.add_argument("--auto-border-collection", metavar="NAME",
+                        help="with --auto-border, keep the objects of this collection in the region "
+                             "instead of the target")
+    parser.add_argument("--auto-border-crop", dest="auto_border_crop", action="store_true", default=None,
+                        help="with --auto-border, crop the output to the region instead of keeping the full frame")
+    parser.add_argument("--export-cameras", nargs="+", choices=("TRANSFORMS", "COLMAP"),
+                        help="write camera poses and intrinsics of the queue to the output directory")
+    parser.add_argument("--skip-static-frames", choices=("LINK", "COPY"),
+                        help="do not render frames which can not differ from an earlier frame of the same camera, "
+                             "hardlink or copy them instead")
+    parser.add_argument("--convert", choices=("PNG", "JPEG", "WEBP"),
+                        help="convert each rendered file with ffmpeg while the next job renders")
+    parser.add_argument("--encode-videos", dest="encode_videos", action="store_true", default=None,
+                        help="encode a video per camera from its rendered images with ffmpeg")
+    parser.add_argument("--stereo", choices=("SIDE_BY_SIDE", "ANAGLYPH"),
+                        help="composite the left and right views of a stereo rig per frame")
+    parser.add_argument("--no-copy-camera-properties", dest="copy_camera_properties", action="store_false",
+                        default=None, help="keep the camera properties of the rig cameras")
+
+    budgets = parser.add_argument_group("render budgets")
+    budgets.add_argument("--budget", choices=("NONE", "CAMERA", "DISTANCE", "COVERAGE"),
+                         help="render budget of each camera: set on the rig cameras, or by distance from the rig "
+                              "centre or target coverage")
+    budgets.add_argument("--budget-min-resolution", type=int, metavar="PERCENT",
+                         help="resolution of the least important cameras, relative to the scene resolution")
+    budgets.add_argument("--budget-min-samples", type=int, metavar="N",
+                         help="samples of the least important cameras")
+    budgets.add_argument("--time-budget", type=float, metavar="MINUTES",
+                         help="distribute samples so the whole queue renders in about this time, "
+                              "estimated by pilot renders")
+
+    parallel = parser.add_argument_group("parallel rendering")
+    parallel.add_argument("--workers", type=int,
+                          help="render with N background blender processes, 0 picks N from cores and memory")
+    parallel.add_argument("--worker-memory", type=int,
+                          help="expected memory of one worker in MB, defaults to twice the memory of this process")
+    parallel.add_argument("--chunk-size", type=int, default=0,
+                          help="split frame ranges of each camera into chunks of this many frames")
+    parallel.add_argument("--threads", type=int, help="render threads, set for workers by the pool")
+    parallel.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+
+    distributed = parser.add_argument_group("distributed rendering over a shared directory")
+    distributed.add_argument("--spool-submit", metavar="DIR",
+                             help="write the render queue as job files into a spool directory instead of rendering, "
+                                  "split by --chunk-size")
+    distributed.add_argument("--spool", metavar="DIR",
+                             help="render jobs claimed from a spool directory until none are left")
+    distributed.add_argument("--lease", type=float, default=120.0,
+                             help="seconds after which the claim of a worker that stopped renewing it expires")
+    return parser
+
+
+def script_args(argv):
+    # blender passes its own arguments, the script ones follow "--"
+    return argv[argv.index("--") + 1:] if "--" in argv else []
+
+
+def ensure_registered():
+    from multicam_render import addon
+    # importing the add-on already defines its properties, only register() adds the classes and handlers
+    if not hasattr(bpy.types, "OUTPUT_PT_multicam_panel"):
+        addon.register()
+    return addon
+
+
+def configure_scene(args):
+    scene = bpy.data.scenes.get(args.scene) if args.scene else bpy.context.scene
+    if scene is None:
+        raise ValueError("Can not find scene " + args.scene)
+
+    if args.rig:
+        base_camera = scene.objects.get(args.rig)
+        if base_camera is None or base_camera.type != 'CAMERA':
+            raise ValueError("Can not find camera " + args.rig + " in scene!")
+        scene.camera = base_camera
+    if scene.camera is None:
+        raise ValueError("Scene " + scene.name + " has no camera")
+    if scene.camera.multicam_child:
+        scene.camera = scene.camera.parent
+
+    if args.frames:
+        scene.frame_start, scene.frame_end = args.frames
+    if args.frame_step:
+        scene.frame_step = args.frame_step
+    if args.output:
+        scene.render.filepath = args.output
+    if args.frame_by_frame is not None:
+        scene.frameByFrame = args.frame_by_frame
+    if args.sweep is not None:
+        scene.sweepRender = args.sweep
+    if args.order:
+        scene.queueOrder = args.order
+    if args.frame_block is not None:
+        scene.queueFrameBlock = args.frame_block
+    if args.copy_camera_properties is not None:
+        scene.copyMainCameraProperties = args.copy_camera_properties
+    if args.persistent_data is not None:
+        scene.persistentData = args.persistent_data
+    if args.multi_view is not None:
+        scene.multiView = args.multi_view
+    if args.resume is not None:
+        scene.resumeRender = args.resume
+    if args.telemetry:
+        scene.telemetryFormat = args.telemetry
+    if args.auto_border is not None:
+        scene.autoBorder = True
+        scene.autoBorderPadding = args.auto_border
+    if args.auto_border_collection:
+        collection = bpy.data.collections.get(args.auto_border_collection)
+        if collection is None:
+            raise ValueError("Can not find collection " + args.auto_border_collection)
+        scene.autoBorderCollection = collection
+    if args.auto_border_crop is not None:
+        scene.autoBorderCrop = args.auto_border_crop
+    if args.export_cameras:
+        scene.exportCameras = set(args.export_cameras)
+    if args.skip_static_frames:
+        scene.skipStaticFrames = args.skip_static_frames
+    if args.convert:
+        scene.postConvert = args.convert
+    if args.encode_videos is not None:
+        scene.postVideo = args.encode_videos
+    if args.stereo:
+        scene.postStereo = args.stereo
+    if args.budget:
+        scene.budgetRule = args.budget
+    if args.budget_min_resolution is not None:
+        scene.budgetMinResolution = args.budget_min_resolution
+    if args.budget_min_samples is not None:
+        scene.budgetMinSamples = args.budget_min_samples
+    if args.time_budget is not None:
+        scene.budgetTime = args.time_budget
+    if args.threads:
+        scene.render.threads_mode = 'FIXED'
+        scene.render.threads = args.threads
+    return scene
+
+
+def render_queue(scene, renderQueue):
+    # render jobs synchronously, same job setup as the interactive render queue
+    from multicam_render import telemetry
+    from multicam_render.addon import OutputOTRenderMultiCameras, RenderTelemetry
+
+    OutputOTRenderMultiCameras.setup_queue(scene, len(renderQueue))
+    try:
+        for queueItem in renderQueue:
+            if not OutputOTRenderMultiCameras.setup_job(scene, queueItem):
+                print("Can not find camera " + queueItem['camera'] + " in scene!", file=sys.stderr)
+                return EXIT_RENDER_FAILED
+
+            print("Rendering camera: " + queueItem['camera'] + " frames "
+                  + str(queueItem['frameStart']) + "-" + str(queueItem['frameEnd']))
+            bpy.ops.render.render(animation=True, scene=scene.name)
+            OutputOTRenderMultiCameras.finish_job(scene, queueItem)
+            scene.renderQueueDone += 1
+
+            throughput = RenderTelemetry.throughput
+            if throughput.eta is not None:
+                print("Done " + str(scene.renderQueueDone) + " / " + str(len(renderQueue))
+                      + ", %.1f jobs/min, ETA %s" % (throughput.jobs_per_minute, telemetry.format_duration(throughput.eta)))
+    except RuntimeError as error:
+        print("Render failed: " + str(error), file=sys.stderr)
+        return EXIT_RENDER_FAILED
+    finally:
+        OutputOTRenderMultiCameras.restore_scene(scene)
+    return EXIT_OK
+
+
+def render_job(scene, queueItem):
+    # render a single queue item of a worker, False if it can not be rendered
+    from multicam_render.addon import OutputOTRenderMultiCameras
+
+    try:
+        rendered = OutputOTRenderMultiCameras.setup_job(scene, queueItem)
+        if rendered:
+            bpy.ops.render.render(animation=True, scene=scene.name)
+            OutputOTRenderMultiCameras.finish_job(scene, queueItem)
+    except RuntimeError as error:
+        print("Render failed: " + str(error))
+        rendered = False
+    return rendered
+
+
+def render_worker(scene):
+    # pool worker: render json jobs read from stdin until it is closed
+    from multicam_render import pool
+    from multicam_render.addon import OutputOTRenderMultiCameras
+
+    from multicam_render.addon import RenderManifest
+
+    OutputOTRenderMultiCameras.setup_queue(scene, 0)
+    # coordinator wrote the manifest, workers only journal their frames
+    RenderManifest.attach(scene)
+    try:
+        for line in sys.stdin:
+            queueItem = json.loads(line)
+            rendered = render_job(scene, queueItem)
+            marker = pool.DONE_MARKER if rendered else pool.FAILED_MARKER
+            print(marker + json.dumps(queueItem), flush=True)
+    finally:
+        OutputOTRenderMultiCameras.restore_scene(scene)
+    return EXIT_OK
+
+
+def submit_spool(scene, renderQueue, args):
+    from multicam_render import pool, spool
+    from multicam_render.addon import OUTPUT_PT_multicam_panel
+
+    jobs = renderQueue
+    if not OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format):
+        jobs = pool.split_jobs(renderQueue, args.chunk_size, scene.frame_step)
+    spool.Spool(args.spool_submit, lease=args.lease).submit(jobs)
+    print("Submitted " + str(len(jobs)) + " queue items to " + args.spool_submit)
+    return EXIT_OK
+
+
+def render_spool(scene, args):
+    # spool worker: claim and render jobs from the spool directory until it is empty
+    from multicam_render import spool
+    from multicam_render.addon import OutputOTRenderMultiCameras, PostRender, RenderManifest
+
+    work = spool.Spool(args.spool, lease=args.lease)
+    OutputOTRenderMultiCameras.setup_queue(scene, 0)
+    # the submitting process wrote the manifest, workers only journal their frames
+    RenderManifest.attach(scene)
+    # videos and stereo pairs need frames of other workers, files of each job are converted
+    if scene.postVideo or scene.postStereo != 'NONE':
+        print("Spool workers do not encode videos or composite stereo pairs, only --convert is done")
+        scene.postVideo = False
+        scene.postStereo = 'NONE'
+    PostRender.start(scene, [], [])
+    try:
+        done, failed = spool.run_worker(work, lambda queueItem: render_job(scene, queueItem))
+    finally:
+        OutputOTRenderMultiCameras.restore_scene(scene)
+    print("Worker " + work.worker + ": " + str(done) + " jobs done, " + str(failed) + " failed, spool "
+          + json.dumps(work.status()))
+    return EXIT_RENDER_FAILED if failed else EXIT_OK
+
+
+def worker_arguments(scene):
+    # settings of the configured scene as options, workers load the saved blend file without
+    # the overrides of this process; flags only turn settings on or off, so only changes are passed
+    arguments = ["--frames", str(scene.frame_start) + "-" + str(scene.frame_end),
+                 "--frame-step", str(scene.frame_step),
+                 "--frame-by-frame" if scene.frameByFrame else "--camera-by-camera",
+                 "--order", scene.queueOrder, "--frame-block", str(scene.queueFrameBlock),
+                 "--telemetry", scene.telemetryFormat]
+    if not scene.copyMainCameraProperties:
+        arguments.append("--no-copy-camera-properties")
+    if not scene.persistentData:
+        arguments.append("--no-persistent-data")
+    if scene.sweepRender:
+        arguments.append("--sweep")
+    if scene.multiView:
+        arguments.append("--multi-view")
+    if scene.autoBorder:
+        arguments += ["--auto-border", str(scene.autoBorderPadding)]
+        if scene.autoBorderCollection:
+            arguments += ["--auto-border-collection", scene.autoBorderCollection.name]
+        if scene.autoBorderCrop:
+            arguments.append("--auto-border-crop")
+    return arguments
+
+
+def render_parallel(scene, renderQueue, args):
+    from multicam_render import pool
+    from multicam_render.addon import OUTPUT_PT_multicam_panel
+
+    if not bpy.data.filepath:
+        print("Parallel rendering needs a saved blend file", file=sys.stderr)
+        return EXIT_USAGE
+    if bpy.data.is_dirty:
+        print("Warning: workers render the saved blend file, unsaved changes are ignored", file=sys.stderr)
+
+    cpu_count = os.cpu_count() or 1
+    if args.worker_memory:
+        worker_memory = args.worker_memory * 1024 * 1024
+    else:
+        # peak memory of this process with the scene loaded, doubled for render buffers
+        worker_memory = pool.peak_memory() * 2
+    workers = pool.choose_worker_count(args.workers, cpu_count, pool.available_memory(), worker_memory)
+    threads = pool.threads_per_worker(workers, cpu_count)
+
+    command = [bpy.app.binary_path, "-b", bpy.data.filepath, "-P", os.path.abspath(__file__), "--",
+               "--worker", "--scene", scene.name, "--rig", scene.camera.name,
+               "--output", scene.render.filepath, "--threads", str(threads)] + worker_arguments(scene)
+
+    jobs = renderQueue
+    if not OUTPUT_PT_multicam_panel.isVideoRender(scene.render.image_settings.file_format):
+        # video files can not be written in chunks
+        jobs = pool.split_jobs(renderQueue, args.chunk_size, scene.frame_step)
+    print("Rendering " + str(len(jobs)) + " queue items with " + str(workers)
+          + " workers, " + str(threads) + " threads each")
+    failed = pool.WorkerPool(command, workers).run(jobs)
+    for queueItem in failed:
+        print("Failed: " + json.dumps(queueItem), file=sys.stderr)
+    return EXIT_RENDER_FAILED if failed else EXIT_OK
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(script_args(sys.argv if argv is None else argv))
+    addon = ensure_registered()
+
+    try:
+        scene = configure_scene(args)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return EXIT_USAGE
+
+    # the submitting process renders nothing, spool workers only see their own jobs
+    if args.spool_submit and (args.convert or args.encode_videos or args.stereo):
+        print("Post-render options are not available with --spool-submit, pass --convert to the spool workers",
+              file=sys.stderr)
+        return EXIT_USAGE
+    if args.spool and (args.encode_videos or args.stereo):
+        print("--encode-videos and --stereo need the whole queue, spool workers can only --convert",
+              file=sys.stderr)
+        return EXIT_USAGE
+
+    if args.worker:
+        return render_worker(scene)
+    if args.spool:
+        return render_spool(scene, args)
+
+    if args.preview:
+        try:
+            image = addon.OutputOTRenderPreview.render_sheet(scene, scene.camera)
+        except RuntimeError as error:
+            print("Preview render failed: " + str(error), file=sys.stderr)
+            return EXIT_RENDER_FAILED
+        if image is None:
+            print("No cameras to preview", file=sys.stderr)
+            return EXIT_USAGE
+        print("Preview sheet saved to " + image.filepath_raw)
+        return EXIT_OK
+
+    renderQueue = addon.OutputOTRenderMultiCameras.build_queue(scene)
+    if not renderQueue:
+        print("No cameras to render", file=sys.stderr)
+        return EXIT_USAGE
+
+    # budgets are part of the queue items, workers and spool nodes render with them as well
+    renderQueue = addon.RenderBudget.plan(scene, renderQueue)
+    addon.CameraExport.write(scene, renderQueue, scene.exportCameras)
+    fullQueue = renderQueue
+    renderQueue = addon.RenderManifest.start(scene, renderQueue, resume=scene.resumeRender)
+    # skipped frames are linked once the queue is done, which a submitting process does not see
+    if scene.skipStaticFrames != 'NONE' and not args.spool_submit:
+        renderQueue = addon.StaticFrames.plan(scene, renderQueue)
+    if not renderQueue:
+        addon.StaticFrames.finish(scene)
+        addon.RenderManifest.stop()
+        print("All queue items are already rendered")
+        return EXIT_OK
+
+    if args.spool_submit:
+        addon.RenderManifest.stop()
+        return submit_spool(scene, renderQueue, args)
+    if args.workers is not None:
+        addon.RenderManifest.stop()
+        status = render_parallel(scene, renderQueue, args)
+        # workers are done, post-render work of the whole queue runs here, skipped frames
+        # are linked to their rendered frames and handed to it as well
+        addon.PostRender.start(scene, fullQueue, renderQueue)
+        for queueItem in renderQueue:
+            addon.PostRender.finish_job(scene, queueItem)
+        addon.StaticFrames.finish(scene)
+        addon.PostRender.stop(scene)
+    else:
+        addon.PostRender.start(scene, fullQueue, renderQueue)
+        status = render_queue(scene, renderQueue)
+    print("RENDER QUEUE FINISHED" if status == EXIT_OK else "RENDER QUEUE FAILED")
+    return status
+
+
+if __name__ == "__main__":
+    # run as a script by blender -P, make the package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sys.exit(main())
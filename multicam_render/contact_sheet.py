@@ -0,0 +1,98 @@
+"""Contact sheets of rig previews, independent of bpy.
+
+Images are (height, width, 4) float RGBA arrays with the first row at the top.
+Labels use a built-in 5x7 pixel font, so sheets can be assembled in background mode without a GPU.
+"""
+
+import math
+
+import numpy as np
+
+# rows of 5 pixels, most significant bit on the left
+GLYPHS = {
+    '0': (0x0E, 0x11, 0x13, 0x15, 0x19, 0x11, 0x0E),
+    '1': (0x04, 0x0C, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    '2': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x08, 0x1F),
+    '3': (0x1F, 0x02, 0x04, 0x02, 0x01, 0x11, 0x0E),
+    '4': (0x02, 0x06, 0x0A, 0x12, 0x1F, 0x02, 0x02),
+    '5': (0x1F, 0x10, 0x1E, 0x01, 0x01, 0x11, 0x0E),
+    '6': (0x06, 0x08, 0x10, 0x1E, 0x11, 0x11, 0x0E),
+    '7': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x08, 0x08),
+    '8': (0x0E, 0x11, 0x11, 0x0E, 0x11, 0x11, 0x0E),
+    '9': (0x0E, 0x11, 0x11, 0x0F, 0x01, 0x02, 0x0C),
+    'A': (0x0E, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    'B': (0x1E, 0x11, 0x11, 0x1E, 0x11, 0x11, 0x1E),
+    'C': (0x0E, 0x11, 0x10, 0x10, 0x10, 0x11, 0x0E),
+    'D': (0x1C, 0x12, 0x11, 0x11, 0x11, 0x12, 0x1C),
+    'E': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x1F),
+    'F': (0x1F, 0x10, 0x10, 0x1E, 0x10, 0x10, 0x10),
+    'G': (0x0E, 0x11, 0x10, 0x17, 0x11, 0x11, 0x0F),
+    'H': (0x11, 0x11, 0x11, 0x1F, 0x11, 0x11, 0x11),
+    'I': (0x0E, 0x04, 0x04, 0x04, 0x04, 0x04, 0x0E),
+    'J': (0x07, 0x02, 0x02, 0x02, 0x02, 0x12, 0x0C),
+    'K': (0x11, 0x12, 0x14, 0x18, 0x14, 0x12, 0x11),
+    'L': (0x10, 0x10, 0x10, 0x10, 0x10, 0x10, 0x1F),
+    'M': (0x11, 0x1B, 0x15, 0x15, 0x11, 0x11, 0x11),
+    'N': (0x11, 0x11, 0x19, 0x15, 0x13, 0x11, 0x11),
+    'O': (0x0E, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    'P': (0x1E, 0x11, 0x11, 0x1E, 0x10, 0x10, 0x10),
+    'Q': (0x0E, 0x11, 0x11, 0x11, 0x15, 0x12, 0x0D),
+    'R': (0x1E, 0x11, 0x11, 0x1E, 0x14, 0x12, 0x11),
+    'S': (0x0F, 0x10, 0x10, 0x0E, 0x01, 0x01, 0x1E),
+    'T': (0x1F, 0x04, 0x04, 0x04, 0x04, 0x04, 0x04),
+    'U': (0x11, 0x11, 0x11, 0x11, 0x11, 0x11, 0x0E),
+    'V': (0x11, 0x11, 0x11, 0x11, 0x11, 0x0A, 0x04),
+    'W': (0x11, 0x11, 0x11, 0x15, 0x15, 0x15, 0x0A),
+    'X': (0x11, 0x11, 0x0A, 0x04, 0x0A, 0x11, 0x11),
+    'Y': (0x11, 0x11, 0x11, 0x0A, 0x04, 0x04, 0x04),
+    'Z': (0x1F, 0x01, 0x02, 0x04, 0x08, 0x10, 0x1F),
+    '_': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x1F),
+    '-': (0x00, 0x00, 0x00, 0x1F, 0x00, 0x00, 0x00),
+    '.': (0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x0C),
+    ' ': (0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00),
+    '?': (0x0E, 0x11, 0x01, 0x02, 0x04, 0x00, 0x04),
+}
+GLYPH_WIDTH = 5
+GLYPH_HEIGHT = 7
+
+
+def text_mask(text, scale=1):
+    """Boolean mask (7 * scale, 6 * len(text) * scale) of text in upper case, unknown characters as '?'."""
+    columns = []
+    for char in text.upper():
+        rows = GLYPHS.get(char, GLYPHS['?'])
+        glyph = np.array([[(row >> (GLYPH_WIDTH - 1 - bit)) & 1 for bit in range(GLYPH_WIDTH)] for row in rows],
+                         dtype=bool)
+        columns += [glyph, np.zeros((GLYPH_HEIGHT, 1), dtype=bool)]
+    if not columns:
+        return np.zeros((GLYPH_HEIGHT * scale, 0), dtype=bool)
+    return np.kron(np.hstack(columns), np.ones((scale, scale), dtype=bool)).astype(bool)
+
+
+def grid_columns(count, tile_width, tile_height):
+    # about as many columns as rows, measured in pixels
+    return max(1, math.ceil(math.sqrt(count * tile_height / max(tile_width, 1))))
+
+
+def assemble(tiles, labels, columns=None, gap=4, background=(0.1, 0.1, 0.1, 1.0),
+             label_color=(1.0, 1.0, 1.0, 1.0), label_scale=1):
+    """Sheet (height, width, 4) of tiles in rows of columns, each labelled below, missing tiles left empty."""
+    height = max((tile.shape[0] for tile in tiles if tile is not None), default=1)
+    width = max((tile.shape[1] for tile in tiles if tile is not None), default=1)
+    columns = columns or grid_columns(len(tiles), width, height)
+    rows = math.ceil(len(tiles) / columns)
+    label_height = GLYPH_HEIGHT * label_scale + 2 * gap
+    cell_height = height + label_height
+    cell_width = width + gap
+
+    sheet = np.empty((rows * cell_height + gap, columns * cell_width + gap, 4), dtype=np.float32)
+    sheet[:] = background
+    for i, (tile, label) in enumerate(zip(tiles, labels)):
+        top = gap + (i // columns) * cell_height
+        left = gap + (i % columns) * cell_width
+        if tile is not None:
+            sheet[top:top + tile.shape[0], left:left + tile.shape[1]] = tile
+        mask = text_mask(label, label_scale)[:, :width]
+        label_top = top + height + gap
+        sheet[label_top:label_top + mask.shape[0], left:left + mask.shape[1]][mask] = label_color
+    return sheet
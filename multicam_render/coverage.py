@@ -0,0 +1,34 @@
+"""Coverage driven selection of camera views, independent of bpy."""
+
+import numpy as np
+
+
+def facing(locations, centers, normals):
+    """(C, F) mask of the faces turned towards each camera location."""
+    locations = np.asarray(locations, dtype=float)
+    offsets = np.einsum('fi,fi->f', centers, normals)
+    return locations @ np.asarray(normals, dtype=float).T > offsets
+
+
+def greedy_cover(visible, weights, fraction):
+    """Indices of cameras seeing at least fraction of the total weight, picked by greedy set cover,
+    and the fraction they actually see (less when the rest is not visible from any camera)."""
+    visible = np.asarray(visible, dtype=bool)
+    weights = np.asarray(weights, dtype=float)
+    total = weights.sum()
+    if total <= 0:
+        return [], 0.0
+
+    covered = np.zeros(visible.shape[1], dtype=bool)
+    seen = 0.0
+    chosen = []
+    while seen < fraction * total:
+        # weight each camera would add to what is already covered
+        gains = visible @ np.where(covered, 0.0, weights)
+        best = int(np.argmax(gains))
+        if gains[best] <= 0:
+            break
+        chosen.append(best)
+        covered |= visible[best]
+        seen += gains[best]
+    return chosen, float(seen / total)
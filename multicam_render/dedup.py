@@ -0,0 +1,60 @@
+"""Detection of frames rendering the same image as an earlier frame, independent of bpy.
+
+Everything affecting the image of a camera on a frame is hashed into a digest, frames with the
+digest of an earlier frame are not rendered but linked (or copied) from the earlier output file.
+"""
+
+import hashlib
+import os
+import shutil
+
+import numpy as np
+
+MODES = ('LINK', 'COPY')
+# values closer than this are the same state, float noise of evaluation does not count as change
+DECIMALS = 6
+
+
+def digest(*parts, decimals=DECIMALS):
+    """Digest of bytes and numeric arrays, the latter rounded to decimals."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, bytes):
+            hasher.update(part)
+        else:
+            # adding 0.0 turns -0.0 into 0.0
+            hasher.update(np.round(np.asarray(part, dtype=float), decimals).ravel() + 0.0)
+    return hasher.digest()
+
+
+def duplicate_frames(digests):
+    """Frames whose digest equals the one of an earlier frame, mapped to the first frame with it.
+
+    digests is an iterable of (frame, digest) in frame order.
+    """
+    first = {}
+    duplicates = {}
+    for frame, value in digests:
+        if value in first:
+            duplicates[frame] = first[value]
+        else:
+            first[value] = frame
+    return duplicates
+
+
+def materialize(source, target, mode='LINK'):
+    """Make target a hardlink to source (falling back to a copy on file systems without links)
+    or a copy of it, replacing target at once. Returns the mode used."""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = target + ".tmp"
+    if os.path.lexists(temp_path):
+        os.remove(temp_path)
+    if mode == 'LINK':
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            mode = 'COPY'
+    if mode == 'COPY':
+        shutil.copy2(source, temp_path)
+    os.replace(temp_path, target)
+    return mode
@@ -0,0 +1,212 @@
+"""Camera rig layouts computed as NumPy arrays, independent of bpy."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class Layout(NamedTuple):
+    # child camera name suffixes, e.g. '_L' or '_Y0_X1'
+    suffixes: list
+    # (N, 3) locations
+    locations: np.ndarray
+    # (N, 3) XYZ euler rotations in radians
+    rotations: np.ndarray
+
+    def __len__(self):
+        return len(self.suffixes)
+
+
+OPTIMAL_ANGLES = np.array([
+    (0, 0, 0),
+    (90, 0, 0),
+    (-90, 180, 0),
+    (0, 180, 0),
+    (-90, 180, 90),
+    (-90, 180, -90)
+], dtype=float)
+
+
+def euler_to_matrix(rotations):
+    """Rotation matrices (N, 3, 3) for XYZ euler angles (N, 3), same as mathutils.Euler."""
+    rotations = np.atleast_2d(np.asarray(rotations, dtype=float))
+    sx, sy, sz = np.sin(rotations).T
+    cx, cy, cz = np.cos(rotations).T
+
+    matrices = np.empty((len(rotations), 3, 3))
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    return matrices
+
+
+def matrix_to_euler(matrices):
+    """XYZ euler angles (N, 3) of rotation matrices (N, 3, 3)."""
+    matrices = np.asarray(matrices, dtype=float).reshape(-1, 3, 3)
+    x = np.arctan2(matrices[:, 2, 1], matrices[:, 2, 2])
+    y = np.arctan2(-matrices[:, 2, 0], np.hypot(matrices[:, 0, 0], matrices[:, 1, 0]))
+    z = np.arctan2(matrices[:, 1, 0], matrices[:, 0, 0])
+    return np.stack((x, y, z), axis=1)
+
+
+def look_at(locations, target):
+    """XYZ euler rotations pointing -Z of each camera at target with Y up, like a TRACK_TO constraint."""
+    locations = np.atleast_2d(np.asarray(locations, dtype=float))
+    z_axis = locations - np.asarray(target, dtype=float)
+    z_axis /= np.maximum(np.linalg.norm(z_axis, axis=1, keepdims=True), 1e-12)
+
+    x_axis = np.cross((0.0, 0.0, 1.0), z_axis)
+    x_norm = np.linalg.norm(x_axis, axis=1, keepdims=True)
+    # cameras straight above or below the target keep world X as their right axis
+    degenerate = x_norm[:, 0] < 1e-9
+    x_axis[degenerate] = (1.0, 0.0, 0.0)
+    x_norm[degenerate] = 1.0
+    x_axis /= x_norm
+    y_axis = np.cross(z_axis, x_axis)
+
+    return matrix_to_euler(np.stack((x_axis, y_axis, z_axis), axis=2))
+
+
+def stereo(cameras_spacing, stereo_focal_distance, is_convergent):
+    camera_offset = cameras_spacing / 2
+    angle = (np.pi / 2 - np.arctan(stereo_focal_distance / camera_offset)) if is_convergent else 0.0
+
+    locations = np.array([(-camera_offset / 100, 0.0, 0.0),
+                          (camera_offset / 100, 0.0, 0.0)])
+    rotations = np.array([(0.0, -angle, 0.0),
+                          (0.0, angle, 0.0)])
+    return Layout(['_L', '_R'], locations, rotations)
+
+
+def matrix(horizontal_amount, vertical_amount, horizontal_distance, vertical_distance):
+    # rows go upwards (Y), columns to the right (X), row-major order
+    y_idx, x_idx = np.divmod(np.arange(horizontal_amount * vertical_amount), horizontal_amount)
+
+    locations = np.zeros((len(x_idx), 3))
+    locations[:, 0] = x_idx * horizontal_distance / 100
+    locations[:, 1] = y_idx * vertical_distance / 100
+    suffixes = ['_Y' + str(y) + '_X' + str(x) for y, x in zip(y_idx.tolist(), x_idx.tolist())]
+    return Layout(suffixes, locations, np.zeros_like(locations))
+
+
+def orbit(amount, radius, rotation_offset=0.0, tilt_x=0.0, tilt_y=0.0, target=(0.0, 0.0, 0.0)):
+    angles = (np.arange(amount) / amount + rotation_offset / 360) * 2 * np.pi
+
+    local = np.zeros((amount, 3))
+    local[:, 0] = radius * np.cos(angles)
+    local[:, 1] = radius * np.sin(angles)
+    tilt = euler_to_matrix(np.radians((tilt_x, tilt_y, 0.0)))[0]
+
+    locations = local @ tilt.T + np.asarray(target, dtype=float)
+    suffixes = ['_O' + str(i) for i in range(amount)]
+    return Layout(suffixes, locations, look_at(locations, target))
+
+
+def fibonacci_sphere(samples):
+    """Unit sphere points (N, 3), evenly spread with the golden angle."""
+    phi = np.pi * (np.sqrt(5.) - 1.)  # golden angle in radians
+
+    y = np.linspace(1, -1, samples)  # y goes from 1 to -1
+    radius = np.sqrt(1 - y * y)  # radius at y
+    theta = phi * np.arange(samples)  # golden angle increment
+
+    return np.stack((np.cos(theta) * radius, y, np.sin(theta) * radius), axis=1)
+
+
+def sphere(amount, radius, target=(0.0, 0.0, 0.0)):
+    locations = fibonacci_sphere(amount) * radius + np.asarray(target, dtype=float)
+    suffixes = ['_' + str(i) for i in range(amount)]
+    return Layout(suffixes, locations, look_at(locations, target))
+
+
+def optimal(z_rotation_offset=0.0, amount=len(OPTIMAL_ANGLES)):
+    # only orientations are known upfront, the distance is fitted to the target by frame_points;
+    # other amounts than the 6 axis aligned views look from evenly spread directions
+    if amount == len(OPTIMAL_ANGLES):
+        rotations = np.radians(OPTIMAL_ANGLES + (0.0, 0.0, z_rotation_offset))
+    else:
+        directions = fibonacci_sphere(amount) @ euler_to_matrix(np.radians((0.0, 0.0, z_rotation_offset)))[0].T
+        rotations = look_at(directions, (0.0, 0.0, 0.0))
+    suffixes = ['_' + str(i) for i in range(len(rotations))]
+    return Layout(suffixes, np.zeros_like(rotations), rotations)
+
+
+def frustum_tangents(angle, sensor_fit, aspect):
+    """Half frame tangents (x, y) of a perspective camera, angle being the field of view of the fitted axis."""
+    if sensor_fit == 'AUTO':
+        sensor_fit = 'HORIZONTAL' if aspect >= 1 else 'VERTICAL'
+    tangent = np.tan(angle / 2)
+    if sensor_fit == 'HORIZONTAL':
+        return tangent, tangent / aspect
+    return tangent * aspect, tangent
+
+
+def frame_points(rotations, points, tan_x, tan_y, shift_x=0.0, shift_y=0.0, clip_start=0.0):
+    """Locations (N, 3) of cameras with given orientations (N, 3), as close to points (M, 3)
+    as possible while all of them stay in frame; shift is relative to the larger frame side."""
+    matrices = euler_to_matrix(rotations)
+    # points in camera space of every camera placed at the origin, camera looks down -Z
+    local = np.einsum('mi,nij->nmj', np.asarray(points, dtype=float), matrices)
+    x, y, z = local[..., 0], local[..., 1], local[..., 2]
+
+    offset_max = 2 * max(tan_x, tan_y)
+    offset_x = shift_x * offset_max
+    offset_y = shift_y * offset_max
+
+    # each frame side is a plane through the camera, the tightest camera position along
+    # an axis touches the extreme point of both of its planes
+    def fit(coords, tangent, offset):
+        low = np.min(coords + (offset - tangent) * z, axis=1)
+        high = np.max(coords + (offset + tangent) * z, axis=1)
+        return low, high, (high - low) / (2 * tangent)
+
+    low_x, high_x, depth_x = fit(x, tan_x, offset_x)
+    low_y, high_y, depth_y = fit(y, tan_y, offset_y)
+    depth = np.maximum(depth_x, depth_y)
+    # keep everything behind the clipping start
+    depth = np.maximum(depth, np.max(z, axis=1) + clip_start)
+
+    # centered on the axis which is not tight
+    camera_local = np.stack(((low_x + high_x) / 2 - offset_x * depth,
+                             (low_y + high_y) / 2 - offset_y * depth,
+                             depth), axis=1)
+    return np.einsum('nij,nj->ni', matrices, camera_local)
+
+
+def project_points(matrices, points, tan_x, tan_y, shift_x=0.0, shift_y=0.0):
+    """Frame coordinates (N, M, 3) of points (M, 3) seen by cameras with world matrices (N, 4, 4),
+    x and y from 0 to 1 over the frame and z the depth, like bpy_extras world_to_camera_view.
+    Tangents and shifts are scalars or per camera (N,)."""
+    matrices = np.asarray(matrices, dtype=float).reshape(-1, 4, 4)
+    rotations = matrices[:, :3, :3] / np.linalg.norm(matrices[:, :3, :3], axis=1, keepdims=True)
+    # camera space of orthonormal matrices is the transposed rotation
+    local = np.einsum('nji,nmj->nmi', rotations,
+                      np.asarray(points, dtype=float)[None] - matrices[:, None, :3, 3])
+    depth = -local[..., 2]
+
+    tan_x, tan_y, shift_x, shift_y = (np.broadcast_to(value, len(matrices))[:, None]
+                                      for value in (tan_x, tan_y, shift_x, shift_y))
+    offset_max = 2 * np.maximum(tan_x, tan_y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = (local[..., 0] / depth - shift_x * offset_max + tan_x) / (2 * tan_x)
+        y = (local[..., 1] / depth - shift_y * offset_max + tan_y) / (2 * tan_y)
+    return np.stack((x, y, depth), axis=2)
+
+
+def screen_bounds(projected, padding=0.0):
+    """Frame rectangles (N, 4) as min x, min y, max x, max y around projected points, grown by padding
+    and clipped to the frame. The full frame is kept where points are behind a camera (their projection
+    is not bounded) or none of them is in frame."""
+    x, y, depth = projected[..., 0], projected[..., 1], projected[..., 2]
+    bounds = np.stack((x.min(axis=1) - padding, y.min(axis=1) - padding,
+                       x.max(axis=1) + padding, y.max(axis=1) + padding), axis=1)
+    bounds = np.clip(bounds, 0.0, 1.0)
+    unbounded = (depth <= 0).any(axis=1) | (bounds[:, 2] <= bounds[:, 0]) | (bounds[:, 3] <= bounds[:, 1])
+    bounds[unbounded] = (0.0, 0.0, 1.0, 1.0)
+    return bounds
@@ -0,0 +1,129 @@
+"""Crash-safe record of a multicam render queue, independent of bpy.
+
+The manifest lists every queue item with its output files and is written atomically once per run.
+Finished files are appended to per-process journals as they are written, so a run interrupted
+at any point can be resumed by rendering only the frames whose files are missing or truncated.
+"""
+
+import glob
+import json
+import os
+import socket
+
+MANIFEST_NAME = "multicam_manifest.json"
+JOURNAL_PATTERN = "multicam_manifest.*.journal"
+MANIFEST_VERSION = 1
+
+
+def write_atomic(path, text):
+    # readers see either the old or the new file, never a partially written one
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temp_path, path)
+
+
+def frame_ranges(frames, step=1):
+    """Group sorted frames into (start, end) ranges of consecutive frames."""
+    ranges = []
+    for frame in frames:
+        if ranges and frame == ranges[-1][1] + step:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+
+def is_complete(path, recorded_size):
+    # only files journaled after being written count, and they must still have that size
+    if recorded_size is None:
+        return False
+    try:
+        return os.path.getsize(path) == recorded_size
+    except OSError:
+        return False
+
+
+def pending_jobs(jobs, recorded, frame_step=1):
+    """Queue items still to render, narrowed to their missing frames.
+
+    Each job carries 'files', a mapping of frame (as str) to its output paths;
+    jobs with 'single_output' (videos) can only be rendered as a whole.
+    """
+    pending = []
+    for job in jobs:
+        files = job['files']
+        missing = sorted(int(frame) for frame, paths in files.items()
+                         if not all(is_complete(path, recorded.get(path)) for path in paths))
+        if not missing:
+            continue
+        queueItem = {key: value for key, value in job.items() if key not in ('files', 'single_output')}
+        if job.get('single_output'):
+            pending.append(queueItem)
+            continue
+        for start, end in frame_ranges(missing, frame_step):
+            pending.append(dict(queueItem, frameStart=start, frameEnd=end))
+    return pending
+
+
+class Manifest:
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.journal = None
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, MANIFEST_NAME)
+
+    def journal_paths(self):
+        return glob.glob(os.path.join(glob.escape(self.directory), JOURNAL_PATTERN))
+
+    def create(self, jobs, info, keep_journals=False):
+        os.makedirs(self.directory, exist_ok=True)
+        if not keep_journals:
+            for journal_path in self.journal_paths():
+                os.remove(journal_path)
+        write_atomic(self.path, json.dumps({'version': MANIFEST_VERSION, 'info': info, 'jobs': jobs}))
+
+    def load(self):
+        try:
+            with open(self.path) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def recorded_files(self):
+        """Sizes of journaled files, later records win."""
+        recorded = {}
+        for journal_path in sorted(self.journal_paths(), key=os.path.getmtime):
+            with open(journal_path) as journal:
+                for line in journal:
+                    try:
+                        recorded.update(json.loads(line)['files'])
+                    except (ValueError, KeyError, TypeError):
+                        # last line of a journal interrupted while writing
+                        continue
+        return recorded
+
+    def open_journal(self):
+        # one journal per process and host, so parallel workers never write the same file
+        os.makedirs(self.directory, exist_ok=True)
+        journal_name = JOURNAL_PATTERN.replace("*", socket.gethostname() + "." + str(os.getpid()))
+        journal_path = os.path.join(self.directory, journal_name)
+        self.journal = open(journal_path, "a")
+
+    def record(self, paths):
+        files = {path: os.path.getsize(path) for path in paths if os.path.exists(path)}
+        if self.journal is None or not files:
+            return
+        self.journal.write(json.dumps({'files': files}) + "\n")
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+
+    def close(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
@@ -0,0 +1,64 @@
+"""Render queue ordering strategies, independent of bpy.
+
+Consecutive jobs with similar views reuse more of what the previous job left behind:
+persistent render data, light caches and files in the OS cache.
+"""
+
+import numpy as np
+
+STRATEGIES = ('DEFAULT', 'SERPENTINE', 'NEAREST')
+
+
+def serpentine(positions):
+    """Camera order along the rows of a grid (local Y), alternating the direction along X."""
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    _, rows = np.unique(np.round(positions[:, 1], 6), return_inverse=True)
+    x = np.where(rows % 2 == 0, positions[:, 0], -positions[:, 0])
+    return np.lexsort((x, rows)).tolist()
+
+
+def nearest_neighbour(positions, start=0):
+    """Camera order always moving on to the closest camera not visited yet."""
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    if not len(positions):
+        return []
+    visited = np.zeros(len(positions), dtype=bool)
+    order = [start]
+    visited[start] = True
+    for _ in range(len(positions) - 1):
+        distances = np.linalg.norm(positions - positions[order[-1]], axis=1)
+        distances[visited] = np.inf
+        order.append(int(np.argmin(distances)))
+        visited[order[-1]] = True
+    return order
+
+
+def camera_order(strategy, positions):
+    if strategy == 'SERPENTINE':
+        return serpentine(positions)
+    if strategy == 'NEAREST':
+        return nearest_neighbour(positions)
+    return list(range(len(positions)))
+
+
+def plan_jobs(cameras, frame_start, frame_end, frame_step=1, frame_by_frame=False, frame_block=0, alternate=False):
+    """Queue items for cameras (in render order) and a frame range.
+
+    Frame by frame renders every camera for a frame before the next frame, otherwise each camera
+    renders a whole block of frame_block frames (or the whole range) before the next camera.
+    With alternate, every other frame or block goes through the cameras backwards,
+    so the camera of the last job is also the camera of the next one.
+    """
+    frames = list(range(frame_start, frame_end + 1, frame_step))
+    if frame_by_frame:
+        ranges = [(frame, frame) for frame in frames]
+    elif frame_block > 0:
+        ranges = [(frames[i], frames[min(i + frame_block, len(frames)) - 1]) for i in range(0, len(frames), frame_block)]
+    else:
+        ranges = [(frame_start, frame_end)]
+
+    jobs = []
+    for i, (start, end) in enumerate(ranges):
+        ordered = cameras[::-1] if alternate and i % 2 else cameras
+        jobs.extend({'camera': camera, 'frameStart': start, 'frameEnd': end} for camera in ordered)
+    return jobs
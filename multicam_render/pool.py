@@ -0,0 +1,163 @@
+"""Local pool of background Blender workers sharing one render queue, independent of bpy."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+from collections import deque
+
+# printed by workers on their stdout after each job
+DONE_MARKER = "MULTICAM_JOB_DONE "
+FAILED_MARKER = "MULTICAM_JOB_FAILED "
+
+
+def available_memory():
+    """Bytes of memory available for new processes, None if unknown."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def peak_memory():
+    """Peak resident memory of this process in bytes, 0 if unknown."""
+    try:
+        import resource
+    except ImportError:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes everywhere but macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def choose_worker_count(requested, cpu_count, free_memory=None, worker_memory=None):
+    # requested 0 means as many as cores and memory allow
+    count = requested if requested > 0 else cpu_count
+    if free_memory and worker_memory:
+        count = min(count, free_memory // worker_memory)
+    return max(1, min(count, cpu_count))
+
+
+def threads_per_worker(workers, cpu_count):
+    return max(1, cpu_count // workers)
+
+
+def split_jobs(jobs, chunk_size, frame_step=1):
+    # split frame ranges into chunks of chunk_size rendered frames, so idle workers can take over
+    # the rest of a camera; chunks start on frames of the step, like the frames rendered in one piece
+    if chunk_size <= 0:
+        return list(jobs)
+    chunks = []
+    for job in jobs:
+        frames = range(job['frameStart'], job['frameEnd'] + 1, frame_step)
+        for index in range(0, len(frames), chunk_size):
+            chunk = frames[index:index + chunk_size]
+            chunks.append(dict(job, frameStart=chunk[0], frameEnd=chunk[-1]))
+    return chunks
+
+
+class WorkerPool:
+    # each worker is a long running process reading one json job per stdin line,
+    # jobs are handed out one at a time so workers finishing early take more of them
+
+    def __init__(self, command, workers, max_retries=1, max_restarts=3, log=sys.stdout):
+        self.command = command
+        self.workers = workers
+        self.max_retries = max_retries
+        self.max_restarts = max_restarts
+        self.log = log
+
+        self.jobs = deque()
+        self.failed = []
+        self.done = 0
+        self.retries = {}
+        self.lock = threading.Lock()
+
+    def run(self, jobs):
+        """Render all jobs, returns the ones that failed."""
+        self.jobs = deque(jobs)
+        threads = [threading.Thread(target=self.run_worker, args=(index,), daemon=True)
+                   for index in range(min(self.workers, len(self.jobs)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # jobs left when workers kept dying
+        self.failed.extend(self.jobs)
+        return self.failed
+
+    def next_job(self):
+        with self.lock:
+            return self.jobs.popleft() if self.jobs else None
+
+    def requeue(self, job):
+        with self.lock:
+            key = json.dumps(job, sort_keys=True)
+            self.retries[key] = self.retries.get(key, 0) + 1
+            if self.retries[key] > self.max_retries:
+                self.failed.append(job)
+            else:
+                self.jobs.append(job)
+
+    def write_log(self, index, line):
+        with self.lock:
+            self.log.write("[worker " + str(index) + "] " + line)
+            self.log.flush()
+
+    def wait_result(self, index, process):
+        # forward worker output until it reports the job, None if the worker died
+        for line in process.stdout:
+            if line.startswith(DONE_MARKER):
+                return True
+            if line.startswith(FAILED_MARKER):
+                return False
+            self.write_log(index, line)
+        return None
+
+    def run_worker(self, index):
+        # a worker that died is restarted while there are jobs left
+        for _ in range(self.max_restarts + 1):
+            if not self.run_process(index):
+                return
+
+    def run_process(self, index):
+        """Feed jobs to one worker process, returns False once out of jobs."""
+        process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, bufsize=1)
+        try:
+            while (job := self.next_job()) is not None:
+                try:
+                    process.stdin.write(json.dumps(job) + "\n")
+                    process.stdin.flush()
+                except BrokenPipeError:
+                    result = None
+                else:
+                    result = self.wait_result(index, process)
+
+                if result is None:
+                    self.write_log(index, "worker exited unexpectedly\n")
+                    self.requeue(job)
+                    return True
+                with self.lock:
+                    if result:
+                        self.done += 1
+                    else:
+                        self.failed.append(job)
+            return False
+        finally:
+            if process.stdin and not process.stdin.closed:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+            for line in process.stdout:
+                self.write_log(index, line)
+            process.wait()
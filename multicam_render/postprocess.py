@@ -0,0 +1,155 @@
+"""Post-render work run on a thread pool while the next job renders, independent of bpy.
+
+Conversion and video encoding run ffmpeg (found on the PATH) as subprocesses, stereo pairs are
+composited with NumPy and written by a small PNG encoder; zlib and NumPy release the GIL,
+so neither competes with Blender for the interpreter.
+Images are (height, width, 4) float RGBA arrays with the first row at the top.
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+CONVERSIONS = {
+    # extension and ffmpeg output options of each conversion
+    'PNG': (".png", ["-compression_level", "9", "-pred", "mixed"]),
+    'JPEG': (".jpg", ["-q:v", "2"]),
+    'WEBP': (".webp", ["-lossless", "1", "-compression_level", "6"]),
+}
+
+
+def ffmpeg_path():
+    return shutil.which("ffmpeg")
+
+
+def run(command):
+    # raises with the end of the ffmpeg log when it fails
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(" ".join(command[:2]) + " failed: " + result.stdout[-500:])
+
+
+def convert(source, conversion):
+    """Convert an image with ffmpeg, next to the source (in place for PNG recompression)."""
+    extension, options = CONVERSIONS[conversion]
+    target = os.path.splitext(source)[0] + extension
+    # the temporary file keeps the extension, ffmpeg picks the format from it
+    temp_path = os.path.splitext(source)[0] + ".tmp" + extension
+    run([ffmpeg_path(), "-y", "-loglevel", "error", "-i", source] + options + [temp_path])
+    os.replace(temp_path, target)
+    return target
+
+
+def encode_video(paths, output, fps, crf=18):
+    """H.264 video of image files in the given order, each shown for one frame."""
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for path in paths:
+            listing.write("file '" + path.replace("'", "'\\''") + "'\nduration " + repr(1 / fps) + "\n")
+        # the concat demuxer ignores the duration of the last file unless it is repeated
+        if paths:
+            listing.write("file '" + paths[-1].replace("'", "'\\''") + "'\n")
+    try:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        temp_path = os.path.splitext(output)[0] + ".tmp" + os.path.splitext(output)[1]
+        run([ffmpeg_path(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", listing.name,
+             "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-r", repr(fps), "-c:v", "libx264", "-crf", str(crf),
+             "-pix_fmt", "yuv420p", temp_path])
+        os.replace(temp_path, output)
+    finally:
+        os.remove(listing.name)
+    return output
+
+
+def side_by_side(left, right):
+    height = max(left.shape[0], right.shape[0])
+    sheet = np.zeros((height, left.shape[1] + right.shape[1], 4), dtype=np.float32)
+    sheet[:left.shape[0], :left.shape[1]] = left
+    sheet[:right.shape[0], left.shape[1]:] = right
+    return sheet
+
+
+def anaglyph(left, right):
+    """Red and cyan anaglyph, red from the left view, green and blue from the right one."""
+    if left.shape != right.shape:
+        raise ValueError("Stereo views differ in size")
+    image = np.array(right, dtype=np.float32)
+    image[..., 0] = left[..., 0]
+    image[..., 3] = np.maximum(left[..., 3], right[..., 3])
+    return image
+
+
+def png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+
+def write_png(path, image, level=6):
+    """8 bit RGBA PNG of a float image, written aside and moved into place."""
+    pixels = np.clip(np.rint(np.asarray(image, dtype=np.float32) * 255), 0, 255).astype(np.uint8)
+    height, width = pixels.shape[:2]
+    rows = pixels.reshape(height, width * 4)
+    # filter 2 (up) on every row, the difference to the row above
+    filtered = np.empty((height, width * 4 + 1), dtype=np.uint8)
+    filtered[:, 0] = 2
+    filtered[:, 1:] = rows
+    filtered[1:, 1:] -= rows[:-1]
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)))
+        file.write(png_chunk(b"IDAT", zlib.compress(filtered.tobytes(), level)))
+        file.write(png_chunk(b"IEND", b""))
+    os.replace(temp_path, path)
+    return path
+
+
+def composite_stereo(left, right, mode, output):
+    image = side_by_side(left, right) if mode == 'SIDE_BY_SIDE' else anaglyph(left, right)
+    return write_png(output, image)
+
+
+class Pipeline:
+    # runs tasks on worker threads, collecting their errors
+
+    def __init__(self, workers=2, log=print):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="multicam_post")
+        self.log = log
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.done = 0
+        self.errors = []
+
+    def submit(self, description, function, *args):
+        with self.lock:
+            self.pending += 1
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(lambda finished: self.finished(description, finished))
+        return future
+
+    def finished(self, description, future):
+        error = future.exception()
+        with self.lock:
+            self.pending -= 1
+            if error is None:
+                self.done += 1
+            else:
+                self.errors.append(description + ": " + str(error))
+        if error is not None:
+            self.log("Post-render " + description + " failed: " + str(error))
+
+    def idle(self):
+        with self.lock:
+            return self.pending == 0
+
+    def shutdown(self, wait=True):
+        """Stop taking tasks, with wait until the submitted ones are done. Returns the errors so far."""
+        self.executor.shutdown(wait=wait)
+        return list(self.errors)
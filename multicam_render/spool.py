@@ -0,0 +1,183 @@
+"""Render queue spooled as job files in a shared directory, independent of bpy.
+
+Any number of workers on any host mounting the directory render from the same queue without a
+coordinating service. A job is claimed by renaming its file from pending/ into claimed/ under the
+name of the worker, which only one rename can do. The worker keeps touching the claimed file while it
+renders; a claim not touched for longer than the lease is renamed back into pending/ by any worker,
+so the jobs of crashed or disconnected workers are rendered by others.
+Lease times are compared with the file system clock, hosts may have different clocks.
+"""
+
+import json
+import os
+import socket
+import threading
+import time
+
+PENDING = "pending"
+CLAIMED = "claimed"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, CLAIMED, DONE, FAILED)
+OWNER_SEPARATOR = "@"
+DEFAULT_LEASE = 120.0
+
+
+def worker_name():
+    # unique for each process on each host
+    return socket.gethostname().replace(OWNER_SEPARATOR, "_") + "." + str(os.getpid())
+
+
+class Lease:
+    # renews a claim from a background thread while the job renders,
+    # lost is set once another worker took the job over
+
+    def __init__(self, spool, job_id):
+        self.spool = spool
+        self.job_id = job_id
+        self.lost = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stopped.wait(self.spool.lease / 3):
+            if not self.spool.renew(self.job_id):
+                self.lost = True
+                return
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stopped.set()
+        self.thread.join()
+
+
+class Spool:
+
+    def __init__(self, directory, worker=None, lease=DEFAULT_LEASE):
+        self.directory = directory
+        self.worker = worker or worker_name()
+        self.lease = lease
+        for state in STATES:
+            os.makedirs(os.path.join(directory, state), exist_ok=True)
+
+    def path(self, state, name):
+        return os.path.join(self.directory, state, name)
+
+    def claim_path(self, job_id):
+        return self.path(CLAIMED, job_id + OWNER_SEPARATOR + self.worker + ".json")
+
+    def names(self, state):
+        try:
+            return sorted(name for name in os.listdir(os.path.join(self.directory, state)) if name.endswith(".json"))
+        except FileNotFoundError:
+            return []
+
+    def now(self):
+        # current time of the file system holding the spool
+        clock = os.path.join(self.directory, ".clock." + self.worker)
+        with open(clock, "w"):
+            pass
+        return os.stat(clock).st_mtime
+
+    def submit(self, jobs):
+        """Add queue items as pending jobs, in queue order, returns their ids."""
+        batch = time.strftime("%Y%m%d%H%M%S") + "-" + self.worker
+        job_ids = []
+        for index, job in enumerate(jobs):
+            job_id = batch + "-" + "%06d" % index
+            # written aside and renamed, workers never see a partial job file
+            temp_path = os.path.join(self.directory, "." + job_id + ".tmp")
+            with open(temp_path, "w") as file:
+                json.dump(job, file)
+            os.replace(temp_path, self.path(PENDING, job_id + ".json"))
+            job_ids.append(job_id)
+        return job_ids
+
+    def claim(self):
+        """(job id, queue item) of the first pending job this worker could claim, None if there is none."""
+        self.requeue_expired()
+        for name in self.names(PENDING):
+            job_id = name[:-len(".json")]
+            try:
+                # touched first, a fresh claim never looks expired
+                os.utime(self.path(PENDING, name))
+                os.rename(self.path(PENDING, name), self.claim_path(job_id))
+            except FileNotFoundError:
+                # claimed by another worker in the meantime
+                continue
+            with open(self.claim_path(job_id)) as file:
+                return job_id, json.load(file)
+        return None
+
+    def renew(self, job_id):
+        """Extend the lease of a claimed job, False if it was lost."""
+        try:
+            os.utime(self.claim_path(job_id))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def release(self, job_id, state):
+        # move a claimed job into done, failed or back to pending, False if the lease was lost
+        try:
+            os.rename(self.claim_path(job_id), self.path(state, job_id + ".json"))
+            return True
+        except FileNotFoundError:
+            return False
+
+    def complete(self, job_id):
+        return self.release(job_id, DONE)
+
+    def fail(self, job_id):
+        return self.release(job_id, FAILED)
+
+    def requeue_expired(self):
+        """Put claims not renewed within the lease back into pending, returns how many."""
+        now = self.now()
+        requeued = 0
+        for name in self.names(CLAIMED):
+            path = self.path(CLAIMED, name)
+            try:
+                expired = now - os.stat(path).st_mtime > self.lease
+                if expired:
+                    os.rename(path, self.path(PENDING, name.rsplit(OWNER_SEPARATOR, 1)[0] + ".json"))
+                    requeued += 1
+            except FileNotFoundError:
+                # renewed into done or requeued by another worker
+                continue
+        return requeued
+
+    def status(self):
+        return {state: len(self.names(state)) for state in STATES}
+
+
+def run_worker(spool, render, poll_interval=5.0, wait=True, log=print):
+    """Claim and render jobs until none are pending, with wait also until no other worker holds a claim
+    which could expire. render(queueItem) returns whether the job succeeded.
+    Returns the amounts of done and failed jobs of this worker."""
+    done = failed = 0
+    while True:
+        claimed = spool.claim()
+        if claimed is None:
+            if not wait or not spool.names(CLAIMED):
+                return done, failed
+            time.sleep(poll_interval)
+            continue
+
+        job_id, queueItem = claimed
+        with Lease(spool, job_id) as lease:
+            try:
+                rendered = render(queueItem)
+            except Exception as error:
+                log("Job " + job_id + " failed: " + str(error))
+                rendered = False
+        if lease.lost or not (spool.complete(job_id) if rendered else spool.fail(job_id)):
+            # rendered again by the worker which took over the expired lease
+            log("Lease of job " + job_id + " was lost")
+        elif rendered:
+            done += 1
+        else:
+            failed += 1
@@ -0,0 +1,79 @@
+"""Render queue telemetry, independent of bpy: per-job records streamed as JSON Lines or CSV, throughput and ETA."""
+
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+
+FIELDS = ('camera', 'frameStart', 'frameEnd', 'views', 'started',
+          'init_time', 'render_time', 'complete_time', 'wall_time', 'peak_memory', 'output_bytes')
+FORMATS = {'JSONL': '.jsonl', 'CSV': '.csv'}
+FILE_NAME = "multicam_telemetry"
+
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    return "%d:%02d:%02d" % (seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+
+class TelemetryWriter:
+    # each record is written with a single append, so workers can share the file
+
+    def __init__(self, directory, output_format):
+        os.makedirs(directory, exist_ok=True)
+        self.output_format = output_format
+        self.path = os.path.join(directory, FILE_NAME + FORMATS[output_format])
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        if output_format == 'CSV' and os.fstat(self.fd).st_size == 0:
+            self.write_line(self.csv_line(FIELDS))
+
+    @staticmethod
+    def csv_line(values):
+        line = io.StringIO()
+        csv.writer(line, lineterminator="\n").writerow(values)
+        return line.getvalue()
+
+    def write_line(self, line):
+        os.write(self.fd, line.encode())
+
+    def write(self, record):
+        if self.output_format == 'CSV':
+            values = [record.get(field, "") for field in FIELDS]
+            values[FIELDS.index('views')] = " ".join(record.get('views') or ())
+            self.write_line(self.csv_line(values))
+        else:
+            self.write_line(json.dumps({field: record.get(field) for field in FIELDS}) + "\n")
+
+    def close(self):
+        os.close(self.fd)
+
+
+class Throughput:
+    # jobs per minute over the most recent jobs, and the time left at that rate
+
+    def __init__(self, total, window=20):
+        self.total = total
+        self.done = 0
+        self.started = time.monotonic()
+        self.finished = deque([self.started], maxlen=window + 1)
+
+    def job_done(self, now=None):
+        self.done += 1
+        self.finished.append(time.monotonic() if now is None else now)
+
+    @property
+    def jobs_per_minute(self):
+        elapsed = self.finished[-1] - self.finished[0]
+        if elapsed <= 0:
+            return 0.0
+        return (len(self.finished) - 1) / elapsed * 60
+
+    @property
+    def eta(self):
+        """Seconds left, None until the rate is known."""
+        rate = self.jobs_per_minute
+        if rate <= 0:
+            return None
+        return max(self.total - self.done, 0) / rate * 60
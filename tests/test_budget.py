@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from multicam_render import budget, layout
+
+
+def test_distance_weights():
+    weights = budget.distance_weights([(0, 0, 0), (1, 0, 0), (-1, 0, 0), (3, 0, 0)])
+    np.testing.assert_allclose(weights, (0.75, 1.0, 0.25, 0.0))
+    # a ring around the centre is weighted alike
+    np.testing.assert_allclose(budget.distance_weights(layout.orbit(8, 2.0).locations), 1.0)
+
+
+def test_coverage_weights():
+    projected = np.array([[(0.2, 0.2, 1.0), (0.8, 0.6, 1.0)],
+                          [(0.4, 0.4, 1.0), (0.5, 0.5, -1.0)],
+                          [(0.5, 0.5, -1.0), (0.5, 0.5, -1.0)],
+                          [(0.5, 0.5, 1.0), (2.0, 2.0, 1.0)]])
+    # points out of frame are clipped to it, cameras seeing no point or only a single one cover nothing
+    np.testing.assert_allclose(budget.coverage_weights(projected), (0.24 / 0.25, 0.0, 0.0, 1.0))
+    # without any coverage all cameras are weighted alike
+    np.testing.assert_allclose(budget.coverage_weights(projected[1:3]), (1.0, 1.0))
+
+
+def test_weighted_budgets_range():
+    budgets = budget.weighted_budgets([1.0, 0.5, 0.0], samples=128, min_samples=16, min_resolution=50,
+                                      simplify=6, simplify_drop=2, denoise=True)
+    assert budgets[0] == {'resolution': 100, 'samples': 128, 'simplify': None, 'denoise': None}
+    assert budgets[1] == {'resolution': 75, 'samples': 72, 'simplify': 5, 'denoise': True}
+    assert budgets[2] == {'resolution': 50, 'samples': 16, 'simplify': 4, 'denoise': True}
+    # engines without samples
+    assert budget.weighted_budgets([0.0])[0]['samples'] is None
+
+
+def test_combine():
+    budgets = [{'resolution': 50, 'samples': 16, 'simplify': 4, 'denoise': True},
+               {'resolution': 100, 'samples': 32, 'simplify': 5, 'denoise': False}]
+    assert budget.combine(budgets) == {'resolution': 100, 'samples': 32, 'simplify': 5, 'denoise': False}
+    assert budget.combine(budgets + [dict.fromkeys(budget.KEYS)]) == dict.fromkeys(budget.KEYS)
+    assert budget.combine([]) is None
+
+
+def test_fit_timing():
+    assert budget.fit_timing([16, 32], [2.0, 3.0]) == pytest.approx((1.0, 1 / 16))
+    fixed, per_sample = budget.fit_timing([16, 32], [3.0, 2.0])
+    assert fixed >= 0 and per_sample > 0
+
+
+@pytest.mark.parametrize("total_seconds", [60.0, 100.0, 250.0])
+def test_distribute_samples_fits_the_budget(total_seconds):
+    weights = np.array([1.0, 0.75, 0.25, 0.0])
+    frames, pixels = [10, 10, 20, 10], [1.0, 1.0, 0.5, 0.25]
+    samples = budget.distribute_samples(weights, frames, pixels, 1.0, 1 / 16, total_seconds, 4, 512)
+    estimate = budget.estimate_seconds(samples, frames, pixels, 1.0, 1 / 16)
+    assert estimate <= total_seconds
+    # at most one sample per camera short of the budget
+    assert estimate > total_seconds - budget.estimate_seconds([1] * 4, frames, pixels, 0.0, 1 / 16)
+    assert (samples >= 4).all() and (samples <= 512).all()
+    # more important cameras get more samples
+    assert (np.diff(samples[:3]) <= 0).all()
+
+
+def test_distribute_samples_limits():
+    weights, frames, pixels = [1.0, 0.5], [10, 10], [1.0, 1.0]
+    # plenty of time: the weighted cameras reach the maximum
+    np.testing.assert_array_equal(budget.distribute_samples(weights, frames, pixels, 1.0, 0.01, 1e9, 8, 128),
+                                  (128, 128))
+    # not even the minimum fits
+    np.testing.assert_array_equal(budget.distribute_samples(weights, frames, pixels, 1.0, 0.01, 1.0, 8, 128),
+                                  (8, 8))
@@ -0,0 +1,93 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from multicam_render import camera_export, layout
+
+
+def quaternion_to_matrix(q):
+    w, x, y, z = q
+    return np.array([(1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)),
+                     (2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)),
+                     (2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y))])
+
+
+def view(path, location, rotation):
+    matrix = np.eye(4)
+    matrix[:3, :3] = layout.euler_to_matrix(rotation)[0]
+    matrix[:3, 3] = location
+    return {'camera': "Camera_0", 'frame': 1, 'path': path, 'matrix': matrix,
+            'fx': 1000.0, 'fy': 1000.0, 'cx': 960.0, 'cy': 540.0, 'width': 1920, 'height': 1080}
+
+
+def test_pixel_intrinsics():
+    tan_x, tan_y = layout.frustum_tangents(np.pi / 2, 'HORIZONTAL', 1920 / 1080)
+    fx, fy, cx, cy = camera_export.pixel_intrinsics(tan_x, tan_y, 0.0, 0.0, 1920, 1080)
+    assert (fx, fy, cx, cy) == pytest.approx((960.0, 960.0, 960.0, 540.0))
+    # shift moves the principal point by a fraction of the larger side
+    _, _, cx, cy = camera_export.pixel_intrinsics(tan_x, tan_y, 0.1, 0.1, 1920, 1080)
+    assert (cx, cy) == pytest.approx((960.0 - 192.0, 540.0 + 192.0))
+
+
+def test_pixel_intrinsics_match_projection():
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-1.0, 1.0, size=(20, 3))
+    matrix = np.eye(4)
+    matrix[:3, 3] = (0.0, 0.0, 5.0)
+    tan_x, tan_y = layout.frustum_tangents(0.7, 'AUTO', 1.5)
+    projected = layout.project_points(matrix[None], points, tan_x, tan_y, 0.05, -0.02)[0]
+    fx, fy, cx, cy = camera_export.pixel_intrinsics(tan_x, tan_y, 0.05, -0.02, 1500, 1000)
+    # pinhole projection with the image origin in the top left corner
+    depth = 5.0 - points[:, 2]
+    np.testing.assert_allclose(fx * points[:, 0] / depth + cx, projected[:, 0] * 1500)
+    np.testing.assert_allclose(cy - fy * points[:, 1] / depth, (1 - projected[:, 1]) * 1000)
+
+
+@pytest.mark.parametrize("rotation", [(0.0, 0.0, 0.0), (np.pi, 0.0, 0.0), (0.3, -1.2, 2.5), (0.0, np.pi, 0.0)])
+def test_matrix_to_quaternion(rotation):
+    matrix = layout.euler_to_matrix(rotation)[0]
+    q = camera_export.matrix_to_quaternion(matrix)
+    assert q[0] >= 0 and np.linalg.norm(q) == pytest.approx(1.0)
+    np.testing.assert_allclose(quaternion_to_matrix(q), matrix, atol=1e-12)
+
+
+def test_transforms_writer(tmp_path):
+    path = str(tmp_path / "transforms.json")
+    writer = camera_export.TransformsWriter(path)
+    writer.write(view(str(tmp_path / "Camera_0" / "0001.png"), (1.0, 2.0, 3.0), (0.1, 0.2, 0.3)))
+    writer.write(view(str(tmp_path / "Camera_1" / "0001.png"), (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)))
+    writer.close()
+    with open(path) as file:
+        transforms = json.load(file)
+    assert transforms['w'] == 1920 and len(transforms['frames']) == 2
+    assert transforms['frames'][0]['file_path'] == "Camera_0/0001.png"
+    np.testing.assert_allclose(np.array(transforms['frames'][0]['transform_matrix'])[:3, 3], (1.0, 2.0, 3.0))
+
+    empty = str(tmp_path / "empty" / "transforms.json")
+    camera_export.TransformsWriter(empty).close()
+    with open(empty) as file:
+        assert json.load(file) == {'frames': []}
+
+
+def test_colmap_writer_pose(tmp_path):
+    directory = str(tmp_path / "colmap")
+    location, rotation = np.array((1.0, -2.0, 3.0)), (0.4, 0.1, -0.7)
+    writer = camera_export.ColmapWriter(directory)
+    writer.write(view(str(tmp_path / "Camera_0" / "0001.png"), location, rotation))
+    writer.write(view(str(tmp_path / "Camera_0" / "0002.png"), location, rotation))
+    writer.close()
+
+    with open(os.path.join(directory, "cameras.txt")) as file:
+        cameras = [line for line in file if not line.startswith("#")]
+    assert cameras == ["1 PINHOLE 1920 1080 1000.0 1000.0 960.0 540.0\n"]
+    with open(os.path.join(directory, "images.txt")) as file:
+        images = [line.split() for line in file if line.strip() and not line.startswith("#")]
+    assert [image[-1] for image in images] == ["Camera_0/0001.png", "Camera_0/0002.png"]
+
+    # world to camera pose, camera looking down +Z with Y down
+    values = np.array(images[0][1:8], dtype=float)
+    world_to_camera = quaternion_to_matrix(values[:4])
+    point = location + layout.euler_to_matrix(rotation)[0] @ (0.0, 0.0, -2.0)
+    np.testing.assert_allclose(world_to_camera @ point + values[4:], (0.0, 0.0, 2.0), atol=1e-9)
@@ -0,0 +1,143 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+from mathutils import Vector  # noqa: E402
+
+from multicam_render import cli, spool  # noqa: E402
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    camera = bpy.data.objects.new("Camera", bpy.data.cameras.new("Camera"))
+    scene.collection.objects.link(camera)
+    scene.camera = camera
+    bpy.context.view_layer.objects.active = camera
+    return scene
+
+
+def test_ensure_registered_installs_handlers(scene):
+    addon = cli.ensure_registered()
+    assert hasattr(bpy.types, "OUTPUT_PT_multicam_panel")
+    assert addon.LookAtBaker.on_update in bpy.app.handlers.depsgraph_update_post
+    assert addon.LookAtBaker.on_update in bpy.app.handlers.frame_change_post
+    assert addon.LookAtBaker.on_load in bpy.app.handlers.load_post
+    # a second call does not register again
+    assert cli.ensure_registered() is addon
+    assert bpy.app.handlers.depsgraph_update_post[:].count(addon.LookAtBaker.on_update) == 1
+
+
+def test_main_submits_queue(scene, tmp_path):
+    output = str(tmp_path / "render" / "frame_")
+    directory = str(tmp_path / "spool")
+    status = cli.main(["blender", "--", "--frames", "1-3", "--output", output, "--telemetry", "NONE",
+                       "--spool-submit", directory])
+    assert status == cli.EXIT_OK
+    assert spool.Spool(directory).status()[spool.PENDING] >= 1
+
+
+def test_main_rejects_missing_rig(scene):
+    assert cli.main(["blender", "--", "--rig", "Missing"]) == cli.EXIT_USAGE
+
+
+def test_baked_rig_follows_target_on_frame_set(scene):
+    cli.ensure_registered()
+    base_camera = scene.camera
+    target = bpy.data.objects.new("Target", None)
+    scene.collection.objects.link(target)
+    target.keyframe_insert("location", frame=1)
+    target.location = (4.0, 0.0, 0.0)
+    target.keyframe_insert("location", frame=10)
+    scene.frame_set(1)
+
+    base_camera.target_object = target.name
+    base_camera.mesh_sphere_cameras_amount = 8
+    base_camera.pattern_type = 'SPHERE'
+    base_camera.mesh_baked_orientation = True
+    base_camera.camera_type = 'MESH'
+    cameras = [obj for obj in base_camera.children if obj.type == 'CAMERA']
+    assert cameras and not any(camera.constraints for camera in cameras)
+
+    # the frame change handler bakes the rotations towards the moved target
+    scene.frame_set(10)
+    bpy.context.view_layer.update()
+    for camera in cameras:
+        view = camera.matrix_world.to_3x3() @ Vector((0.0, 0.0, -1.0))
+        direction = target.matrix_world.translation - camera.matrix_world.translation
+        assert view.angle(direction) < 1e-3
+
+
+def test_debounced_drag_is_one_undo_step(scene, monkeypatch):
+    addon = cli.ensure_registered()
+    if not bpy.context.window_manager.windows:
+        pytest.skip("undo needs a window, not available in background mode")
+    scheduler = addon.RigUpdateScheduler
+    monkeypatch.setattr(scheduler, "settle_delay", 0.0)
+    base_camera = scene.camera
+    base_camera.pattern_type = 'ORBIT'
+    base_camera.mesh_orbit_cameras_amount = 4
+    base_camera.camera_type = 'MESH'
+    bpy.ops.ed.undo_push(message="Before drag")
+
+    # a drag sets the amount repeatedly, the rig is built once it settles
+    for amount in (5, 6, 7, 8):
+        base_camera.mesh_orbit_cameras_amount = amount
+    scheduler.flush()
+    base_camera = scene.camera
+    assert len([obj for obj in base_camera.children if obj.type == 'CAMERA']) == 8
+
+    bpy.ops.ed.undo()
+    base_camera = bpy.context.scene.camera
+    assert base_camera.mesh_orbit_cameras_amount == 4
+    assert len([obj for obj in base_camera.children if obj.type == 'CAMERA']) == 4
+
+
+
+def test_worker_arguments_keep_auto_border(scene):
+    cli.ensure_registered()
+    keep = bpy.data.collections.new("Keep")
+    parser = cli.build_parser()
+    cli.configure_scene(parser.parse_args(["--auto-border", "10", "--auto-border-collection", "Keep",
+                                           "--auto-border-crop"]))
+    arguments = cli.worker_arguments(scene)
+
+    # a worker loads the saved file without the overrides of the submitting process
+    scene.autoBorder = scene.autoBorderCrop = False
+    scene.autoBorderCollection = None
+    cli.configure_scene(parser.parse_args(arguments))
+    assert scene.autoBorder and scene.autoBorderCrop
+    assert scene.autoBorderPadding == pytest.approx(10.0)
+    assert scene.autoBorderCollection == keep
+
+
+def test_pilot_jobs_time_the_largest_camera(scene):
+    addon = cli.ensure_registered()
+    scene.render.engine = 'CYCLES'
+    scene.budgetTime = 10.0
+    scene.budgetPilotSamples = 4
+    renderQueue = [{'camera': "Small", 'frameStart': 1, 'frameEnd': 10},
+                   {'camera': "Large", 'frameStart': 1, 'frameEnd': 10}]
+    budgets = {'Small': dict.fromkeys(("resolution", "samples", "simplify", "denoise")),
+               'Large': dict.fromkeys(("resolution", "samples", "simplify", "denoise"))}
+    budgets['Small']['resolution'] = 50
+    assert addon.RenderBudget.timed(scene)
+    jobs = addon.RenderBudget.pilot_jobs(scene, renderQueue, budgets)
+    assert [job['camera'] for job in jobs] == ["Large", "Large"]
+    assert [job['pilot'] for job in jobs] == [4, 8]
+    assert [job['budget']['samples'] for job in jobs] == [4, 8]
+    assert all(job['frameStart'] == job['frameEnd'] for job in jobs)
+
+
+def test_large_amounts_need_a_virtual_rig(scene):
+    cli.ensure_registered()
+    base_camera = scene.camera
+    base_camera.mesh_sphere_cameras_amount = 500
+    assert base_camera.mesh_sphere_cameras_amount == 100
+    base_camera.virtual_rig = True
+    base_camera.mesh_sphere_cameras_amount = 500
+    assert base_camera.mesh_sphere_cameras_amount == 500
+    # turning the virtual rig off brings the amount back into the limit of child cameras
+    base_camera.virtual_rig = False
+    assert base_camera.mesh_sphere_cameras_amount == 100
@@ -0,0 +1,19 @@
+import numpy as np
+
+from multicam_render import contact_sheet
+
+
+def test_assemble_grid():
+    tiles = [None if i == 2 else np.full((10, 20, 4), i / 4.0, dtype=np.float32) for i in range(5)]
+    sheet = contact_sheet.assemble(tiles, ["Y0_X" + str(i) for i in range(5)], columns=3, gap=2)
+    # rows of tile, label and gaps
+    assert sheet.shape == (2 * (10 + 7 + 4) + 2, 3 * (20 + 2) + 2, 4)
+    np.testing.assert_array_equal(sheet[2:12, 24:44], 0.25)
+    # missing tiles stay background
+    np.testing.assert_array_equal(sheet[2:12, 46:66], np.tile((0.1, 0.1, 0.1, 1.0), (10, 20, 1)).astype(np.float32))
+
+
+def test_text_mask():
+    assert contact_sheet.text_mask("ab", scale=2).shape == (14, 24)
+    assert contact_sheet.text_mask("").shape == (7, 0)
+    assert contact_sheet.grid_columns(16, 100, 100) == 4
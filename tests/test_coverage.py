@@ -0,0 +1,29 @@
+import numpy as np
+
+from multicam_render import coverage
+
+
+def test_facing():
+    # faces of a unit cube seen from +X
+    normals = np.array([(1, 0, 0), (-1, 0, 0), (0, 1, 0)], dtype=float)
+    centers = normals * 0.5
+    np.testing.assert_array_equal(coverage.facing([(5.0, 0.0, 0.0)], centers, normals), [[True, False, False]])
+
+
+def test_greedy_cover():
+    visible = np.array([[1, 1, 0, 0],
+                        [0, 1, 1, 0],
+                        [0, 0, 1, 1],
+                        [1, 0, 0, 0]], dtype=bool)
+    weights = np.array([1.0, 1.0, 1.0, 1.0])
+    chosen, seen = coverage.greedy_cover(visible, weights, 1.0)
+    assert chosen == [0, 2] and seen == 1.0
+    chosen, seen = coverage.greedy_cover(visible, weights, 0.5)
+    assert chosen == [0] and seen == 0.5
+
+
+def test_greedy_cover_unreachable():
+    visible = np.array([[1, 0, 0]], dtype=bool)
+    chosen, seen = coverage.greedy_cover(visible, [1.0, 1.0, 2.0], 1.0)
+    assert chosen == [0] and seen == 0.25
+    assert coverage.greedy_cover(visible, [0.0, 0.0, 0.0], 1.0) == ([], 0.0)
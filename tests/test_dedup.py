@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+
+from multicam_render import dedup
+
+
+def test_digest_ignores_float_noise():
+    matrix = np.eye(4)
+    assert dedup.digest(matrix, b"scene") == dedup.digest(matrix + 1e-9, b"scene")
+    assert dedup.digest(np.array([0.0])) == dedup.digest(np.array([-0.0]))
+    assert dedup.digest(matrix) != dedup.digest(matrix * 2)
+    assert dedup.digest(matrix, b"a") != dedup.digest(matrix, b"b")
+
+
+def test_duplicate_frames():
+    digests = [(1, b"a"), (2, b"a"), (3, b"b"), (4, b"a"), (5, b"b"), (6, b"c")]
+    assert dedup.duplicate_frames(digests) == {2: 1, 4: 1, 5: 3}
+
+
+def test_materialize(tmp_path):
+    source = str(tmp_path / "Camera_L" / "0001.png")
+    os.makedirs(os.path.dirname(source))
+    with open(source, "wb") as file:
+        file.write(b"image")
+
+    linked = str(tmp_path / "Camera_L" / "0002.png")
+    mode = dedup.materialize(source, linked, 'LINK')
+    if mode == 'LINK':
+        assert os.path.samefile(source, linked)
+
+    copied = str(tmp_path / "Camera_R" / "0002.png")
+    assert dedup.materialize(source, copied, 'COPY') == 'COPY'
+    assert not os.path.samefile(source, copied)
+    with open(copied, "rb") as file:
+        assert file.read() == b"image"
+
+    # an existing target is replaced
+    assert dedup.materialize(source, copied, 'COPY') == 'COPY'
+    assert sorted(os.listdir(str(tmp_path / "Camera_R"))) == ["0002.png"]
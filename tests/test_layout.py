@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from multicam_render import layout
+
+
+def world_matrices(locations, rotations):
+    matrices = np.tile(np.eye(4), (len(locations), 1, 1))
+    matrices[:, :3, :3] = layout.euler_to_matrix(rotations)
+    matrices[:, :3, 3] = locations
+    return matrices
+
+
+def test_euler_round_trip():
+    rng = np.random.default_rng(1)
+    # Y stays within +-90 degrees, where XYZ angles are unique
+    rotations = rng.uniform((-np.pi, -1.5, -np.pi), (np.pi, 1.5, np.pi), size=(200, 3))
+    matrices = layout.euler_to_matrix(rotations)
+    np.testing.assert_allclose(layout.matrix_to_euler(matrices), rotations, atol=1e-9)
+    np.testing.assert_allclose(matrices @ matrices.transpose(0, 2, 1), np.tile(np.eye(3), (200, 1, 1)), atol=1e-12)
+
+
+def test_euler_matches_single_axis_rotation():
+    matrix = layout.euler_to_matrix((0.0, 0.0, np.pi / 2))[0]
+    np.testing.assert_allclose(matrix @ (1.0, 0.0, 0.0), (0.0, 1.0, 0.0), atol=1e-12)
+
+
+@pytest.mark.parametrize("locations", [
+    layout.fibonacci_sphere(50) * 4.0 + (1.0, 2.0, 3.0),
+    # straight above and below the target
+    np.array([(1.0, 2.0, 10.0), (1.0, 2.0, -5.0)]),
+])
+def test_look_at_points_minus_z_at_target(locations):
+    target = np.array((1.0, 2.0, 3.0))
+    matrices = layout.euler_to_matrix(layout.look_at(locations, target))
+    directions = (target - locations) / np.linalg.norm(target - locations, axis=1, keepdims=True)
+    np.testing.assert_allclose(-matrices[:, :, 2], directions, atol=1e-9)
+
+
+def test_look_at_keeps_y_up():
+    matrices = layout.euler_to_matrix(layout.look_at([(5.0, 0.0, 1.0), (0.0, -3.0, 2.0)], (0.0, 0.0, 0.0)))
+    # camera right axis stays horizontal, up axis points upwards
+    np.testing.assert_allclose(matrices[:, 2, 0], 0.0, atol=1e-12)
+    assert (matrices[:, 2, 1] > 0).all()
+
+
+def test_orbit_and_sphere_radius():
+    target = (0.5, -1.0, 2.0)
+    orbit = layout.orbit(12, 3.0, rotation_offset=15.0, tilt_x=20.0, tilt_y=-10.0, target=target)
+    sphere = layout.sphere(100, 7.0, target=target)
+    assert len(orbit) == 12 and len(set(orbit.suffixes)) == 12
+    assert len(sphere) == 100 and len(set(sphere.suffixes)) == 100
+    np.testing.assert_allclose(np.linalg.norm(orbit.locations - target, axis=1), 3.0)
+    np.testing.assert_allclose(np.linalg.norm(sphere.locations - target, axis=1), 7.0)
+
+
+def test_matrix_layout():
+    rig = layout.matrix(3, 2, 100, 200)
+    assert rig.suffixes[:4] == ['_Y0_X0', '_Y0_X1', '_Y0_X2', '_Y1_X0']
+    np.testing.assert_allclose(rig.locations[5], (2.0, 2.0, 0.0))
+
+
+def test_stereo_convergence():
+    parallel = layout.stereo(20, 200, False)
+    convergent = layout.stereo(20, 200, True)
+    np.testing.assert_allclose(parallel.locations[:, 0], (-0.1, 0.1))
+    np.testing.assert_allclose(parallel.rotations, 0.0)
+    # both axes cross the base camera axis at the same distance
+    assert convergent.rotations[0, 1] == pytest.approx(-convergent.rotations[1, 1])
+    assert convergent.rotations[1, 1] > 0
+
+
+@pytest.mark.parametrize("amount", [6, 20])
+@pytest.mark.parametrize("shift", [(0.0, 0.0), (0.1, -0.05)])
+def test_frame_points_keeps_points_in_frame(amount, shift):
+    rng = np.random.default_rng(2)
+    points = rng.uniform(-1.0, 1.0, size=(300, 3)) * (2.0, 1.0, 0.5)
+    tan_x, tan_y = layout.frustum_tangents(0.8, 'AUTO', 16 / 9)
+    rotations = layout.optimal(30.0, amount).rotations
+    locations = layout.frame_points(rotations, points, tan_x, tan_y, *shift, clip_start=0.1)
+
+    projected = layout.project_points(world_matrices(locations, rotations), points, tan_x, tan_y, *shift)
+    assert (projected[..., 2] >= 0.1 - 1e-9).all()
+    assert projected[..., :2].min() >= -1e-9
+    assert projected[..., :2].max() <= 1 + 1e-9
+    # the fit is tight: each frame is touched along one of its axes
+    spans = projected[..., :2].max(axis=1) - projected[..., :2].min(axis=1)
+    np.testing.assert_allclose(spans.max(axis=1), 1.0, atol=1e-6)
+
+
+def test_frustum_tangents_sensor_fit():
+    tan_x, tan_y = layout.frustum_tangents(np.pi / 2, 'HORIZONTAL', 2.0)
+    assert (tan_x, tan_y) == pytest.approx((1.0, 0.5))
+    tan_x, tan_y = layout.frustum_tangents(np.pi / 2, 'AUTO', 0.5)
+    assert (tan_x, tan_y) == pytest.approx((0.5, 1.0))
+
+
+def test_screen_bounds():
+    projected = np.array([[(0.2, 0.3, 1.0), (0.6, 0.5, 2.0)],
+                          [(0.2, 0.3, 1.0), (0.6, 0.5, -1.0)],
+                          [(1.5, 1.5, 1.0), (2.0, 2.0, 1.0)]])
+    bounds = layout.screen_bounds(projected, padding=0.1)
+    np.testing.assert_allclose(bounds[0], (0.1, 0.2, 0.7, 0.6))
+    # behind the camera or out of frame keep the full frame
+    np.testing.assert_allclose(bounds[1:], [(0.0, 0.0, 1.0, 1.0)] * 2)
@@ -0,0 +1,75 @@
+import json
+import os
+
+from multicam_render import manifest
+
+
+def write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+    return path
+
+
+def job(directory, camera, frames, **keys):
+    files = {str(frame): [os.path.join(directory, camera, "%04d.png" % frame)] for frame in frames}
+    return dict({'camera': camera, 'frameStart': frames[0], 'frameEnd': frames[-1], 'files': files}, **keys)
+
+
+def test_frame_ranges():
+    assert manifest.frame_ranges([1, 2, 3, 5, 6, 9]) == [(1, 3), (5, 6), (9, 9)]
+    assert manifest.frame_ranges([1, 3, 5, 9, 11], step=2) == [(1, 5), (9, 11)]
+    assert manifest.frame_ranges([]) == []
+
+
+def test_pending_jobs_narrows_to_missing_frames(tmp_path):
+    directory = str(tmp_path)
+    jobs = [job(directory, "Camera_L", [1, 3, 5, 7, 9], views=None), job(directory, "Camera_R", [1, 3])]
+    recorded = {}
+    for frame in (1, 3, 9):
+        recorded[write(jobs[0]['files'][str(frame)][0], 10)] = 10
+    # written, but truncated after it was journaled
+    recorded[write(jobs[0]['files']['5'][0], 4)] = 10
+    for frame in (1, 3):
+        recorded[write(jobs[1]['files'][str(frame)][0], 10)] = 10
+
+    pending = manifest.pending_jobs(jobs, recorded, frame_step=2)
+    assert pending == [{'camera': "Camera_L", 'frameStart': 5, 'frameEnd': 7, 'views': None}]
+
+
+def test_pending_jobs_single_output(tmp_path):
+    jobs = [job(str(tmp_path), "Camera_L", [1, 2, 3], single_output=True)]
+    pending = manifest.pending_jobs(jobs, {})
+    assert pending == [{'camera': "Camera_L", 'frameStart': 1, 'frameEnd': 3}]
+
+
+def test_resume_from_journal(tmp_path):
+    directory = str(tmp_path)
+    jobs = [job(directory, "Camera_L", [1, 2, 3, 4])]
+    first = manifest.Manifest(directory)
+    first.create(jobs, {'scene': "Scene"})
+    first.open_journal()
+    first.record([write(jobs[0]['files'][str(frame)][0], 8) for frame in (1, 2)])
+    # a journal line cut short by a crash is ignored
+    first.journal.write('{"files": {"' + directory)
+    first.close()
+
+    resumed = manifest.Manifest(directory)
+    assert resumed.load()['jobs'][0]['camera'] == "Camera_L"
+    pending = manifest.pending_jobs(resumed.load()['jobs'], resumed.recorded_files())
+    assert [(item['frameStart'], item['frameEnd']) for item in pending] == [(3, 4)]
+
+    # resuming keeps the journals, a new run starts over
+    resumed.create(jobs, {}, keep_journals=True)
+    assert len(resumed.recorded_files()) == 2
+    resumed.create(jobs, {})
+    assert resumed.recorded_files() == {}
+
+
+def test_write_atomic(tmp_path):
+    path = str(tmp_path / "file.json")
+    manifest.write_atomic(path, json.dumps({'a': 1}))
+    manifest.write_atomic(path, json.dumps({'a': 2}))
+    with open(path) as file:
+        assert json.load(file) == {'a': 2}
+    assert os.listdir(str(tmp_path)) == ["file.json"]
@@ -0,0 +1,36 @@
+import numpy as np
+
+from multicam_render import layout, ordering
+
+
+def test_serpentine_alternates_rows():
+    positions = layout.matrix(3, 2, 100, 100).locations
+    assert ordering.serpentine(positions) == [0, 1, 2, 5, 4, 3]
+
+
+def test_nearest_neighbour_visits_every_camera_once():
+    positions = layout.sphere(40, 2.0).locations
+    order = ordering.nearest_neighbour(positions)
+    assert sorted(order) == list(range(40))
+    assert ordering.nearest_neighbour(np.zeros((0, 3))) == []
+
+
+def test_camera_order_default():
+    assert ordering.camera_order('DEFAULT', np.zeros((3, 3))) == [0, 1, 2]
+
+
+def test_plan_jobs_frame_by_frame_with_step():
+    jobs = ordering.plan_jobs(['A', 'B'], 1, 6, frame_step=2, frame_by_frame=True)
+    assert [(job['camera'], job['frameStart'], job['frameEnd']) for job in jobs] == [
+        ('A', 1, 1), ('B', 1, 1), ('A', 3, 3), ('B', 3, 3), ('A', 5, 5), ('B', 5, 5)]
+
+
+def test_plan_jobs_frame_blocks_alternate():
+    jobs = ordering.plan_jobs(['A', 'B'], 1, 9, frame_step=2, frame_block=2, alternate=True)
+    assert [(job['camera'], job['frameStart'], job['frameEnd']) for job in jobs] == [
+        ('A', 1, 3), ('B', 1, 3), ('B', 5, 7), ('A', 5, 7), ('A', 9, 9), ('B', 9, 9)]
+
+
+def test_plan_jobs_whole_range():
+    jobs = ordering.plan_jobs(['A', 'B'], 10, 20)
+    assert [(job['frameStart'], job['frameEnd']) for job in jobs] == [(10, 20), (10, 20)]
@@ -0,0 +1,37 @@
+import pytest
+
+from multicam_render import pool
+
+
+def rendered_frames(jobs, frame_step):
+    # frames blender renders for each job, stepping from its start frame
+    return [frame for job in jobs for frame in range(job['frameStart'], job['frameEnd'] + 1, frame_step)]
+
+
+@pytest.mark.parametrize("start, end, step, chunk_size", [
+    (1, 9, 1, 3), (1, 10, 2, 2), (1, 10, 2, 3), (3, 40, 3, 4), (5, 5, 2, 3), (1, 20, 7, 1)])
+def test_split_jobs_renders_the_same_frames(start, end, step, chunk_size):
+    job = {'camera': "Camera_L", 'frameStart': start, 'frameEnd': end, 'rig': "Camera"}
+    chunks = pool.split_jobs([job], chunk_size, step)
+    assert rendered_frames(chunks, step) == list(range(start, end + 1, step))
+    assert all(len(range(chunk['frameStart'], chunk['frameEnd'] + 1, step)) <= chunk_size for chunk in chunks)
+    # other keys are kept
+    assert all(chunk['camera'] == "Camera_L" and chunk['rig'] == "Camera" for chunk in chunks)
+
+
+def test_split_jobs_step_chunks():
+    chunks = pool.split_jobs([{'camera': "A", 'frameStart': 1, 'frameEnd': 10}], 2, 2)
+    assert [(chunk['frameStart'], chunk['frameEnd']) for chunk in chunks] == [(1, 3), (5, 7), (9, 9)]
+
+
+def test_split_jobs_without_chunks():
+    jobs = [{'camera': "A", 'frameStart': 1, 'frameEnd': 100}]
+    assert pool.split_jobs(jobs, 0) == jobs
+
+
+def test_choose_worker_count():
+    assert pool.choose_worker_count(0, 8) == 8
+    assert pool.choose_worker_count(16, 8) == 8
+    assert pool.choose_worker_count(0, 8, free_memory=10, worker_memory=4) == 2
+    assert pool.choose_worker_count(0, 8, free_memory=1, worker_memory=4) == 1
+    assert pool.threads_per_worker(3, 8) == 2
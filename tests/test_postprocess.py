@@ -0,0 +1,83 @@
+import struct
+import threading
+import zlib
+
+import numpy as np
+import pytest
+
+from multicam_render import postprocess
+
+
+def read_png(path):
+    # decoder of the 8 bit RGBA up filtered PNGs written by write_png
+    with open(path, "rb") as file:
+        data = file.read()
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    chunks = {}
+    position = 8
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        assert struct.unpack(">I", data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = body
+        position += 12 + length
+    width, height = struct.unpack(">II", chunks[b"IHDR"][:8])
+    filtered = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape(height, width * 4 + 1)
+    assert (filtered[:, 0] == 2).all()
+    rows = np.cumsum(filtered[:, 1:], axis=0, dtype=np.uint8)
+    return rows.reshape(height, width, 4)
+
+
+def test_write_png_round_trip(tmp_path):
+    rng = np.random.default_rng(4)
+    image = rng.uniform(-0.1, 1.1, size=(7, 5, 4)).astype(np.float32)
+    path = postprocess.write_png(str(tmp_path / "out" / "image.png"), image)
+    expected = np.clip(np.rint(image * 255), 0, 255).astype(np.uint8)
+    np.testing.assert_array_equal(read_png(path), expected)
+
+
+def test_stereo_composites():
+    left = np.zeros((2, 3, 4), dtype=np.float32)
+    left[..., 0] = 1.0
+    left[..., 3] = 0.5
+    right = np.ones((4, 2, 4), dtype=np.float32) * 0.25
+    sheet = postprocess.side_by_side(left, right)
+    assert sheet.shape == (4, 5, 4)
+    np.testing.assert_array_equal(sheet[:2, :3], left)
+    np.testing.assert_array_equal(sheet[2:, :3], 0.0)
+
+    right = np.full((2, 3, 4), 0.25, dtype=np.float32)
+    image = postprocess.anaglyph(left, right)
+    np.testing.assert_array_equal(image[..., 0], 1.0)
+    np.testing.assert_array_equal(image[..., 1:3], 0.25)
+    np.testing.assert_array_equal(image[..., 3], 0.5)
+    with pytest.raises(ValueError):
+        postprocess.anaglyph(left, right[:1])
+
+
+def test_pipeline_collects_errors():
+    messages = []
+    pipeline = postprocess.Pipeline(workers=2, log=messages.append)
+    release = threading.Event()
+
+    def fail():
+        raise RuntimeError("broken")
+
+    pipeline.submit("slow task", release.wait, 5)
+    pipeline.submit("failing task", fail)
+    assert not pipeline.idle()
+    release.set()
+    errors = pipeline.shutdown(wait=True)
+    assert pipeline.idle()
+    assert pipeline.done == 1
+    assert errors == ["failing task: broken"]
+    assert messages == ["Post-render failing task failed: broken"]
+
+
+@pytest.mark.skipif(postprocess.ffmpeg_path() is None, reason="ffmpeg is not installed")
+def test_convert_and_encode(tmp_path):
+    paths = [postprocess.write_png(str(tmp_path / ("%04d.png" % frame)), np.full((8, 8, 4), frame / 4.0))
+             for frame in range(3)]
+    assert postprocess.convert(paths[0], 'JPEG').endswith("0000.jpg")
+    output = postprocess.encode_video(paths, str(tmp_path / "video" / "Camera.mp4"), 24)
+    assert output.endswith("Camera.mp4")
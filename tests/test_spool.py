@@ -0,0 +1,83 @@
+import os
+
+from multicam_render import spool
+
+
+def jobs(count):
+    return [{'camera': "Camera_" + str(i), 'frameStart': 1, 'frameEnd': 1} for i in range(count)]
+
+
+def age(path, seconds):
+    # move the modification time of a file into the past
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_submit_and_claim_in_order(tmp_path):
+    work = spool.Spool(str(tmp_path), worker="a")
+    job_ids = work.submit(jobs(3))
+    assert work.status() == {spool.PENDING: 3, spool.CLAIMED: 0, spool.DONE: 0, spool.FAILED: 0}
+
+    job_id, queueItem = work.claim()
+    assert job_id == job_ids[0] and queueItem['camera'] == "Camera_0"
+    assert work.complete(job_id)
+    job_id, _ = work.claim()
+    assert work.fail(job_id)
+    assert work.status() == {spool.PENDING: 1, spool.CLAIMED: 0, spool.DONE: 1, spool.FAILED: 1}
+
+
+def test_job_is_claimed_once(tmp_path):
+    first = spool.Spool(str(tmp_path), worker="a")
+    second = spool.Spool(str(tmp_path), worker="b")
+    first.submit(jobs(1))
+    assert first.claim() is not None
+    assert second.claim() is None
+    assert second.status()[spool.CLAIMED] == 1
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    first = spool.Spool(str(tmp_path), worker="a", lease=60)
+    second = spool.Spool(str(tmp_path), worker="b", lease=60)
+    first.submit(jobs(1))
+    job_id, _ = first.claim()
+
+    # a renewed claim stays with its worker
+    assert first.renew(job_id)
+    assert second.requeue_expired() == 0
+
+    age(first.claim_path(job_id), 120)
+    assert second.requeue_expired() == 1
+    assert second.claim()[0] == job_id
+    # the first worker lost the job, it can neither renew nor finish it
+    assert not first.renew(job_id)
+    assert not first.complete(job_id)
+    assert second.complete(job_id)
+    assert second.status()[spool.DONE] == 1
+
+
+def test_lease_renews_while_rendering(tmp_path):
+    work = spool.Spool(str(tmp_path), worker="a", lease=0.3)
+    work.submit(jobs(1))
+    job_id, _ = work.claim()
+    age(work.claim_path(job_id), 10)
+    with spool.Lease(work, job_id) as lease:
+        lease.stopped.wait(0.25)
+    assert not lease.lost
+    assert work.now() - os.stat(work.claim_path(job_id)).st_mtime < 1
+
+
+def test_run_worker(tmp_path):
+    work = spool.Spool(str(tmp_path), worker="a", lease=5)
+    work.submit(jobs(5))
+    rendered = []
+
+    def render(queueItem):
+        rendered.append(queueItem['camera'])
+        if queueItem['camera'] == "Camera_3":
+            raise RuntimeError("render failed")
+        return queueItem['camera'] != "Camera_1"
+
+    done, failed = spool.run_worker(work, render, poll_interval=0.01, log=lambda message: None)
+    assert (done, failed) == (3, 2)
+    assert rendered == ["Camera_" + str(i) for i in range(5)]
+    assert work.status() == {spool.PENDING: 0, spool.CLAIMED: 0, spool.DONE: 3, spool.FAILED: 2}
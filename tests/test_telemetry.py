@@ -0,0 +1,36 @@
+import csv
+import json
+
+from multicam_render import telemetry
+
+
+def test_format_duration():
+    assert telemetry.format_duration(0) == "0:00:00"
+    assert telemetry.format_duration(3725.4) == "1:02:05"
+
+
+def test_throughput():
+    throughput = telemetry.Throughput(10, window=3)
+    assert throughput.eta is None
+    started = throughput.finished[0]
+    for i in range(1, 5):
+        throughput.job_done(started + 6 * i)
+    # the last 3 jobs took 18 seconds
+    assert throughput.jobs_per_minute == 10.0
+    assert throughput.eta == 36.0
+
+
+def test_writers(tmp_path):
+    record = {'camera': "Camera_L", 'frameStart': 1, 'frameEnd': 2, 'views': ["_L", "_R"], 'wall_time': 1.5}
+    for output_format in telemetry.FORMATS:
+        writer = telemetry.TelemetryWriter(str(tmp_path), output_format)
+        writer.write(record)
+        writer.close()
+
+    with open(str(tmp_path / "multicam_telemetry.jsonl")) as file:
+        lines = [json.loads(line) for line in file]
+    assert lines[0]['views'] == ["_L", "_R"] and lines[0]['peak_memory'] is None
+    with open(str(tmp_path / "multicam_telemetry.csv")) as file:
+        rows = list(csv.DictReader(file))
+    assert rows[0]['views'] == "_L _R" and rows[0]['wall_time'] == "1.5"
+